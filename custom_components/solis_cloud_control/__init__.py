@@ -1,18 +1,37 @@
 import logging
 
-from homeassistant.const import CONF_API_KEY, CONF_API_TOKEN, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import aiohttp_client
+from homeassistant.const import CONF_API_KEY, CONF_API_TOKEN, EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import device_registry as dr
-
-from custom_components.solis_cloud_control.api.solis_api import SolisCloudControlApiClient
-from custom_components.solis_cloud_control.const import API_BASE_URL, CONF_INVERTER_SN
+from homeassistant.util.hass_dict import HassKey
+
+from custom_components.solis_cloud_control.api.solis_api import SolisCloudControlApiClient, SolisCloudControlApiError
+from custom_components.solis_cloud_control.api.solis_api_connection_pool import SolisCloudControlConnectionPool
+from custom_components.solis_cloud_control.const import (
+    API_BASE_URL,
+    API_REQUESTS_BURST,
+    API_REQUESTS_PER_SECOND,
+    CONF_INVERTER_SN,
+    DOMAIN,
+)
 from custom_components.solis_cloud_control.coordinator import SolisCloudControlCoordinator
 from custom_components.solis_cloud_control.data import SolisCloudControlConfigEntry, SolisCloudControlData
+from custom_components.solis_cloud_control.inverters.inverter import InverterInfo
 from custom_components.solis_cloud_control.inverters.inverter_factory import create_inverter, create_inverter_info
+from custom_components.solis_cloud_control.store import InverterInfoCache, SolisCloudControlStore
+from custom_components.solis_cloud_control.utils.circuit_breaker import CircuitBreaker
+from custom_components.solis_cloud_control.utils.hedging_policy import HedgingPolicy
+from custom_components.solis_cloud_control.utils.polling_scheduler import PollingScheduler
+from custom_components.solis_cloud_control.utils.rate_limiter import RateLimiter
 
 _LOGGER = logging.getLogger(__name__)
 
+_RATE_LIMITERS: HassKey[dict[str, RateLimiter]] = HassKey(f"{DOMAIN}_rate_limiters")
+_INVERTER_INFO_CACHE: HassKey[InverterInfoCache] = HassKey(f"{DOMAIN}_inverter_info_cache")
+_POLLING_SCHEDULERS: HassKey[dict[str, PollingScheduler]] = HassKey(f"{DOMAIN}_polling_schedulers")
+_CONNECTION_POOLS: HassKey[dict[str, SolisCloudControlConnectionPool]] = HassKey(f"{DOMAIN}_connection_pools")
+_CIRCUIT_BREAKERS: HassKey[dict[tuple[str, str], CircuitBreaker]] = HassKey(f"{DOMAIN}_circuit_breakers")
+
 _PLATFORMS: list[Platform] = [
     Platform.DATETIME,
     Platform.NUMBER,
@@ -29,10 +48,22 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: SolisCloudControl
     inverter_sn = config_entry.data[CONF_INVERTER_SN]
 
     # create api client
+    creates_connection_pool = API_BASE_URL not in hass.data.get(_CONNECTION_POOLS, {})
     api_client = _create_api_client(hass, api_key, api_token)
-
-    # create inverter
-    inverter_info = await create_inverter_info(api_client, inverter_sn)
+    if creates_connection_pool:
+        # once per shared pool, in the background so that the setup doesn't wait for the cloud
+        config_entry.async_create_background_task(
+            hass, api_client.async_warm_up(), f"{DOMAIN} {inverter_sn} warm up connection"
+        )
+
+    # create inverter, from the cached inverter info when available
+    inverter_info_cache = _get_inverter_info_cache(hass)
+    cached_inverter_info = await inverter_info_cache.async_get(inverter_sn)
+    if cached_inverter_info is not None:
+        inverter_info = cached_inverter_info.inverter_info
+    else:
+        inverter_info = await create_inverter_info(api_client, inverter_sn)
+        await inverter_info_cache.async_set(inverter_info)
     inverter = create_inverter(inverter_info)
 
     # register the inverter in the device registry
@@ -49,13 +80,36 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: SolisCloudControl
     )
 
     # create coordinator
-    coordinator = SolisCloudControlCoordinator(hass, config_entry, api_client, inverter)
+    store = SolisCloudControlStore(hass, config_entry.entry_id)
+    coordinator = SolisCloudControlCoordinator(
+        hass,
+        config_entry,
+        api_client,
+        inverter,
+        store=store,
+        polling_scheduler=_get_polling_scheduler(hass, api_key),
+    )
 
-    # perform an initial data load from api
-    await coordinator.async_config_entry_first_refresh()
+    # the snapshot of the last run lets the entities show up without waiting for the API
+    snapshot = await store.async_load()
+    if snapshot is not None:
+        coordinator.restore(snapshot.data, snapshot.updated_at)
+        config_entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} {inverter_sn} refresh restored data"
+        )
+    else:
+        # perform an initial data load from api
+        await coordinator.async_config_entry_first_refresh()
+
+    if cached_inverter_info is not None and cached_inverter_info.needs_revalidation:
+        config_entry.async_create_background_task(
+            hass,
+            _async_revalidate_inverter_info(hass, config_entry, api_client, inverter_info),
+            f"{DOMAIN} {inverter_sn} revalidate inverter info",
+        )
 
     # make coordinator available to integration
-    config_entry.runtime_data = SolisCloudControlData(inverter, coordinator)
+    config_entry.runtime_data = SolisCloudControlData(inverter, coordinator, _get_connection_pool(hass, API_BASE_URL))
 
     # setup platforms, call async_setup for each entity
     await hass.config_entries.async_forward_entry_setups(config_entry, _PLATFORMS)
@@ -64,7 +118,15 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: SolisCloudControl
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: SolisCloudControlConfigEntry) -> bool:
-    return await hass.config_entries.async_unload_platforms(config_entry, _PLATFORMS)
+    unloaded = await hass.config_entries.async_unload_platforms(config_entry, _PLATFORMS)
+    if unloaded:
+        await _async_release_connection_pool(hass, config_entry)
+    return unloaded
+
+
+async def async_remove_entry(hass: HomeAssistant, config_entry: SolisCloudControlConfigEntry) -> None:
+    await SolisCloudControlStore(hass, config_entry.entry_id).async_remove()
+    await _get_inverter_info_cache(hass).async_invalidate(config_entry.data[CONF_INVERTER_SN])
 
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: SolisCloudControlConfigEntry) -> bool:
@@ -91,5 +153,96 @@ async def async_remove_config_entry_device(
 
 
 def _create_api_client(hass: HomeAssistant, api_key: str, api_token: str) -> SolisCloudControlApiClient:
-    session = aiohttp_client.async_get_clientsession(hass)
-    return SolisCloudControlApiClient(API_BASE_URL, api_key, api_token, session)
+    session = _get_connection_pool(hass, API_BASE_URL).session
+    rate_limiter = _get_rate_limiter(hass, api_key)
+    circuit_breaker = _get_circuit_breaker(hass, API_BASE_URL, api_key)
+    return SolisCloudControlApiClient(
+        API_BASE_URL,
+        api_key,
+        api_token,
+        session,
+        rate_limiter=rate_limiter,
+        circuit_breaker=circuit_breaker,
+        hedging_policy=HedgingPolicy(),
+    )
+
+
+async def _async_revalidate_inverter_info(
+    hass: HomeAssistant,
+    config_entry: SolisCloudControlConfigEntry,
+    api_client: SolisCloudControlApiClient,
+    inverter_info: InverterInfo,
+) -> None:
+    try:
+        current_inverter_info = await create_inverter_info(api_client, inverter_info.serial_number, inverter_info)
+    except SolisCloudControlApiError as error:
+        _LOGGER.warning("Failed to revalidate inverter info, keeping the cached one: %s", error)
+        return
+
+    await _get_inverter_info_cache(hass).async_set(current_inverter_info)
+
+    if current_inverter_info != inverter_info:
+        # the entities depend on the inverter info, so they have to be created again
+        _LOGGER.info("Inverter info of '%s' changed, reloading", inverter_info.serial_number)
+        hass.config_entries.async_schedule_reload(config_entry.entry_id)
+
+
+def _get_inverter_info_cache(hass: HomeAssistant) -> InverterInfoCache:
+    # keyed by serial number, shared by all config entries
+    if _INVERTER_INFO_CACHE not in hass.data:
+        hass.data[_INVERTER_INFO_CACHE] = InverterInfoCache(hass)
+    return hass.data[_INVERTER_INFO_CACHE]
+
+
+def _get_connection_pool(hass: HomeAssistant, base_url: str) -> SolisCloudControlConnectionPool:
+    # own connections to the API host, kept alive between polls instead of competing in the pool of all integrations
+    connection_pools = hass.data.setdefault(_CONNECTION_POOLS, {})
+    if base_url not in connection_pools:
+        connection_pool = SolisCloudControlConnectionPool()
+        connection_pools[base_url] = connection_pool
+
+        async def _async_close_connection_pool(_event: Event) -> None:
+            await connection_pool.async_close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_connection_pool)
+    return connection_pools[base_url]
+
+
+async def _async_release_connection_pool(hass: HomeAssistant, config_entry: SolisCloudControlConfigEntry) -> None:
+    # the pool is shared, it is closed with the last entry using it
+    connection_pool = config_entry.runtime_data.connection_pool
+    if connection_pool is None or any(
+        entry.runtime_data.connection_pool is connection_pool
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+        if entry.entry_id != config_entry.entry_id
+    ):
+        return
+
+    connection_pools = hass.data.get(_CONNECTION_POOLS, {})
+    for base_url in [base_url for base_url, pool in connection_pools.items() if pool is connection_pool]:
+        del connection_pools[base_url]
+    await connection_pool.async_close()
+
+
+def _get_polling_scheduler(hass: HomeAssistant, api_key: str) -> PollingScheduler:
+    # inverters of the same account are polled in turns, instead of all at once
+    polling_schedulers = hass.data.setdefault(_POLLING_SCHEDULERS, {})
+    if api_key not in polling_schedulers:
+        polling_schedulers[api_key] = PollingScheduler(hass)
+    return polling_schedulers[api_key]
+
+
+def _get_rate_limiter(hass: HomeAssistant, api_key: str) -> RateLimiter:
+    # SolisCloud throttles per API key, so all config entries sharing a key must share a single limiter
+    rate_limiters = hass.data.setdefault(_RATE_LIMITERS, {})
+    if api_key not in rate_limiters:
+        rate_limiters[api_key] = RateLimiter(API_REQUESTS_PER_SECOND, API_REQUESTS_BURST)
+    return rate_limiters[api_key]
+
+
+def _get_circuit_breaker(hass: HomeAssistant, base_url: str, api_key: str) -> CircuitBreaker:
+    # an outage seen by one inverter applies to all the others of the same account
+    circuit_breakers = hass.data.setdefault(_CIRCUIT_BREAKERS, {})
+    if (base_url, api_key) not in circuit_breakers:
+        circuit_breakers[(base_url, api_key)] = CircuitBreaker()
+    return circuit_breakers[(base_url, api_key)]
@@ -1,17 +1,34 @@
 import asyncio
+import itertools
 import json
 import logging
+import time
+from collections.abc import Callable, Coroutine, Sequence
+from datetime import UTC
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import aiohttp
 
+from custom_components.solis_cloud_control.api.solis_api_metrics import SolisCloudControlApiMetrics
 from custom_components.solis_cloud_control.api.solis_api_utils import (
     current_date,
     digest,
     format_date,
     sign_authorization,
 )
-from custom_components.solis_cloud_control.utils.retry_policy import RetryPolicy
+from custom_components.solis_cloud_control.const import API_REQUESTS_BURST, API_REQUESTS_PER_SECOND
+from custom_components.solis_cloud_control.utils.circuit_breaker import CircuitBreaker
+from custom_components.solis_cloud_control.utils.hedging_policy import HedgingPolicy
+from custom_components.solis_cloud_control.utils.rate_limiter import RateLimiter, RequestPriority
+from custom_components.solis_cloud_control.utils.retry_policy import (
+    Deadline,
+    ErrorClassification,
+    OperationClosure,
+    RetryDecision,
+    RetryJitter,
+    RetryPolicy,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,9 +39,11 @@ class SolisCloudControlApiError(Exception):
         message: str,
         status_code: int | None = None,
         response_code: str | None = None,
+        retry_after_seconds: float | None = None,
     ) -> None:
         self.status_code = status_code
         self.response_code = response_code
+        self.retry_after_seconds = retry_after_seconds
         final_message = message
         if status_code is not None:
             final_message = f"{final_message} (HTTP status code: {status_code})"
@@ -34,6 +53,82 @@ class SolisCloudControlApiError(Exception):
         super().__init__(final_message)
 
 
+class SolisCloudControlApiTimeoutError(SolisCloudControlApiError):
+    pass
+
+
+class SolisCloudControlApiCircuitOpenError(SolisCloudControlApiError):
+    pass
+
+
+class SolisCloudControlApiDeadlineExceededError(SolisCloudControlApiError):
+    pass
+
+
+class SolisCloudControlApiControlRejectedError(SolisCloudControlApiError):
+    pass
+
+
+class SolisCloudControlApiPartialReadError(SolisCloudControlApiError):
+    def __init__(self, message: str, result: dict[int, str]) -> None:
+        self.result = result
+        super().__init__(message)
+
+
+# invalid credentials and unsupported data logger, retrying won't change the answer
+_NON_RETRYABLE_RESPONSE_CODES = frozenset({"Z0001", "B0115"})
+# an open circuit and a control refused by the inverter, retrying won't change the answer either
+_NON_RETRYABLE_ERROR_TYPES = (SolisCloudControlApiCircuitOpenError, SolisCloudControlApiControlRejectedError)
+_THROTTLED_STATUS_CODES = frozenset({429, 503})
+
+
+def classify_api_error(error: Exception) -> ErrorClassification:
+    if not isinstance(error, SolisCloudControlApiError):
+        return ErrorClassification(RetryDecision.RETRYABLE)
+
+    # a partial read carries no codes of its own, it is retried the way its failed chunks would be
+    if isinstance(error, SolisCloudControlApiPartialReadError) and isinstance(error.__cause__, Exception):
+        return classify_api_error(error.__cause__)
+
+    # fail fast, the circuit breaker decides when the API is tried again
+    if isinstance(error, _NON_RETRYABLE_ERROR_TYPES) or error.response_code in _NON_RETRYABLE_RESPONSE_CODES:
+        return ErrorClassification(RetryDecision.NON_RETRYABLE)
+
+    # no time left for another attempt
+    if isinstance(error, SolisCloudControlApiDeadlineExceededError):
+        return ErrorClassification(RetryDecision.NON_RETRYABLE)
+
+    if error.status_code in _THROTTLED_STATUS_CODES:
+        return ErrorClassification(RetryDecision.THROTTLED, error.retry_after_seconds)
+
+    # other client errors are rejected the same way on every attempt, request timeouts excluded
+    if error.status_code is not None and 400 <= error.status_code < 500 and error.status_code != 408:
+        return ErrorClassification(RetryDecision.NON_RETRYABLE)
+
+    return ErrorClassification(RetryDecision.RETRYABLE)
+
+
+def _is_outage_error(error: SolisCloudControlApiError) -> bool:
+    # timeouts, connection errors and server errors, the API answering with an error code is still up
+    if isinstance(error, SolisCloudControlApiTimeoutError):
+        return True
+    if error.status_code is not None:
+        return error.status_code >= 500
+    return error.response_code is None
+
+
+def _error_code(error: SolisCloudControlApiError) -> str:
+    if error.response_code is not None:
+        return str(error.response_code)
+    if error.status_code is not None:
+        return f"http_{error.status_code}"
+    if isinstance(error, SolisCloudControlApiDeadlineExceededError):
+        return "deadline_exceeded"
+    if isinstance(error, SolisCloudControlApiTimeoutError):
+        return "timeout"
+    return "connection_error"
+
+
 class SolisCloudControlApiClient:
     _READ_ENDPOINT = "/v2/api/atRead"
     _READ_BATCH_ENDPOINT = "/v2/api/atReadBatch"
@@ -41,10 +136,14 @@ class SolisCloudControlApiClient:
     _INVERTER_LIST_ENDPOINT = "/v1/api/inverterList"
     _INVERTER_DETAILS_ENDPOINT = "/v1/api/inverterDetail"
     _TIMEOUT_SECONDS = 30
-    _CONCURRENT_REQUESTS = 1
     _MAX_RETRY_TIME_SECONDS = 30
+    _READ_BATCH_CHUNK_SIZE = 32
 
-    _RETRY_POLICY = RetryPolicy(retryable_exception=SolisCloudControlApiError)
+    _RETRY_POLICY = RetryPolicy(
+        retryable_exception=SolisCloudControlApiError,
+        classify_error=classify_api_error,
+        jitter=RetryJitter.FULL,
+    )
 
     def __init__(
         self,
@@ -54,7 +153,11 @@ class SolisCloudControlApiClient:
         session: aiohttp.ClientSession,
         timeout: int = _TIMEOUT_SECONDS,
         retry_policy: RetryPolicy = _RETRY_POLICY,
-        concurrent_requests: int = _CONCURRENT_REQUESTS,
+        rate_limiter: RateLimiter | None = None,
+        read_batch_chunk_size: int = _READ_BATCH_CHUNK_SIZE,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging_policy: HedgingPolicy | None = None,
+        metrics: SolisCloudControlApiMetrics | None = None,
     ) -> None:
         self._base_url = base_url
         self._api_key = api_key
@@ -62,12 +165,33 @@ class SolisCloudControlApiClient:
         self._session = session
         self._timeout = timeout
         self._retry_policy = retry_policy
-        self._request_semaphore = asyncio.Semaphore(concurrent_requests)
-
-    async def read(self, inverter_sn: str, cid: int, max_retry_time: float = _MAX_RETRY_TIME_SECONDS) -> str:
-        async def read_operation() -> str:
+        self._rate_limiter = rate_limiter or RateLimiter(API_REQUESTS_PER_SECOND, API_REQUESTS_BURST)
+        self._read_batch_chunk_size = read_batch_chunk_size
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._hedging_policy = hedging_policy
+        self._metrics = metrics or SolisCloudControlApiMetrics()
+        self._request_ids = itertools.count(1)
+        self._in_flight_reads: dict[tuple[str, frozenset[int], RequestPriority], asyncio.Task[dict[int, str]]] = {}
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self._circuit_breaker
+
+    @property
+    def metrics(self) -> SolisCloudControlApiMetrics:
+        return self._metrics
+
+    async def read(
+        self,
+        inverter_sn: str,
+        cid: int,
+        max_retry_time: float = _MAX_RETRY_TIME_SECONDS,
+        priority: RequestPriority = RequestPriority.READ_BACK,
+        deadline: Deadline | None = None,
+    ) -> str:
+        async def read_operation() -> dict[int, str]:
             payload = {"inverterSn": inverter_sn, "cid": cid}
-            data = await self._execute_request(self._READ_ENDPOINT, payload)
+            data = await self._execute_hedged_request(self._READ_ENDPOINT, payload, inverter_sn, priority, deadline)
 
             if data is None:
                 raise SolisCloudControlApiError("Read failed: missing 'data' field")
@@ -75,43 +199,102 @@ class SolisCloudControlApiClient:
             if "msg" not in data:
                 raise SolisCloudControlApiError("Read failed: missing 'msg' field")
 
-            return data["msg"]
+            return {cid: data["msg"]}
+
+        result = await self._single_flight_read(
+            inverter_sn,
+            [cid],
+            priority,
+            deadline,
+            lambda: self._retry(self._READ_ENDPOINT, read_operation, max_retry_time, deadline),
+        )
 
-        return await self._retry_policy(read_operation, max_retry_time)
+        if cid not in result:
+            raise SolisCloudControlApiError("Read failed: missing 'msg' field")
+
+        return result[cid]
 
     async def read_batch(
         self,
         inverter_sn: str,
-        cids: list[int],
+        cids: Sequence[int],
         max_retry_time: float = _MAX_RETRY_TIME_SECONDS,
+        priority: RequestPriority = RequestPriority.READ_BACK,
+        deadline: Deadline | None = None,
     ) -> dict[int, str]:
+        result: dict[int, str] = {}
+        # bisected for this call only, a few timeouts in the tail must not shrink every later poll
+        chunk_size = self._read_batch_chunk_size
+        pending_chunks = _split_into_chunks(cids, chunk_size)
+
         async def read_batch_operation() -> dict[int, str]:
-            payload = {"inverterSn": inverter_sn, "cids": ",".join(map(str, cids))}
+            nonlocal pending_chunks, chunk_size
+
+            chunk_results = await asyncio.gather(
+                *(self._read_batch_chunk(inverter_sn, chunk, priority, deadline) for chunk in pending_chunks),
+                return_exceptions=True,
+            )
+
+            # keep the chunks which succeeded, next attempt re-sends only the failed ones
+            failed_cids: list[int] = []
+            errors: list[SolisCloudControlApiError] = []
+            for chunk, chunk_result in zip(pending_chunks, chunk_results, strict=True):
+                if isinstance(chunk_result, SolisCloudControlApiError):
+                    if isinstance(chunk_result, SolisCloudControlApiTimeoutError):
+                        chunk_size = _reduce_chunk_size(chunk_size, len(chunk))
+                    failed_cids.extend(chunk)
+                    errors.append(chunk_result)
+                elif isinstance(chunk_result, BaseException):
+                    raise chunk_result
+                else:
+                    result.update(chunk_result)
+
+            pending_chunks = _split_into_chunks(failed_cids, chunk_size)
+
+            if errors and result:
+                raise SolisCloudControlApiPartialReadError(
+                    f"ReadBatch failed for {len(failed_cids)} CIDs: {errors[0]}", dict(result)
+                ) from errors[0]
+            elif errors:
+                raise errors[0]
 
-            data = await self._execute_request(self._READ_BATCH_ENDPOINT, payload)
+            return result
 
-            if data is None:
-                raise SolisCloudControlApiError("ReadBatch failed: missing 'data' field")
+        return await self._single_flight_read(
+            inverter_sn,
+            cids,
+            priority,
+            deadline,
+            lambda: self._retry(self._READ_BATCH_ENDPOINT, read_batch_operation, max_retry_time, deadline),
+        )
+
+    async def _read_batch_chunk(
+        self, inverter_sn: str, cids: Sequence[int], priority: RequestPriority, deadline: Deadline | None
+    ) -> dict[int, str]:
+        payload = {"inverterSn": inverter_sn, "cids": ",".join(map(str, cids))}
 
-            if not isinstance(data, list):
-                raise SolisCloudControlApiError("ReadBatch failed: 'data' field is not an array")
+        data = await self._execute_hedged_request(self._READ_BATCH_ENDPOINT, payload, inverter_sn, priority, deadline)
 
-            result = {}
-            for outer_item in data:
-                if not isinstance(outer_item, list):
-                    raise SolisCloudControlApiError("ReadBatch failed: 'data' field element is not an array")
+        if data is None:
+            raise SolisCloudControlApiError("ReadBatch failed: missing 'data' field")
 
-                for item in outer_item:
-                    if "msg" not in item:
-                        raise SolisCloudControlApiError("ReadBatch failed: missing 'msg' field")
-                    if "cid" not in item:
-                        raise SolisCloudControlApiError("ReadBatch failed: missing 'cid' field")
+        if not isinstance(data, list):
+            raise SolisCloudControlApiError("ReadBatch failed: 'data' field is not an array")
 
-                    result[int(item["cid"])] = item["msg"]
+        result = {}
+        for outer_item in data:
+            if not isinstance(outer_item, list):
+                raise SolisCloudControlApiError("ReadBatch failed: 'data' field element is not an array")
 
-            return result
+            for item in outer_item:
+                if "msg" not in item:
+                    raise SolisCloudControlApiError("ReadBatch failed: missing 'msg' field")
+                if "cid" not in item:
+                    raise SolisCloudControlApiError("ReadBatch failed: missing 'cid' field")
+
+                result[int(item["cid"])] = item["msg"]
 
-        return await self._retry_policy(read_batch_operation, max_retry_time)
+        return result
 
     async def control(
         self,
@@ -120,13 +303,16 @@ class SolisCloudControlApiClient:
         value: str,
         old_value: str | None = None,
         max_retry_time: float = _MAX_RETRY_TIME_SECONDS,
+        deadline: Deadline | None = None,
     ) -> None:
         async def control_operation() -> None:
             payload = {"inverterSn": inverter_sn, "cid": cid, "value": value}
             if old_value is not None:
                 payload["yuanzhi"] = old_value
 
-            data_array = await self._execute_request(self._CONTROL_ENDPOINT, payload)
+            data_array = await self._execute_request(
+                self._CONTROL_ENDPOINT, payload, inverter_sn, RequestPriority.CONTROL, deadline
+            )
 
             if data_array is None:
                 raise SolisCloudControlApiError("Control failed: missing 'data' field")
@@ -139,19 +325,22 @@ class SolisCloudControlApiClient:
 
                 if code is not None and str(code) != "0":
                     error_msg = data.get("msg", "Unknown error")
-                    raise SolisCloudControlApiError(f"Control failed: {error_msg}", response_code=str(code))
+                    raise SolisCloudControlApiControlRejectedError(
+                        f"Control failed: {error_msg}", response_code=str(code)
+                    )
 
             return
 
-        return await self._retry_policy(control_operation, max_retry_time)
+        return await self._retry(self._CONTROL_ENDPOINT, control_operation, max_retry_time, deadline)
 
     async def inverter_list(
         self,
         max_retry_time: float = _MAX_RETRY_TIME_SECONDS,
+        deadline: Deadline | None = None,
     ) -> list[dict]:
         async def inverter_list_operation() -> list[dict]:
             payload = {"pageSize": "100"}
-            data = await self._execute_request(self._INVERTER_LIST_ENDPOINT, payload)
+            data = await self._execute_request(self._INVERTER_LIST_ENDPOINT, payload, deadline=deadline)
 
             if data is None:
                 raise SolisCloudControlApiError("InverterList failed: missing 'data' field")
@@ -164,26 +353,236 @@ class SolisCloudControlApiClient:
 
             return data["page"]["records"]
 
-        return await self._retry_policy(inverter_list_operation, max_retry_time)
+        return await self._retry(self._INVERTER_LIST_ENDPOINT, inverter_list_operation, max_retry_time, deadline)
 
     async def inverter_details(
         self,
         inverter_sn: str,
         max_retry_time: float = _MAX_RETRY_TIME_SECONDS,
+        deadline: Deadline | None = None,
     ) -> dict:
         async def inverter_details_operation() -> dict:
             payload = {"sn": inverter_sn}
-            data = await self._execute_request(self._INVERTER_DETAILS_ENDPOINT, payload)
+            data = await self._execute_request(self._INVERTER_DETAILS_ENDPOINT, payload, inverter_sn, deadline=deadline)
 
             if data is None:
                 raise SolisCloudControlApiError("InverterDetails failed: missing 'data' field")
 
             return data
 
-        return await self._retry_policy(inverter_details_operation, max_retry_time)
+        return await self._retry(self._INVERTER_DETAILS_ENDPOINT, inverter_details_operation, max_retry_time, deadline)
 
-    async def _execute_request(self, endpoint: str, payload: dict | None = None) -> Any:  # noqa: ANN401
-        body = json.dumps(payload)
+    async def _retry(
+        self,
+        endpoint: str,
+        operation: OperationClosure,
+        max_retry_time: float,
+        deadline: Deadline | None,
+    ) -> Any:  # noqa: ANN401
+        result = await self._retry_policy.run(operation, max_retry_time, deadline)
+        self._metrics.record_retries(endpoint, result.attempts - 1)
+
+        if result.error is not None:
+            raise result.error
+        return result.value
+
+    async def _single_flight_read(
+        self,
+        inverter_sn: str,
+        cids: Sequence[int],
+        priority: RequestPriority,
+        deadline: Deadline | None,
+        read_operation: Callable[[], Coroutine[Any, Any, dict[int, str]]],
+    ) -> dict[int, str]:
+        # share a single in-flight read between callers, the first caller's retry time applies;
+        # joining a lower priority read would queue the caller behind it, with its longer retry time
+        requested_cids = frozenset(cids)
+
+        read_task = next(
+            (
+                in_flight_read
+                for (in_flight_sn, in_flight_cids, in_flight_priority), in_flight_read in self._in_flight_reads.items()
+                if in_flight_sn == inverter_sn and requested_cids <= in_flight_cids and in_flight_priority <= priority
+            ),
+            None,
+        )
+
+        # a joined read runs to the deadline of its first caller, this caller's own deadline still applies
+        wait_timeout = None
+        if read_task is None:
+            key = (inverter_sn, requested_cids, priority)
+            read_task = asyncio.get_running_loop().create_task(read_operation())
+            self._in_flight_reads[key] = read_task
+            read_task.add_done_callback(lambda task: self._complete_read(key, task))
+        else:
+            _LOGGER.debug("Joining in-flight read of inverter '%s' for CIDs: %s", inverter_sn, cids)
+            wait_timeout = deadline.remaining_seconds if deadline is not None else None
+
+        # shield the shared read, a cancelled or timed out caller must not cancel it for the others
+        try:
+            async with asyncio.timeout(wait_timeout):
+                result = await asyncio.shield(read_task)
+        except TimeoutError as err:
+            raise SolisCloudControlApiDeadlineExceededError(
+                f"Deadline exceeded waiting for the read of inverter '{inverter_sn}'"
+            ) from err
+        except SolisCloudControlApiPartialReadError as err:
+            # a joined read of fewer CIDs may have got all of them from a partly failed batch
+            if not requested_cids <= err.result.keys():
+                raise
+            result = err.result
+
+        return {cid: result[cid] for cid in requested_cids if cid in result}
+
+    async def async_warm_up(self) -> None:
+        # open the connection ahead of the first request, so it doesn't pay for the TLS handshake
+        try:
+            async with asyncio.timeout(self._timeout):
+                async with self._session.head(self._base_url) as response:
+                    await response.read()
+        except (TimeoutError, aiohttp.ClientError) as err:
+            _LOGGER.debug("Warming up the connection to %s failed: %s", self._base_url, err)
+
+    async def async_cancel(self) -> None:
+        # in-flight reads are shared and shielded from their callers, they would otherwise keep retrying
+        read_tasks = list(self._in_flight_reads.values())
+        for read_task in read_tasks:
+            read_task.cancel()
+        await asyncio.gather(*read_tasks, return_exceptions=True)
+
+    def _complete_read(
+        self, key: tuple[str, frozenset[int], RequestPriority], task: asyncio.Task[dict[int, str]]
+    ) -> None:
+        self._in_flight_reads.pop(key, None)
+        # mark the error as retrieved, all callers may have been cancelled in the meantime
+        if not task.cancelled():
+            task.exception()
+
+    async def _execute_hedged_request(
+        self,
+        endpoint: str,
+        payload: dict,
+        queue_key: str,
+        priority: RequestPriority,
+        deadline: Deadline | None,
+    ) -> Any:  # noqa: ANN401
+        # reads are idempotent, a second request sent when the first one is slow cuts the latency tail
+        if self._hedging_policy is None:
+            return await self._execute_request(endpoint, payload, queue_key, priority, deadline)
+
+        hedging_policy = self._hedging_policy
+        loop = asyncio.get_running_loop()
+        # timed from sending, the time queued on the rate limiter tells nothing about the response latency
+        sent = asyncio.Event()
+        sent_at: float | None = None
+
+        def on_sent() -> None:
+            nonlocal sent_at
+            sent_at = time.monotonic()
+            sent.set()
+
+        primary = loop.create_task(
+            self._execute_request(endpoint, payload, queue_key, priority, deadline, on_sent=on_sent)
+        )
+        pending = {primary}
+
+        try:
+            hedge_delay = hedging_policy.delay_seconds(endpoint)
+            if hedge_delay is not None:
+                sent_waiter = loop.create_task(sent.wait())
+                await asyncio.wait({primary, sent_waiter}, return_when=asyncio.FIRST_COMPLETED)
+                sent_waiter.cancel()
+
+                # a primary done within the delay stays pending, the loop below takes its result
+                done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+
+                # the hedge only takes a spare token, it must not delay the other requests
+                if not done and self._rate_limiter.try_acquire():
+                    _LOGGER.debug(
+                        "No response to '%s' request after %.1fs, sending a hedged request", endpoint, hedge_delay
+                    )
+                    pending.add(
+                        loop.create_task(
+                            self._execute_request(endpoint, payload, queue_key, priority, deadline, rate_limited=False)
+                        )
+                    )
+
+            errors: dict[asyncio.Task[Any], BaseException] = {}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                errors |= {task: error for task in done if (error := task.exception()) is not None}
+                if succeeded := done - errors.keys():
+                    return succeeded.pop().result()
+
+            # the primary fails too when nothing succeeded, its error decides about retrying
+            raise errors[primary]
+        finally:
+            # a primary still running tells about the latency tail, its elapsed time is a lower bound
+            if sent_at is not None and (not primary.done() or primary.exception() is None):
+                hedging_policy.record_latency(endpoint, time.monotonic() - sent_at)
+            for task in pending:
+                task.cancel()
+
+    async def _execute_request(
+        self,
+        endpoint: str,
+        payload: dict | None = None,
+        queue_key: str = "",
+        priority: RequestPriority = RequestPriority.READ_BACK,
+        deadline: Deadline | None = None,
+        rate_limited: bool = True,
+        on_sent: Callable[[], None] | None = None,
+    ) -> Any:  # noqa: ANN401
+        if deadline is not None and deadline.expired:
+            raise SolisCloudControlApiDeadlineExceededError(f"Deadline exceeded, not sending '{endpoint}' request")
+
+        if not self._circuit_breaker.try_acquire():
+            raise SolisCloudControlApiCircuitOpenError(f"SolisCloud API unavailable, not sending '{endpoint}' request")
+
+        try:
+            data = await self._send_request(endpoint, payload, queue_key, priority, deadline, rate_limited, on_sent)
+        except SolisCloudControlApiDeadlineExceededError:
+            # running out of time tells nothing about the API
+            self._circuit_breaker.release()
+            raise
+        except SolisCloudControlApiError as error:
+            if _is_outage_error(error):
+                self._circuit_breaker.record_failure()
+            else:
+                self._circuit_breaker.record_success()
+            raise
+        except BaseException:
+            self._circuit_breaker.release()
+            raise
+
+        self._circuit_breaker.record_success()
+        return data
+
+    async def _send_request(
+        self,
+        endpoint: str,
+        payload: dict | None,
+        queue_key: str,
+        priority: RequestPriority,
+        deadline: Deadline | None,
+        rate_limited: bool = True,
+        on_sent: Callable[[], None] | None = None,
+    ) -> Any:  # noqa: ANN401
+        # wait before signing, the request date must not get stale while queued
+        try:
+            async with asyncio.timeout(deadline.remaining_seconds if deadline is not None else None):
+                if rate_limited:
+                    await self._rate_limiter.acquire(queue_key, priority)
+        except TimeoutError as err:
+            raise SolisCloudControlApiDeadlineExceededError(
+                f"Deadline exceeded while waiting to send '{endpoint}' request"
+            ) from err
+
+        if on_sent is not None:
+            on_sent()
+
+        # serialized once, the signed bytes are the sent bytes
+        body = json.dumps(payload).encode("utf-8")
 
         payload_digest = digest(body)
         content_type = "application/json"
@@ -204,29 +603,113 @@ class SolisCloudControlApiClient:
             "Authorization": authorization,
         }
 
-        url = f"{self._base_url}{endpoint}"
-
-        _LOGGER.debug("API request '%s': %s", endpoint, json.dumps(payload, indent=2))
+        request_id = next(self._request_ids)
 
-        try:
-            async with asyncio.timeout(self._timeout):
-                async with self._request_semaphore:
-                    async with self._session.post(url, headers=headers, json=payload) as response:
-                        if response.status != 200:
-                            error_text = await response.text()
-                            raise SolisCloudControlApiError(error_text, status_code=response.status)
+        _LOGGER.debug("API request #%d '%s' (%d bytes): %s", request_id, endpoint, len(body), _PrettyJson(payload))
 
-                        response_json = await response.json()
+        # the attempt must not outlive the deadline of the whole operation
+        timeout = deadline.cap(self._timeout) if deadline is not None else self._timeout
 
-                        _LOGGER.debug("API response: %s", json.dumps(response_json, indent=2))
+        started_at = time.monotonic()
+        try:
+            data = await self._post(endpoint, headers, body, timeout, request_id)
+        except SolisCloudControlApiError as error:
+            duration = time.monotonic() - started_at
+            _LOGGER.debug("API request #%d '%s' failed after %.3fs: %s", request_id, endpoint, duration, error)
+            self._metrics.record_request(endpoint, duration, _error_code(error), bytes_sent=len(body))
+            raise
 
-                        code = response_json.get("code", "Unknown code")
-                        if str(code) != "0":
-                            error_msg = response_json.get("msg", "Unknown error")
-                            raise SolisCloudControlApiError(f"API operation failed: {error_msg}", response_code=code)
+        self._metrics.record_request(endpoint, time.monotonic() - started_at, bytes_sent=len(body))
+        return data
 
-                        return response_json.get("data")
+    async def _post(
+        self,
+        endpoint: str,
+        headers: dict[str, str],
+        body: bytes,
+        timeout: float,
+        request_id: int,
+    ) -> Any:  # noqa: ANN401
+        url = f"{self._base_url}{endpoint}"
+        started_at = time.monotonic()
+        try:
+            async with asyncio.timeout(timeout):
+                async with self._session.post(url, headers=headers, data=body) as response:
+                    # text() and json() decode the body read here, it is not read twice
+                    response_body = await response.read()
+                    self._metrics.record_bytes_received(endpoint, len(response_body))
+
+                    if response.status != 200:
+                        error_text = await response.text()
+                        raise SolisCloudControlApiError(
+                            error_text,
+                            status_code=response.status,
+                            retry_after_seconds=_parse_retry_after(response.headers.get("Retry-After")),
+                        )
+
+                    response_json = await response.json()
+
+                    _LOGGER.debug(
+                        "API response #%d in %.3fs (%d bytes): %s",
+                        request_id,
+                        time.monotonic() - started_at,
+                        len(response_body),
+                        _PrettyJson(response_json),
+                    )
+
+                    code = response_json.get("code", "Unknown code")
+                    if str(code) != "0":
+                        error_msg = response_json.get("msg", "Unknown error")
+                        raise SolisCloudControlApiError(f"API operation failed: {error_msg}", response_code=code)
+
+                    return response_json.get("data")
         except TimeoutError as err:
-            raise SolisCloudControlApiError(f"Timeout accessing {url}") from err
+            if timeout < self._timeout:
+                raise SolisCloudControlApiDeadlineExceededError(f"Deadline exceeded accessing {url}") from err
+            raise SolisCloudControlApiTimeoutError(f"Timeout accessing {url}") from err
         except aiohttp.ClientError as err:
             raise SolisCloudControlApiError(f"Error accessing {url}: {str(err)}") from err
+
+
+class _PrettyJson:
+    # formatted only when the log record is emitted, pretty printing costs nothing with debug logging off
+    def __init__(self, value: Any) -> None:  # noqa: ANN401
+        self._value = value
+
+    def __str__(self) -> str:
+        return json.dumps(self._value, indent=2)
+
+
+def _split_into_chunks(cids: Sequence[int], chunk_size: int) -> list[Sequence[int]]:
+    return [cids[i : i + chunk_size] for i in range(0, len(cids), chunk_size)]
+
+
+def _reduce_chunk_size(chunk_size: int, timed_out_chunk_size: int) -> int:
+    # bisect the batch size on timeouts, until the cloud answers within the timeout
+    reduced_chunk_size = max(1, min(chunk_size, timed_out_chunk_size // 2))
+    if reduced_chunk_size < chunk_size:
+        _LOGGER.debug(
+            "ReadBatch of %d CIDs timed out, reducing batch size to %d", timed_out_chunk_size, reduced_chunk_size
+        )
+    return reduced_chunk_size
+
+
+def _parse_retry_after(retry_after: str | None) -> float | None:
+    # either delay seconds or an HTTP date
+    if retry_after is None:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+
+    return max(0.0, (retry_at - current_date()).total_seconds())
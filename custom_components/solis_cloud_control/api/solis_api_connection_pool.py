@@ -0,0 +1,120 @@
+import asyncio
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import aiohttp
+from homeassistant.util import ssl as ssl_util
+
+# the rate limiter allows a couple of requests in flight per account, plus the hedged ones
+_CONNECTION_LIMIT = 8
+# longer than the slowest polling interval, so that a poll finds its connection still open
+_KEEPALIVE_TIMEOUT_SECONDS = 20 * 60
+_DNS_CACHE_TTL_SECONDS = 10 * 60
+
+
+@dataclass(frozen=True)
+class ConnectionPoolMetrics:
+    connection_limit: int
+    connections_created: int
+    connections_reused: int
+    connections_queued: int
+    connection_setup_seconds: float
+    dns_cache_hits: int
+    dns_cache_misses: int
+
+
+class SolisCloudControlConnectionPool:
+    def __init__(self) -> None:
+        self._connections_created = 0
+        self._connections_reused = 0
+        self._connections_queued = 0
+        self._connection_setup_seconds = 0.0
+        self._dns_cache_hits = 0
+        self._dns_cache_misses = 0
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_start.append(self._on_connection_create_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace_config.on_connection_queued_start.append(self._on_connection_queued_start)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+
+        self._connector = aiohttp.TCPConnector(
+            limit=_CONNECTION_LIMIT,
+            limit_per_host=_CONNECTION_LIMIT,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT_SECONDS,
+            use_dns_cache=True,
+            ttl_dns_cache=_DNS_CACHE_TTL_SECONDS,
+            ssl=ssl_util.client_context(),
+        )
+        self._session = aiohttp.ClientSession(connector=self._connector, trace_configs=[trace_config])
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self._session
+
+    @property
+    def metrics(self) -> ConnectionPoolMetrics:
+        return ConnectionPoolMetrics(
+            connection_limit=self._connector.limit,
+            connections_created=self._connections_created,
+            connections_reused=self._connections_reused,
+            connections_queued=self._connections_queued,
+            connection_setup_seconds=self._connection_setup_seconds,
+            dns_cache_hits=self._dns_cache_hits,
+            dns_cache_misses=self._dns_cache_misses,
+        )
+
+    async def async_close(self) -> None:
+        await self._session.close()
+
+    async def _on_connection_create_start(
+        self,
+        session: aiohttp.ClientSession,  # noqa: ARG002
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateStartParams,  # noqa: ARG002
+    ) -> None:
+        context.connection_started_at = asyncio.get_running_loop().time()
+
+    async def _on_connection_create_end(
+        self,
+        session: aiohttp.ClientSession,  # noqa: ARG002
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateEndParams,  # noqa: ARG002
+    ) -> None:
+        # includes the TCP and TLS handshakes, the cost a kept alive connection saves
+        self._connections_created += 1
+        self._connection_setup_seconds += asyncio.get_running_loop().time() - context.connection_started_at
+
+    async def _on_connection_reuseconn(
+        self,
+        session: aiohttp.ClientSession,  # noqa: ARG002
+        context: SimpleNamespace,  # noqa: ARG002
+        params: aiohttp.TraceConnectionReuseconnParams,  # noqa: ARG002
+    ) -> None:
+        self._connections_reused += 1
+
+    async def _on_connection_queued_start(
+        self,
+        session: aiohttp.ClientSession,  # noqa: ARG002
+        context: SimpleNamespace,  # noqa: ARG002
+        params: aiohttp.TraceConnectionQueuedStartParams,  # noqa: ARG002
+    ) -> None:
+        self._connections_queued += 1
+
+    async def _on_dns_cache_hit(
+        self,
+        session: aiohttp.ClientSession,  # noqa: ARG002
+        context: SimpleNamespace,  # noqa: ARG002
+        params: aiohttp.TraceDnsCacheHitParams,  # noqa: ARG002
+    ) -> None:
+        self._dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(
+        self,
+        session: aiohttp.ClientSession,  # noqa: ARG002
+        context: SimpleNamespace,  # noqa: ARG002
+        params: aiohttp.TraceDnsCacheMissParams,  # noqa: ARG002
+    ) -> None:
+        self._dns_cache_misses += 1
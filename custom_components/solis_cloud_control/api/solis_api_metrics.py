@@ -0,0 +1,99 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from custom_components.solis_cloud_control.utils.latency_histogram import LatencyHistogram
+
+_REPORTED_PERCENTILES = (50, 90, 95, 99)
+
+
+@dataclass(frozen=True)
+class SolisCloudControlApiTotals:
+    request_count: int
+    retry_count: int
+    error_count: int
+    bytes_sent: int
+    bytes_received: int
+
+
+class SolisCloudControlEndpointMetrics:
+    def __init__(self) -> None:
+        self.request_count = 0
+        self.retry_count = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.error_counts: Counter[str] = Counter()
+        self.latency = LatencyHistogram()
+
+    @property
+    def error_count(self) -> int:
+        return self.error_counts.total()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "request_count": self.request_count,
+            "error_count": self.error_count,
+            "error_counts": dict(self.error_counts),
+            "retry_count": self.retry_count,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency_mean_seconds": self.latency.mean_seconds,
+            "latency_max_seconds": self.latency.max_seconds,
+            **{
+                f"latency_p{percentile}_seconds": self.latency.percentile(percentile)
+                for percentile in _REPORTED_PERCENTILES
+            },
+        }
+
+
+class SolisCloudControlApiMetrics:
+    def __init__(self) -> None:
+        self._endpoints: dict[str, SolisCloudControlEndpointMetrics] = {}
+
+    def endpoint(self, endpoint: str) -> SolisCloudControlEndpointMetrics:
+        name = _endpoint_name(endpoint)
+        if name not in self._endpoints:
+            self._endpoints[name] = SolisCloudControlEndpointMetrics()
+        return self._endpoints[name]
+
+    def get(self, endpoint: str) -> SolisCloudControlEndpointMetrics | None:
+        # for readers, an endpoint without requests is not added
+        return self._endpoints.get(_endpoint_name(endpoint))
+
+    def record_request(
+        self,
+        endpoint: str,
+        latency_seconds: float,
+        error_code: str | None = None,
+        bytes_sent: int = 0,
+    ) -> None:
+        endpoint_metrics = self.endpoint(endpoint)
+        endpoint_metrics.request_count += 1
+        endpoint_metrics.bytes_sent += bytes_sent
+        endpoint_metrics.latency.record(latency_seconds)
+        if error_code is not None:
+            endpoint_metrics.error_counts[error_code] += 1
+
+    def record_bytes_received(self, endpoint: str, bytes_received: int) -> None:
+        self.endpoint(endpoint).bytes_received += bytes_received
+
+    def record_retries(self, endpoint: str, retry_count: int) -> None:
+        self.endpoint(endpoint).retry_count += retry_count
+
+    def totals(self) -> SolisCloudControlApiTotals:
+        endpoints = self._endpoints.values()
+        return SolisCloudControlApiTotals(
+            request_count=sum(endpoint_metrics.request_count for endpoint_metrics in endpoints),
+            retry_count=sum(endpoint_metrics.retry_count for endpoint_metrics in endpoints),
+            error_count=sum(endpoint_metrics.error_count for endpoint_metrics in endpoints),
+            bytes_sent=sum(endpoint_metrics.bytes_sent for endpoint_metrics in endpoints),
+            bytes_received=sum(endpoint_metrics.bytes_received for endpoint_metrics in endpoints),
+        )
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        return {name: endpoint_metrics.as_dict() for name, endpoint_metrics in sorted(self._endpoints.items())}
+
+
+def _endpoint_name(endpoint: str) -> str:
+    # keyed by the last path segment, e.g. 'atReadBatch'
+    return endpoint.rsplit("/", 1)[-1]
@@ -4,8 +4,8 @@ import hmac
 from datetime import UTC, datetime
 
 
-def digest(body: str) -> str:
-    return base64.b64encode(hashlib.md5(body.encode("utf-8")).digest()).decode("utf-8")
+def digest(body: bytes) -> str:
+    return base64.b64encode(hashlib.md5(body).digest()).decode("utf-8")
 
 
 def current_date() -> datetime:
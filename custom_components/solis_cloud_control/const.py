@@ -3,3 +3,8 @@ DOMAIN = "solis_cloud_control"
 CONF_INVERTER_SN = "inverter_sn"
 
 API_BASE_URL = "https://www.soliscloud.com:13333"
+# request rate allowed for a single API key
+API_REQUESTS_PER_SECOND = 1.0
+API_REQUESTS_BURST = 2
+
+EVENT_SLOW_UPDATE_CYCLE = f"{DOMAIN}_slow_update_cycle"
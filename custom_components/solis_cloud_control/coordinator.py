@@ -1,30 +1,120 @@
+import asyncio
 import logging
-from datetime import timedelta
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from custom_components.solis_cloud_control.api.solis_api import SolisCloudControlApiClient, SolisCloudControlApiError
-from custom_components.solis_cloud_control.inverters.inverter import Inverter
+from custom_components.solis_cloud_control.api.solis_api import (
+    SolisCloudControlApiCircuitOpenError,
+    SolisCloudControlApiClient,
+    SolisCloudControlApiError,
+    SolisCloudControlApiPartialReadError,
+    classify_api_error,
+)
+from custom_components.solis_cloud_control.api.solis_api_metrics import SolisCloudControlApiMetrics
+from custom_components.solis_cloud_control.const import EVENT_SLOW_UPDATE_CYCLE
+from custom_components.solis_cloud_control.cycle_trace import CycleTrace, CycleTracer
+from custom_components.solis_cloud_control.domain.charge_discharge_settings import ChargeDischargeSettings
+from custom_components.solis_cloud_control.domain.storage_mode import StorageMode
+from custom_components.solis_cloud_control.inverters.inverter import (
+    Inverter,
+    InverterChargeDischargeSlots,
+    ReadBackMatch,
+    RefreshTier,
+)
+from custom_components.solis_cloud_control.store import SolisCloudControlSnapshot, SolisCloudControlStore
+from custom_components.solis_cloud_control.utils.adaptive_polling_interval import AdaptivePollingInterval
+from custom_components.solis_cloud_control.utils.circuit_breaker import CircuitState
+from custom_components.solis_cloud_control.utils.polling_scheduler import PollingScheduler
+from custom_components.solis_cloud_control.utils.rate_limiter import RequestPriority
+from custom_components.solis_cloud_control.utils.retry_policy import Deadline, RetryJitter, RetryPolicy
 
 _LOGGER = logging.getLogger(__name__)
 
 _COORDINATOR_NAME = "Solis Cloud Control"
 
 _UPDATE_INTERVAL = timedelta(minutes=5)
+_MIN_UPDATE_INTERVAL = timedelta(minutes=1)
+_MAX_UPDATE_INTERVAL = timedelta(minutes=15)
+
+_REFRESH_TIER_INTERVALS = {
+    RefreshTier.FAST: _UPDATE_INTERVAL,
+    RefreshTier.SLOW: timedelta(minutes=30),
+}
+
+# tolerate timer jitter, a tier is due slightly before its interval elapses
+_REFRESH_TIER_TOLERANCE = timedelta(seconds=30)
 
 _REQUEST_REFRESH_COOLDOWN_SECONDS = 10
 
 _UPDATE_BATCH_DATA_MAX_RETRY_TIME_SECONDS = 180
 _UPDATE_DATA_MAX_RETRY_TIME_SECONDS = 60
 
+_MAX_DATA_AGE_INTERVALS = 3
+
+# a value is stale only once strictly older than its max data age
+_AVAILABILITY_EXPIRY_MARGIN = timedelta(seconds=1)
+
+_READ_BACK_MAX_RETRY_TIME_SECONDS = 30
+_READ_BACK_RETRY_POLICY = RetryPolicy(
+    retryable_exception=SolisCloudControlApiError,
+    initial_delay_seconds=2.0,
+    classify_error=classify_api_error,
+    jitter=RetryJitter.DECORRELATED,
+)
+
+_CONTROL_EDIT_WINDOW_SECONDS = 0.5
+
+# a cycle without retries takes a few seconds, one taking a minute is worth a look
+_SLOW_CYCLE_THRESHOLD_SECONDS = 60.0
+
+ValueEdit = Callable[[str | None], str | None]
+
 
 class SolisCloudControlData(dict[int, str | None]):
     pass
 
 
+class SolisCloudControlDataView:
+    # values parsed once per data snapshot and shared by all entities, so they must only be read;
+    # changes start from a fresh StorageMode.create or ChargeDischargeSettings.create
+    def __init__(self, data: Mapping[int, str | None]) -> None:
+        self.data = data
+        self._charge_discharge_settings: dict[int, ChargeDischargeSettings | None] = {}
+        self._storage_modes: dict[int, StorageMode | None] = {}
+        self._slot_switches_value: str | None = None
+
+    def charge_discharge_settings(self, cid: int) -> ChargeDischargeSettings | None:
+        if cid not in self._charge_discharge_settings:
+            self._charge_discharge_settings[cid] = ChargeDischargeSettings.create(self.data.get(cid))
+        return self._charge_discharge_settings[cid]
+
+    def storage_mode(self, cid: int) -> StorageMode | None:
+        if cid not in self._storage_modes:
+            self._storage_modes[cid] = StorageMode.create(self.data.get(cid))
+        return self._storage_modes[cid]
+
+    def slot_switches_value(self, slots: InverterChargeDischargeSlots) -> str:
+        if self._slot_switches_value is None:
+            value = 0
+            for bit_position, switch_cid in zip(slots.switch_bits, slots.switch_cids, strict=True):
+                if self.data.get(switch_cid) == "1":
+                    value |= 1 << bit_position
+
+            self._slot_switches_value = str(value)
+
+        return self._slot_switches_value
+
+
 class SolisCloudControlCoordinator(DataUpdateCoordinator[SolisCloudControlData]):
     def __init__(
         self,
@@ -32,13 +122,21 @@ class SolisCloudControlCoordinator(DataUpdateCoordinator[SolisCloudControlData])
         config_entry: ConfigEntry,
         api_client: SolisCloudControlApiClient,
         inverter: Inverter,
+        read_back_retry_policy: RetryPolicy = _READ_BACK_RETRY_POLICY,
+        control_edit_window_seconds: float = _CONTROL_EDIT_WINDOW_SECONDS,
+        store: SolisCloudControlStore | None = None,
+        polling_scheduler: PollingScheduler | None = None,
+        min_update_interval: timedelta = _MIN_UPDATE_INTERVAL,
+        max_update_interval: timedelta = _MAX_UPDATE_INTERVAL,
+        slow_cycle_threshold_seconds: float = _SLOW_CYCLE_THRESHOLD_SECONDS,
     ) -> None:
         super().__init__(
             hass,
             _LOGGER,
             name=_COORDINATOR_NAME,
             config_entry=config_entry,
-            update_interval=_UPDATE_INTERVAL,
+            # a shared scheduler replaces the own timer, to stagger the polls of all inverters of an account
+            update_interval=None if polling_scheduler is not None else _UPDATE_INTERVAL,
             request_refresh_debouncer=Debouncer(
                 hass,
                 _LOGGER,
@@ -48,28 +146,398 @@ class SolisCloudControlCoordinator(DataUpdateCoordinator[SolisCloudControlData])
         )
         self._api_client = api_client
         self._inverter = inverter
+        self._read_back_retry_policy = read_back_retry_policy
+        self._control_edit_window_seconds = control_edit_window_seconds
+        self._store = store
+        self._restored_cids: set[int] = set()
+        self._data_view: SolisCloudControlDataView | None = None
+        self._cid_listeners: dict[int, dict[CALLBACK_TYPE, None]] = {}
+        self._notified_data: SolisCloudControlData | None = None
+        self._notified_update_success = True
+        self._unrestored_cids: set[int] = set()
+        self._available_cids: frozenset[int] = frozenset()
+        self._available_cids_data: SolisCloudControlData | None = None
+        self._available_cids_expire_at: datetime | None = None
+        self._notified_available_cids: frozenset[int] = frozenset()
+        self._unsub_availability_expiry: CALLBACK_TYPE | None = None
+        self._pending_edits: dict[int, list[ValueEdit]] = {}
+        self._pending_edit_controls: dict[int, asyncio.Task[None]] = {}
+        self._read_back_tasks: dict[int, asyncio.Task[None]] = {}
+        self._control_tasks: set[asyncio.Task[None]] = set()
+        self._refresh_tiers = inverter.refresh_tiers
+        self._updated_at: dict[int, datetime] = {}
+        self._tier_updated_at: dict[RefreshTier, datetime] = {}
+        self._scheduled_refresh: asyncio.Task[None] | None = None
+        self._polling_scheduler = polling_scheduler
+        self._notified_cloud_available = True
+        self._polling_interval = AdaptivePollingInterval(min_update_interval, _UPDATE_INTERVAL, max_update_interval)
+        self._applied_polling_interval = _UPDATE_INTERVAL
+        self._cycle_tracer = CycleTracer(api_client.metrics.totals)
+        self._slow_cycle_threshold_seconds = slow_cycle_threshold_seconds
+
+        config_entry.async_on_unload(api_client.circuit_breaker.add_listener(self._handle_circuit_state))
+
+        if polling_scheduler is not None:
+            config_entry.async_on_unload(
+                polling_scheduler.async_register(self._handle_scheduled_poll, _UPDATE_INTERVAL)
+            )
+
+    @property
+    def polling_interval(self) -> AdaptivePollingInterval:
+        return self._polling_interval
+
+    @property
+    def api_metrics(self) -> SolisCloudControlApiMetrics:
+        return self._api_client.metrics
+
+    @property
+    def cycle_traces(self) -> tuple[CycleTrace, ...]:
+        return self._cycle_tracer.traces
+
+    @property
+    def data_view(self) -> SolisCloudControlDataView:
+        # every update publishes a new data snapshot, the identity check tells when to parse again
+        if self._data_view is None or self._data_view.data is not self.data:
+            self._data_view = SolisCloudControlDataView(self.data or {})
+        return self._data_view
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE, context: Any = None) -> Callable[[], None]:  # noqa: ANN401
+        remove_listener = super().async_add_listener(update_callback, context)
+        if not isinstance(context, frozenset):
+            return remove_listener
+
+        # entities pass the CIDs they depend on as context, see async_update_listeners
+        for cid in context:
+            self._cid_listeners.setdefault(cid, {})[update_callback] = None
+
+        @callback
+        def remove_cid_listener() -> None:
+            remove_listener()
+            for cid in context:
+                self._cid_listeners[cid].pop(update_callback, None)
+
+        return remove_cid_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        # notify only the entities whose CIDs changed, most refreshes don't change anything
+        with self._cycle_tracer.phase("notify"):
+            changed_cids = self._take_changed_cids()
+            self._schedule_availability_expiry()
+            if changed_cids is None:
+                self._cycle_tracer.record_entities_notified(len(self._listeners))
+                super().async_update_listeners()
+                return
+
+            update_callbacks = {
+                update_callback: None
+                for update_callback, context in self._listeners.values()
+                if not isinstance(context, frozenset)
+            }
+            for cid in changed_cids:
+                update_callbacks.update(self._cid_listeners.get(cid, {}))
+
+            self._cycle_tracer.record_entities_notified(len(update_callbacks))
+            for update_callback in list(update_callbacks):
+                update_callback()
+
+    def _take_changed_cids(self) -> set[int] | None:
+        notified_data = self._notified_data
+        notified_update_success = self._notified_update_success
+        notified_cloud_available = self._notified_cloud_available
+        notified_available_cids = self._notified_available_cids
+        self._notified_data = self.data
+        self._notified_update_success = self.last_update_success
+        self._notified_cloud_available = self.cloud_available
+        self._notified_available_cids = self.available_cids
+
+        if (
+            notified_data is None
+            or self.data is None
+            or notified_update_success != self.last_update_success
+            or notified_cloud_available != self.cloud_available
+        ):
+            self._unrestored_cids.clear()
+            return None
+
+        changed_cids = {
+            cid for cid in notified_data.keys() | self.data.keys() if notified_data.get(cid) != self.data.get(cid)
+        }
+        changed_cids |= self._unrestored_cids
+        # values getting too old flip the availability without any change of the data
+        changed_cids |= notified_available_cids ^ self._notified_available_cids
+        self._unrestored_cids.clear()
+        return changed_cids
+
+    def _schedule_availability_expiry(self) -> None:
+        # nothing writes the entity states while polls keep failing, the first stale value must still show up
+        if self._unsub_availability_expiry is not None:
+            self._unsub_availability_expiry()
+            self._unsub_availability_expiry = None
+
+        expire_at = self._available_cids_expire_at
+        if expire_at is not None and self.cloud_available:
+            self._unsub_availability_expiry = async_track_point_in_utc_time(
+                self.hass, self._handle_availability_expiry, expire_at + _AVAILABILITY_EXPIRY_MARGIN
+            )
+
+    @callback
+    def _handle_availability_expiry(self, now: datetime) -> None:  # noqa: ARG002
+        self._unsub_availability_expiry = None
+        self.async_update_listeners()
+
+    @property
+    def cloud_available(self) -> bool:
+        return self._api_client.circuit_breaker.state == CircuitState.CLOSED
+
+    @callback
+    def _handle_circuit_state(self, state: CircuitState) -> None:  # noqa: ARG002
+        # entities become unavailable at once, instead of waiting for a poll to time out
+        self.async_update_listeners()
+
+    @property
+    def available_cids(self) -> frozenset[int]:
+        if not self.cloud_available:
+            return frozenset()
+
+        # CIDs with a fresh value, computed once per data snapshot and kept until the first of them gets stale
+        now = dt_util.utcnow()
+        if (
+            self._available_cids_data is not self.data
+            or self._available_cids_expire_at is not None
+            and now > self._available_cids_expire_at
+        ):
+            self._update_available_cids(now)
+
+        return self._available_cids
+
+    def _update_available_cids(self, now: datetime) -> None:
+        data = self.data or {}
+        available_cids = set()
+        expire_at: datetime | None = None
+
+        for cid, value in data.items():
+            if value is None or cid not in self._updated_at:
+                continue
+
+            fresh_until = self._updated_at[cid] + self._max_data_age(cid)
+            if now > fresh_until:
+                continue
+
+            available_cids.add(cid)
+            if expire_at is None or fresh_until < expire_at:
+                expire_at = fresh_until
+
+        self._available_cids = frozenset(available_cids)
+        self._available_cids_data = self.data
+        self._available_cids_expire_at = expire_at
+
+    @callback
+    def _handle_scheduled_poll(self) -> None:
+        # a cycle retrying against a struggling API may outlast the slot, don't pile up another one
+        if self._scheduled_refresh is not None and not self._scheduled_refresh.done():
+            _LOGGER.debug("Skipping scheduled refresh, the previous one is still running")
+            return
+
+        assert self.config_entry is not None
+        self._scheduled_refresh = self.config_entry.async_create_background_task(
+            self.hass, self.async_refresh(), f"{self.name} scheduled refresh"
+        )
+
+    def is_fresh(self, cid: int) -> bool:
+        updated_at = self._updated_at.get(cid)
+        if updated_at is None:
+            return False
+
+        return dt_util.utcnow() - updated_at <= self._max_data_age(cid)
+
+    def _max_data_age(self, cid: int) -> timedelta:
+        # a tightened interval must not age out data read at the default one
+        tier = self._refresh_tiers.get(cid, RefreshTier.FAST)
+        return max(self._tier_interval(tier), _REFRESH_TIER_INTERVALS[tier]) * _MAX_DATA_AGE_INTERVALS
+
+    def _tier_interval(self, tier: RefreshTier) -> timedelta:
+        # the fast tier is read on every poll, at the adaptive polling interval
+        return self._polling_interval.interval if tier == RefreshTier.FAST else _REFRESH_TIER_INTERVALS[tier]
+
+    def is_restored(self, cid: int) -> bool:
+        return cid in self._restored_cids
+
+    def restore(self, data: dict[int, str | None], updated_at: Mapping[int, datetime]) -> None:
+        # restored values are shown until the API replaces them, within the usual max data age from when they were read
+        self._updated_at |= {cid: updated_at[cid] for cid in data if cid in updated_at}
+
+        self._restored_cids = set(data)
+        self.data = SolisCloudControlData(data)
+
+    async def _async_refresh(
+        self,
+        log_failures: bool = True,
+        raise_on_auth_failed: bool = False,
+        scheduled: bool = False,
+        raise_on_entry_error: bool = False,
+    ) -> None:
+        # traced around the whole refresh, the entities are notified after the data is updated
+        traced = self._cycle_tracer.start()
+        try:
+            await super()._async_refresh(log_failures, raise_on_auth_failed, scheduled, raise_on_entry_error)
+        finally:
+            trace = self._cycle_tracer.finish(failed=not self.last_update_success) if traced else None
+
+        if trace is not None:
+            _LOGGER.debug("Update cycle trace: %s", trace)
+            if trace.duration_seconds > self._slow_cycle_threshold_seconds:
+                self._fire_slow_cycle_event(trace)
+
+    def _fire_slow_cycle_event(self, trace: CycleTrace) -> None:
+        assert self.config_entry is not None
+        self.hass.bus.async_fire(
+            EVENT_SLOW_UPDATE_CYCLE,
+            {
+                "config_entry_id": self.config_entry.entry_id,
+                "threshold_seconds": self._slow_cycle_threshold_seconds,
+                **asdict(trace),
+            },
+        )
 
     async def _async_update_data(self) -> SolisCloudControlData:
+        started_at = time.monotonic()
         inverter_sn = self._inverter.info.serial_number
-        try:
-            results = await self._api_client.read_batch(
-                inverter_sn,
-                self._inverter.read_batch_cids,
-                max_retry_time=_UPDATE_BATCH_DATA_MAX_RETRY_TIME_SECONDS,
-            )
+        # the cycle has to be over before the next one is due, whatever the retry times allow
+        deadline = Deadline(self._applied_polling_interval.total_seconds())
+        results: dict[int, str] = {}
+        errors: list[SolisCloudControlApiError] = []
 
-            for read_cid in self._inverter.read_cids:
-                results[read_cid] = await self._api_client.read(
+        # due tiers are read together, a separate batch per tier would only add API calls
+        due_tiers = self._due_tiers()
+        read_batch_cids = self._inverter.cid_plan.read_batch_cids_for(due_tiers)
+        read_cids = self._inverter.cid_plan.read_cids_for(due_tiers)
+
+        with self._cycle_tracer.phase("read_batch"):
+            try:
+                results |= await self._api_client.read_batch(
                     inverter_sn,
-                    read_cid,
-                    max_retry_time=_UPDATE_DATA_MAX_RETRY_TIME_SECONDS,
+                    read_batch_cids,
+                    max_retry_time=_UPDATE_BATCH_DATA_MAX_RETRY_TIME_SECONDS,
+                    priority=RequestPriority.POLL,
+                    deadline=deadline,
                 )
+            except SolisCloudControlApiPartialReadError as error:
+                results |= error.result
+                errors.append(error)
+            except SolisCloudControlApiError as error:
+                errors.append(error)
+
+        with self._cycle_tracer.phase("read"):
+            for read_cid in read_cids:
+                try:
+                    results[read_cid] = await self._api_client.read(
+                        inverter_sn,
+                        read_cid,
+                        max_retry_time=_UPDATE_DATA_MAX_RETRY_TIME_SECONDS,
+                        priority=RequestPriority.POLL,
+                        deadline=deadline,
+                    )
+                except SolisCloudControlApiError as error:
+                    errors.append(error)
+
+        # a cycle stopped by the open circuit never reached the cloud, backing off would only delay the recovery
+        if not errors or not all(isinstance(error, SolisCloudControlApiCircuitOpenError) for error in errors):
+            self._adapt_polling_interval(time.monotonic() - started_at, failed=bool(errors))
+
+        if errors and not results:
+            raise UpdateFailed(errors[0]) from errors[0]
+
+        if errors:
+            _LOGGER.warning("Partial data read from API, keeping last values of missing CIDs: %s", errors[0])
+
+        with self._cycle_tracer.phase("merge"):
+            now = dt_util.utcnow()
+            for cid in results:
+                self._updated_at[cid] = now
+
+            self._unrestore(results)
+
+            # a tier is refreshed once its CIDs arrive, a failing CID of another tier must not make it due again
+            refresh_tiers = self._inverter.refresh_tiers
+            for tier in due_tiers & {refresh_tiers[cid] for cid in results if cid in refresh_tiers}:
+                self._tier_updated_at[tier] = now
+
+            # CIDs missing in this cycle keep their last good value, until it gets too old
+            previous_data = self.data or {}
+            data = SolisCloudControlData()
+            for cid in self._inverter.all_cids:
+                if cid in results:
+                    data[cid] = results[cid]
+                elif self.is_fresh(cid):
+                    data[cid] = previous_data.get(cid)
+                else:
+                    data[cid] = None
 
-            data = SolisCloudControlData({cid: results.get(cid) for cid in self._inverter.all_cids})
-            _LOGGER.debug("Data read from API: %s", data)
-            return data
-        except SolisCloudControlApiError as error:
-            raise UpdateFailed(error) from error
+            _LOGGER.debug("Data read from API (tiers: %s): %s", sorted(due_tiers), data)
+            self._save_snapshot(data)
+
+        return data
+
+    def _due_tiers(self) -> set[RefreshTier]:
+        # the fast tier is read on every poll, a jittered poll may come well before its interval elapses
+        now = dt_util.utcnow()
+        return {RefreshTier.FAST} | {
+            tier
+            for tier in RefreshTier
+            if tier not in self._tier_updated_at
+            or now - self._tier_updated_at[tier] >= self._tier_interval(tier) - _REFRESH_TIER_TOLERANCE
+        }
+
+    def _adapt_polling_interval(self, latency_seconds: float, failed: bool) -> None:
+        self._set_polling_interval(self._polling_interval.record_cycle(latency_seconds, failed))
+
+    def _set_polling_interval(self, interval: timedelta) -> None:
+        if interval == self._applied_polling_interval:
+            return
+
+        self._applied_polling_interval = interval
+        if self._polling_scheduler is not None:
+            self._polling_scheduler.async_update_interval(self._handle_scheduled_poll, interval)
+        else:
+            self.update_interval = interval
+
+        _LOGGER.debug(
+            "Polling interval set to %s (failure rate: %.2f, latency: %.1fs)",
+            interval,
+            self._polling_interval.failure_rate,
+            self._polling_interval.latency_seconds,
+        )
+
+    async def async_request_refresh(self) -> None:
+        # refreshes are requested by the user, poll faster for a while
+        self._set_polling_interval(self._polling_interval.tighten())
+        await super().async_request_refresh()
+
+    async def async_shutdown(self) -> None:
+        await super().async_shutdown()
+
+        if self._unsub_availability_expiry is not None:
+            self._unsub_availability_expiry()
+            self._unsub_availability_expiry = None
+
+        # controls, read backs, polls and shared reads would keep retrying or waiting on the rate limiter
+        # after the entry is unloaded
+        tasks = [
+            *self._pending_edit_controls.values(),
+            *self._control_tasks,
+            *self._read_back_tasks.values(),
+        ]
+        if self._scheduled_refresh is not None:
+            tasks.append(self._scheduled_refresh)
+        self._pending_edits.clear()
+        self._pending_edit_controls.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        await self._api_client.async_cancel()
 
     async def control(
         self,
@@ -77,13 +545,146 @@ class SolisCloudControlCoordinator(DataUpdateCoordinator[SolisCloudControlData])
         value: str,
         old_value: str | None = None,
     ) -> None:
+        if self._shutdown_requested:
+            return
+
         if self.data:
             new_data = SolisCloudControlData(self.data)
             new_data[cid] = value
             self.async_set_updated_data(new_data)
 
+        # tracked, so that unloading the entry cancels its retries
+        inverter_sn = self._inverter.info.serial_number
+        control_task = asyncio.get_running_loop().create_task(
+            self._api_client.control(inverter_sn, cid, value, old_value)
+        )
+        self._control_tasks.add(control_task)
+        control_task.add_done_callback(self._control_tasks.discard)
         try:
-            inverter_sn = self._inverter.info.serial_number
-            await self._api_client.control(inverter_sn, cid, value, old_value)
-        finally:
-            await self.async_request_refresh()
+            await control_task
+        except SolisCloudControlApiError:
+            self._start_read_back(cid, expected_value=None)
+            raise
+
+        # follow up on the effects of a control, like the battery starting to charge
+        self._set_polling_interval(self._polling_interval.tighten())
+        self._start_read_back(cid, expected_value=value)
+
+    def _start_read_back(self, cid: int, expected_value: str | None) -> None:
+        if self._shutdown_requested:
+            return
+
+        # the caller doesn't wait, the inverter may take a while to report the value or report it in another form
+        previous_task = self._read_back_tasks.pop(cid, None)
+        if previous_task is not None:
+            # a newer write supersedes the value the previous read back waits for
+            previous_task.cancel()
+
+        read_back_task = self.hass.async_create_task(
+            self._read_back(cid, expected_value), f"{self.name} read back of CID {cid}"
+        )
+        self._read_back_tasks[cid] = read_back_task
+        read_back_task.add_done_callback(lambda task: self._complete_read_back(cid, task))
+
+    def _complete_read_back(self, cid: int, task: asyncio.Task[None]) -> None:
+        if self._read_back_tasks.get(cid) is task:
+            del self._read_back_tasks[cid]
+
+    async def control_edit(self, cid: int, edit: ValueEdit) -> None:
+        # edits of a multi-field value made within a short window are applied in order and written
+        # with a single control, so concurrent field changes neither overwrite each other nor multiply API calls
+        self._pending_edits.setdefault(cid, []).append(edit)
+
+        control_task = self._pending_edit_controls.get(cid)
+        if control_task is None:
+            control_task = asyncio.get_running_loop().create_task(self._control_pending_edits(cid))
+            self._pending_edit_controls[cid] = control_task
+            control_task.add_done_callback(self._complete_edit_control)
+
+        # shield the shared control, a cancelled caller must not cancel it for the others
+        await asyncio.shield(control_task)
+
+    async def _control_pending_edits(self, cid: int) -> None:
+        await asyncio.sleep(self._control_edit_window_seconds)
+
+        # edits submitted from now on start a new control
+        edits = self._pending_edits.pop(cid)
+        del self._pending_edit_controls[cid]
+
+        old_value = self.data.get(cid) if self.data else None
+        value = old_value
+        for edit in edits:
+            value = edit(value) or value
+
+        if value is None or value == old_value:
+            return
+
+        if len(edits) > 1:
+            _LOGGER.debug("Merged %d edits of CID %d into a single control", len(edits), cid)
+
+        await self.control(cid, value)
+
+    @staticmethod
+    def _complete_edit_control(task: asyncio.Task[None]) -> None:
+        # mark the error as retrieved, all callers may have been cancelled in the meantime
+        if not task.cancelled():
+            task.exception()
+
+    async def _read_back(self, cid: int, expected_value: str | None) -> None:
+        # confirm a write by reading back only the written and coupled CIDs, the inverter applies it with a delay
+        inverter_sn = self._inverter.info.serial_number
+        cids = list(dict.fromkeys([cid, *self._inverter.coupled_cids(cid)]))
+        read_back_check = self._inverter.read_back_check(cid)
+        # a value which can't be confirmed, like the clock, is refreshed by a single read
+        max_retry_time = 0 if read_back_check.match == ReadBackMatch.NONE else _READ_BACK_MAX_RETRY_TIME_SECONDS
+        deadline = Deadline(_READ_BACK_MAX_RETRY_TIME_SECONDS)
+
+        async def read_back_operation() -> None:
+            if cid in self._inverter.read_cids:
+                results = {
+                    cid: await self._api_client.read(
+                        inverter_sn, cid, max_retry_time=0, priority=RequestPriority.READ_BACK, deadline=deadline
+                    )
+                }
+            else:
+                results = await self._api_client.read_batch(
+                    inverter_sn, cids, max_retry_time=0, priority=RequestPriority.READ_BACK, deadline=deadline
+                )
+
+            self._set_read_back_data(results)
+
+            if expected_value is not None and not read_back_check.is_confirmed(expected_value, results.get(cid)):
+                raise SolisCloudControlApiError(f"Control not applied yet, CID {cid} value: '{results.get(cid)}'")
+
+        result = await self._read_back_retry_policy.run(read_back_operation, max_retry_time, deadline)
+        if result.error is not None:
+            _LOGGER.warning(
+                "Read back of CID %d failed after %d attempts (%s): %s",
+                cid,
+                result.attempts,
+                result.stop_reason,
+                result.error,
+            )
+
+    def _set_read_back_data(self, results: dict[int, str]) -> None:
+        now = dt_util.utcnow()
+        for cid in results:
+            self._updated_at[cid] = now
+
+        self._unrestore(results)
+
+        new_data = SolisCloudControlData(self.data or {})
+        new_data.update(results)
+        self.async_set_updated_data(new_data)
+        self._save_snapshot(new_data)
+
+    def _unrestore(self, cids: Iterable[int]) -> None:
+        # the restored flag is part of the entity state, its entities need a state write even if the value is the same
+        unrestored_cids = self._restored_cids.intersection(cids)
+        self._restored_cids -= unrestored_cids
+        self._unrestored_cids |= unrestored_cids
+
+    def _save_snapshot(self, data: SolisCloudControlData) -> None:
+        if self._store is not None:
+            updated_at = {cid: self._updated_at[cid] for cid in data if cid in self._updated_at}
+            self._store.async_delay_save(SolisCloudControlSnapshot(dict(data), updated_at))
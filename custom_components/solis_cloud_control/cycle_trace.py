@@ -0,0 +1,109 @@
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.solis_cloud_control.api.solis_api_metrics import SolisCloudControlApiTotals
+
+_MAX_CYCLE_TRACES = 20
+
+
+@dataclass(frozen=True)
+class CyclePhase:
+    name: str
+    duration_seconds: float
+    requests: int
+    retries: int
+    errors: int
+    bytes_sent: int
+    bytes_received: int
+
+
+@dataclass(frozen=True)
+class CycleTrace:
+    started_at: datetime
+    duration_seconds: float
+    failed: bool
+    entities_notified: int
+    phases: tuple[CyclePhase, ...]
+
+
+class CycleTracer:
+    def __init__(
+        self,
+        api_totals: Callable[[], SolisCloudControlApiTotals],
+        max_traces: int = _MAX_CYCLE_TRACES,
+        monotonic_time: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._api_totals = api_totals
+        self._monotonic_time = monotonic_time
+        self._traces: deque[CycleTrace] = deque(maxlen=max_traces)
+        self._started_at: datetime | None = None
+        self._started_at_monotonic = 0.0
+        self._entities_notified = 0
+        self._phases: list[CyclePhase] = []
+
+    @property
+    def traces(self) -> tuple[CycleTrace, ...]:
+        return tuple(self._traces)
+
+    def start(self) -> bool:
+        # a refresh overlapping the traced one would mix its phases in, it is not traced
+        if self._started_at is not None:
+            return False
+
+        self._started_at = dt_util.utcnow()
+        self._started_at_monotonic = self._monotonic_time()
+        self._entities_notified = 0
+        self._phases = []
+        return True
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if self._started_at is None:
+            yield
+            return
+
+        # the API counters are shared with controls and read backs, running at the same time is rare enough
+        totals = self._api_totals()
+        started_at = self._monotonic_time()
+        try:
+            yield
+        finally:
+            phase_totals = self._api_totals()
+            self._phases.append(
+                CyclePhase(
+                    name=name,
+                    duration_seconds=self._monotonic_time() - started_at,
+                    requests=phase_totals.request_count - totals.request_count,
+                    retries=phase_totals.retry_count - totals.retry_count,
+                    errors=phase_totals.error_count - totals.error_count,
+                    bytes_sent=phase_totals.bytes_sent - totals.bytes_sent,
+                    bytes_received=phase_totals.bytes_received - totals.bytes_received,
+                )
+            )
+
+    def record_entities_notified(self, count: int) -> None:
+        if self._started_at is not None:
+            self._entities_notified += count
+
+    def finish(self, failed: bool) -> CycleTrace | None:
+        started_at = self._started_at
+        self._started_at = None
+        # a refresh skipped before reading anything leaves nothing worth keeping
+        if started_at is None or not self._phases:
+            return None
+
+        trace = CycleTrace(
+            started_at=started_at,
+            duration_seconds=self._monotonic_time() - self._started_at_monotonic,
+            failed=failed,
+            entities_notified=self._entities_notified,
+            phases=tuple(self._phases),
+        )
+        self._traces.append(trace)
+        return trace
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from homeassistant.config_entries import ConfigEntry
 
+from custom_components.solis_cloud_control.api.solis_api_connection_pool import SolisCloudControlConnectionPool
 from custom_components.solis_cloud_control.coordinator import SolisCloudControlCoordinator
 from custom_components.solis_cloud_control.inverters.inverter import Inverter
 
@@ -10,6 +11,7 @@ from custom_components.solis_cloud_control.inverters.inverter import Inverter
 class SolisCloudControlData:
     inverter: Inverter
     coordinator: SolisCloudControlCoordinator
+    connection_pool: SolisCloudControlConnectionPool | None = None
 
 
 class SolisCloudControlConfigEntry(ConfigEntry[SolisCloudControlData]):
@@ -12,7 +12,12 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant,  # noqa: ARG001
     config_entry: SolisCloudControlConfigEntry,
 ) -> dict:
+    coordinator = config_entry.runtime_data.coordinator
+    connection_pool = config_entry.runtime_data.connection_pool
     return {
         "inverter_info": async_redact_data(asdict(config_entry.runtime_data.inverter.info), _TO_REDACT),
-        "coordinator_data": config_entry.runtime_data.coordinator.data,
+        "coordinator_data": coordinator.data,
+        "api_metrics": coordinator.api_metrics.as_dict(),
+        "cycle_traces": [asdict(cycle_trace) for cycle_trace in coordinator.cycle_traces],
+        "connection_pool": asdict(connection_pool.metrics) if connection_pool is not None else None,
     }
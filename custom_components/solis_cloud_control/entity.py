@@ -1,3 +1,6 @@
+from collections.abc import Sequence
+from typing import Any
+
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -6,14 +9,14 @@ from custom_components.solis_cloud_control.const import CONF_INVERTER_SN
 from custom_components.solis_cloud_control.coordinator import SolisCloudControlCoordinator
 
 
-class SolisCloudControlEntity(CoordinatorEntity[SolisCloudControlCoordinator]):
+class SolisCloudControlDeviceEntity(CoordinatorEntity[SolisCloudControlCoordinator]):
     def __init__(
         self,
         coordinator: SolisCloudControlCoordinator,
         entity_description: EntityDescription,
-        cids: int | list[int],
+        context: frozenset[int] | None = None,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=context)
         self.entity_description = entity_description
 
         assert coordinator.config_entry is not None
@@ -29,18 +32,31 @@ class SolisCloudControlEntity(CoordinatorEntity[SolisCloudControlCoordinator]):
             },
         )
 
-        if isinstance(cids, int):
-            self.cids = [cids]
-        else:
-            self.cids = cids
+
+class SolisCloudControlEntity(SolisCloudControlDeviceEntity):
+    def __init__(
+        self,
+        coordinator: SolisCloudControlCoordinator,
+        entity_description: EntityDescription,
+        cids: int | Sequence[int],
+        dependent_cids: list[int] | None = None,
+    ) -> None:
+        cids = [cids] if isinstance(cids, int) else list(cids)
+
+        # the state is written only when one of these CIDs changes
+        super().__init__(coordinator, entity_description, context=frozenset(cids + (dependent_cids or [])))
+
+        self.cids = cids
+        self._cid_mask = frozenset(cids)
 
     @property
     def available(self) -> bool:
-        if not self.coordinator.last_update_success:
-            return False
+        return self._cid_mask <= self.coordinator.available_cids
 
-        for cid in self.cids:
-            if cid not in self.coordinator.data or self.coordinator.data[cid] is None:
-                return False
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        # flag values restored from the last run, until they are read from the API again
+        if any(self.coordinator.is_restored(cid) for cid in self.cids):
+            return {"restored": True}
 
-        return True
+        return None
@@ -1,5 +1,10 @@
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
-from typing import ClassVar
+from enum import StrEnum
+from functools import cached_property
+from itertools import combinations
+from types import MappingProxyType
+from typing import ClassVar, Protocol
 
 from custom_components.solis_cloud_control.utils.safe_converters import (
     safe_convert_power_to_watts,
@@ -7,6 +12,66 @@ from custom_components.solis_cloud_control.utils.safe_converters import (
 )
 
 
+class RefreshTier(StrEnum):
+    FAST = "fast"
+    SLOW = "slow"
+
+
+class ReadBackMatch(StrEnum):
+    EXACT = "exact"
+    TOLERANCE = "tolerance"
+    NONE = "none"
+
+
+@dataclass(frozen=True)
+class ReadBackCheck:
+    match: ReadBackMatch = ReadBackMatch.EXACT
+    tolerance: float = 0.0
+
+    def is_confirmed(self, expected_value: str, value: str | None) -> bool:
+        if self.match == ReadBackMatch.NONE:
+            return True
+
+        if self.match == ReadBackMatch.TOLERANCE:
+            expected_number = safe_get_float_value(expected_value)
+            number = safe_get_float_value(value)
+            if expected_number is not None and number is not None:
+                return abs(number - expected_number) <= self.tolerance
+
+        return value == expected_value
+
+
+# numbers are written in whole raw units, the inverter may report them in another format
+_NUMBER_READ_BACK_CHECK = ReadBackCheck(ReadBackMatch.TOLERANCE, tolerance=0.5)
+
+
+class InverterFeature(Protocol):
+    REFRESH_TIER: ClassVar[RefreshTier]
+    READ_INDIVIDUALLY: ClassVar[bool]
+    READ_BACK_CHECK: ClassVar[ReadBackCheck]
+
+    @property
+    def cids(self) -> tuple[int, ...]: ...
+
+    @property
+    def coupled_cids(self) -> tuple[int, ...]: ...
+
+
+class _InverterSingleCidFeature:
+    READ_INDIVIDUALLY: ClassVar[bool] = False
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = ReadBackCheck()
+
+    cid: int
+
+    @property
+    def cids(self) -> tuple[int, ...]:
+        return (self.cid,)
+
+    @property
+    def coupled_cids(self) -> tuple[int, ...]:
+        return ()
+
+
 @dataclass(frozen=True)
 class InverterInfo:
     ENERGY_STORAGE_CONTROL_DISABLED: ClassVar[str] = "0"
@@ -79,6 +144,10 @@ class InverterInfo:
 
 @dataclass(frozen=True)
 class InverterOnOff:
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.FAST
+    READ_INDIVIDUALLY: ClassVar[bool] = False
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = ReadBackCheck()
+
     on_cid: int = 52
     off_cid: int = 54
     on_value: str = "190"
@@ -87,20 +156,37 @@ class InverterOnOff:
     def is_valid_value(self, value: str | None) -> bool:
         return value in (self.on_value, self.off_value)
 
+    @property
+    def cids(self) -> tuple[int, ...]:
+        return (self.on_cid, self.off_cid)
+
+    @property
+    def coupled_cids(self) -> tuple[int, ...]:
+        # the on/off state is reported by both CIDs
+        return self.cids
+
 
 @dataclass(frozen=True)
-class InverterTime:
+class InverterTime(_InverterSingleCidFeature):
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.SLOW
+    # the clock keeps running, the value read never matches the one written
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = ReadBackCheck(ReadBackMatch.NONE)
+
     cid: int = 56
 
 
 @dataclass(frozen=True)
-class InverterStorageMode:
+class InverterStorageMode(_InverterSingleCidFeature):
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.FAST
+
     cid: int = 636
 
 
 @dataclass(frozen=True)
-class InverterChargeDischargeSettings:
+class InverterChargeDischargeSettings(_InverterSingleCidFeature):
     SLOTS_COUNT: ClassVar[int] = 3
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.SLOW
+    READ_INDIVIDUALLY: ClassVar[bool] = True
 
     cid: int = 103
     current_min_value: float = 0
@@ -122,18 +208,21 @@ class InverterChargeDischargeSlot:
     soc_step: float = 1
 
     @property
-    def all_cids(self) -> list[int]:
-        return [
+    def all_cids(self) -> tuple[int, ...]:
+        return (
             self.switch_cid,
             self.time_cid,
             self.current_cid,
             self.soc_cid,
-        ]
+        )
 
 
 @dataclass(frozen=True)
 class InverterChargeDischargeSlots:
     SLOTS_COUNT: ClassVar[int] = 6
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.SLOW
+    READ_INDIVIDUALLY: ClassVar[bool] = False
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = ReadBackCheck()
 
     charge_slot1: InverterChargeDischargeSlot = field(
         default_factory=lambda: InverterChargeDischargeSlot(
@@ -249,62 +338,79 @@ class InverterChargeDischargeSlots:
     bit_discharge_slot5: int = 10
     bit_discharge_slot6: int = 11
 
-    @property
-    def all_cids(self) -> list[int]:
-        cids = []
-
-        for slot in [
+    @cached_property
+    def charge_slots(self) -> tuple[InverterChargeDischargeSlot, ...]:
+        return (
             self.charge_slot1,
             self.charge_slot2,
             self.charge_slot3,
             self.charge_slot4,
             self.charge_slot5,
             self.charge_slot6,
+        )
+
+    @cached_property
+    def discharge_slots(self) -> tuple[InverterChargeDischargeSlot, ...]:
+        return (
             self.discharge_slot1,
             self.discharge_slot2,
             self.discharge_slot3,
             self.discharge_slot4,
             self.discharge_slot5,
             self.discharge_slot6,
-        ]:
-            cids.extend(slot.all_cids)
-        return cids
+        )
+
+    @cached_property
+    def all_cids(self) -> tuple[int, ...]:
+        return tuple(cid for slot in (*self.charge_slots, *self.discharge_slots) for cid in slot.all_cids)
+
+    @property
+    def cids(self) -> tuple[int, ...]:
+        return self.all_cids
+
+    @cached_property
+    def switch_cids(self) -> tuple[int, ...]:
+        return tuple(slot.switch_cid for slot in (*self.charge_slots, *self.discharge_slots))
+
+    @cached_property
+    def switch_bits(self) -> tuple[int, ...]:
+        # the bit position of each switch in the bitmask, in the order of switch_cids
+        return (
+            self.bit_charge_slot1,
+            self.bit_charge_slot2,
+            self.bit_charge_slot3,
+            self.bit_charge_slot4,
+            self.bit_charge_slot5,
+            self.bit_charge_slot6,
+            self.bit_discharge_slot1,
+            self.bit_discharge_slot2,
+            self.bit_discharge_slot3,
+            self.bit_discharge_slot4,
+            self.bit_discharge_slot5,
+            self.bit_discharge_slot6,
+        )
+
+    @property
+    def coupled_cids(self) -> tuple[int, ...]:
+        # slot switches are written together as a single bitmask
+        return self.switch_cids
 
     def get_charge_slot(self, slot_number: int) -> InverterChargeDischargeSlot:
-        if slot_number == 1:
-            return self.charge_slot1
-        elif slot_number == 2:
-            return self.charge_slot2
-        elif slot_number == 3:
-            return self.charge_slot3
-        elif slot_number == 4:
-            return self.charge_slot4
-        elif slot_number == 5:
-            return self.charge_slot5
-        elif slot_number == 6:
-            return self.charge_slot6
-        else:
+        if not 1 <= slot_number <= len(self.charge_slots):
             raise ValueError(f"Invalid charge slot number: {slot_number}")
+        return self.charge_slots[slot_number - 1]
 
     def get_discharge_slot(self, slot_number: int) -> InverterChargeDischargeSlot:
-        if slot_number == 1:
-            return self.discharge_slot1
-        elif slot_number == 2:
-            return self.discharge_slot2
-        elif slot_number == 3:
-            return self.discharge_slot3
-        elif slot_number == 4:
-            return self.discharge_slot4
-        elif slot_number == 5:
-            return self.discharge_slot5
-        elif slot_number == 6:
-            return self.discharge_slot6
-        else:
+        if not 1 <= slot_number <= len(self.discharge_slots):
             raise ValueError(f"Invalid discharge slot number: {slot_number}")
+        return self.discharge_slots[slot_number - 1]
 
 
 @dataclass(frozen=True)
-class InverterMaxOutputPower:
+class InverterMaxOutputPower(_InverterSingleCidFeature):
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.SLOW
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = _NUMBER_READ_BACK_CHECK
+
     cid: int = 376
     min_value: float = 0
     max_value: float = 100
@@ -312,7 +418,10 @@ class InverterMaxOutputPower:
 
 
 @dataclass(frozen=True)
-class InverterMaxExportPower:
+class InverterMaxExportPower(_InverterSingleCidFeature):
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.SLOW
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = _NUMBER_READ_BACK_CHECK
+
     cid: int = 499
     min_value: float = 0
     max_value: float = InverterInfo.MAX_EXPORT_POWER_DEFAULT
@@ -321,7 +430,10 @@ class InverterMaxExportPower:
 
 
 @dataclass(frozen=True)
-class InverterPowerLimit:
+class InverterPowerLimit(_InverterSingleCidFeature):
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.FAST
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = _NUMBER_READ_BACK_CHECK
+
     cid: int = 15
     min_value: float = 0
     max_value: float = InverterInfo.POWER_LIMIT_DEFAULT
@@ -329,14 +441,19 @@ class InverterPowerLimit:
 
 
 @dataclass(frozen=True)
-class InverterAllowExport:
+class InverterAllowExport(_InverterSingleCidFeature):
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.FAST
+
     cid: int = 6962
     on_value: str = "80"
     off_value: str = "88"
 
 
 @dataclass(frozen=True)
-class InverterBatteryReserveSOC:
+class InverterBatteryReserveSOC(_InverterSingleCidFeature):
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.SLOW
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = _NUMBER_READ_BACK_CHECK
+
     cid: int = 157
     min_value: float = 0
     max_value: float = 100
@@ -344,7 +461,10 @@ class InverterBatteryReserveSOC:
 
 
 @dataclass(frozen=True)
-class InverterBatteryOverDischargeSOC:
+class InverterBatteryOverDischargeSOC(_InverterSingleCidFeature):
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.SLOW
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = _NUMBER_READ_BACK_CHECK
+
     cid: int = 158
     min_value: float = 0
     max_value: float = 100
@@ -352,7 +472,10 @@ class InverterBatteryOverDischargeSOC:
 
 
 @dataclass(frozen=True)
-class InverterBatteryForceChargeSOC:
+class InverterBatteryForceChargeSOC(_InverterSingleCidFeature):
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.SLOW
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = _NUMBER_READ_BACK_CHECK
+
     cid: int = 160
     min_value: float = 0
     max_value: float = 100
@@ -360,7 +483,10 @@ class InverterBatteryForceChargeSOC:
 
 
 @dataclass(frozen=True)
-class InverterBatteryRecoverySOC:
+class InverterBatteryRecoverySOC(_InverterSingleCidFeature):
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.SLOW
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = _NUMBER_READ_BACK_CHECK
+
     cid: int = 7229
     min_value: float = 0
     max_value: float = 100
@@ -368,7 +494,10 @@ class InverterBatteryRecoverySOC:
 
 
 @dataclass(frozen=True)
-class InverterBatteryMaxChargeSOC:
+class InverterBatteryMaxChargeSOC(_InverterSingleCidFeature):
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.SLOW
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = _NUMBER_READ_BACK_CHECK
+
     cid: int = 7963
     min_value: float = 0
     max_value: float = 100
@@ -376,7 +505,10 @@ class InverterBatteryMaxChargeSOC:
 
 
 @dataclass(frozen=True)
-class InverterBatteryMaxChargeCurrent:
+class InverterBatteryMaxChargeCurrent(_InverterSingleCidFeature):
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.SLOW
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = _NUMBER_READ_BACK_CHECK
+
     cid: int = 7224
     min_value: float = 0
     max_value: float = InverterInfo.MAX_BATTERY_CURRENT_DEFAULT
@@ -385,7 +517,10 @@ class InverterBatteryMaxChargeCurrent:
 
 
 @dataclass(frozen=True)
-class InverterBatteryMaxDischargeCurrent:
+class InverterBatteryMaxDischargeCurrent(_InverterSingleCidFeature):
+    REFRESH_TIER: ClassVar[RefreshTier] = RefreshTier.SLOW
+    READ_BACK_CHECK: ClassVar[ReadBackCheck] = _NUMBER_READ_BACK_CHECK
+
     cid: int = 7226
     min_value: float = 0
     max_value: float = InverterInfo.MAX_BATTERY_CURRENT_DEFAULT
@@ -393,6 +528,24 @@ class InverterBatteryMaxDischargeCurrent:
     parallel_battery_count: int = InverterInfo.PARALLEL_BATTERY_COUNT_DEFAULT
 
 
+@dataclass(frozen=True)
+class InverterCidPlan:
+    read_batch_cids: tuple[int, ...]
+    read_cids: tuple[int, ...]
+    all_cids: tuple[int, ...]
+    refresh_tiers: Mapping[int, RefreshTier]
+    coupled_cids: Mapping[int, tuple[int, ...]]
+    read_back_checks: Mapping[int, ReadBackCheck]
+    read_batch_cids_by_tiers: Mapping[frozenset[RefreshTier], tuple[int, ...]]
+    read_cids_by_tiers: Mapping[frozenset[RefreshTier], tuple[int, ...]]
+
+    def read_batch_cids_for(self, tiers: Iterable[RefreshTier]) -> tuple[int, ...]:
+        return self.read_batch_cids_by_tiers[frozenset(tiers)]
+
+    def read_cids_for(self, tiers: Iterable[RefreshTier]) -> tuple[int, ...]:
+        return self.read_cids_by_tiers[frozenset(tiers)]
+
+
 @dataclass(frozen=True)
 class Inverter:
     info: InverterInfo
@@ -413,53 +566,87 @@ class Inverter:
     battery_max_charge_current: InverterBatteryMaxChargeCurrent | None = None
     battery_max_discharge_current: InverterBatteryMaxDischargeCurrent | None = None
 
-    @property
-    def read_batch_cids(self) -> list[int]:
-        cids: list[int] = []
-
-        if self.on_off:
-            cids.append(self.on_off.on_cid)
-            cids.append(self.on_off.off_cid)
-        if self.time:
-            cids.append(self.time.cid)
-        if self.storage_mode:
-            cids.append(self.storage_mode.cid)
-        if self.charge_discharge_slots:
-            cids.extend(self.charge_discharge_slots.all_cids)
-        if self.max_output_power:
-            cids.append(self.max_output_power.cid)
-        if self.max_export_power:
-            cids.append(self.max_export_power.cid)
-        if self.power_limit:
-            cids.append(self.power_limit.cid)
-        if self.allow_export:
-            cids.append(self.allow_export.cid)
-        if self.battery_reserve_soc:
-            cids.append(self.battery_reserve_soc.cid)
-        if self.battery_over_discharge_soc:
-            cids.append(self.battery_over_discharge_soc.cid)
-        if self.battery_force_charge_soc:
-            cids.append(self.battery_force_charge_soc.cid)
-        if self.battery_recovery_soc:
-            cids.append(self.battery_recovery_soc.cid)
-        if self.battery_max_charge_soc:
-            cids.append(self.battery_max_charge_soc.cid)
-        if self.battery_max_charge_current:
-            cids.append(self.battery_max_charge_current.cid)
-        if self.battery_max_discharge_current:
-            cids.append(self.battery_max_discharge_current.cid)
-
-        return cids
+    @cached_property
+    def features(self) -> tuple[InverterFeature, ...]:
+        features = (
+            self.on_off,
+            self.time,
+            self.storage_mode,
+            self.charge_discharge_settings,
+            self.charge_discharge_slots,
+            self.max_output_power,
+            self.max_export_power,
+            self.power_limit,
+            self.allow_export,
+            self.battery_reserve_soc,
+            self.battery_over_discharge_soc,
+            self.battery_force_charge_soc,
+            self.battery_recovery_soc,
+            self.battery_max_charge_soc,
+            self.battery_max_charge_current,
+            self.battery_max_discharge_current,
+        )
+        return tuple(feature for feature in features if feature is not None)
+
+    @cached_property
+    def cid_plan(self) -> InverterCidPlan:
+        return _compile_cid_plan(self)
 
     @property
-    def read_cids(self) -> list[int]:
-        cids = []
+    def read_batch_cids(self) -> tuple[int, ...]:
+        return self.cid_plan.read_batch_cids
 
-        if self.charge_discharge_settings:
-            cids.append(self.charge_discharge_settings.cid)
+    @property
+    def read_cids(self) -> tuple[int, ...]:
+        return self.cid_plan.read_cids
 
-        return cids
+    @property
+    def all_cids(self) -> tuple[int, ...]:
+        return self.cid_plan.all_cids
 
     @property
-    def all_cids(self) -> list[int]:
-        return [*self.read_batch_cids, *self.read_cids]
+    def refresh_tiers(self) -> Mapping[int, RefreshTier]:
+        return self.cid_plan.refresh_tiers
+
+    def coupled_cids(self, cid: int) -> tuple[int, ...]:
+        return self.cid_plan.coupled_cids.get(cid, ())
+
+    def read_back_check(self, cid: int) -> ReadBackCheck:
+        return self.cid_plan.read_back_checks.get(cid, ReadBackCheck())
+
+
+def _compile_cid_plan(inverter: Inverter) -> InverterCidPlan:
+    # the features never change after setup, so the CID lists of every poll are computed only once
+    read_batch_tiers: dict[int, RefreshTier] = {}
+    read_tiers: dict[int, RefreshTier] = {}
+    coupled_cids: dict[int, tuple[int, ...]] = {}
+    read_back_checks: dict[int, ReadBackCheck] = {}
+
+    for feature in inverter.features:
+        feature_tiers = read_tiers if feature.READ_INDIVIDUALLY else read_batch_tiers
+        feature_tiers |= dict.fromkeys(feature.cids, feature.REFRESH_TIER)
+        read_back_checks |= dict.fromkeys(feature.cids, feature.READ_BACK_CHECK)
+
+        for cid in feature.coupled_cids:
+            coupled_cids[cid] = feature.coupled_cids
+
+    return InverterCidPlan(
+        read_batch_cids=tuple(read_batch_tiers),
+        read_cids=tuple(read_tiers),
+        all_cids=(*read_batch_tiers, *read_tiers),
+        refresh_tiers=MappingProxyType(read_batch_tiers | read_tiers),
+        coupled_cids=MappingProxyType(coupled_cids),
+        read_back_checks=MappingProxyType(read_back_checks),
+        read_batch_cids_by_tiers=_cids_by_tiers(read_batch_tiers),
+        read_cids_by_tiers=_cids_by_tiers(read_tiers),
+    )
+
+
+def _cids_by_tiers(tiers: dict[int, RefreshTier]) -> Mapping[frozenset[RefreshTier], tuple[int, ...]]:
+    # one entry for every combination of due tiers, in the order of the features
+    tier_sets = (
+        frozenset(tier_set) for count in range(len(RefreshTier) + 1) for tier_set in combinations(RefreshTier, count)
+    )
+    return MappingProxyType(
+        {tier_set: tuple(cid for cid, tier in tiers.items() if tier in tier_set) for tier_set in tier_sets}
+    )
@@ -21,12 +21,19 @@ from custom_components.solis_cloud_control.inverters.inverter import (
     InverterStorageMode,
     InverterTime,
 )
+from custom_components.solis_cloud_control.utils.retry_policy import Deadline
 
 _MAX_RETRY_TIME_SECONDS = 60
 
 
-async def create_inverter_info(api_client: SolisCloudControlApiClient, inverter_sn: str) -> InverterInfo:
-    inverter_details = await api_client.inverter_details(inverter_sn, _MAX_RETRY_TIME_SECONDS)
+async def create_inverter_info(
+    api_client: SolisCloudControlApiClient,
+    inverter_sn: str,
+    cached_inverter_info: InverterInfo | None = None,
+) -> InverterInfo:
+    # a single time budget for all the requests, instead of one per request
+    deadline = Deadline(_MAX_RETRY_TIME_SECONDS)
+    inverter_details = await api_client.inverter_details(inverter_sn, _MAX_RETRY_TIME_SECONDS, deadline)
 
     inverter_info = InverterInfo(
         serial_number=inverter_sn,
@@ -44,9 +51,15 @@ async def create_inverter_info(api_client: SolisCloudControlApiClient, inverter_
         tou_v2_mode=None,
     )
 
-    if not inverter_info.is_string_inverter:
-        tou_v2_mode = await api_client.read(inverter_sn, 6798, _MAX_RETRY_TIME_SECONDS)
-        inverter_info = replace(inverter_info, tou_v2_mode=tou_v2_mode)
+    if inverter_info.is_string_inverter:
+        return inverter_info
+
+    # the TOU v2 mode is only expected to change with a firmware update
+    if cached_inverter_info is not None and cached_inverter_info.version == inverter_info.version:
+        return replace(inverter_info, tou_v2_mode=cached_inverter_info.tou_v2_mode)
+
+    tou_v2_mode = await api_client.read(inverter_sn, 6798, _MAX_RETRY_TIME_SECONDS, deadline=deadline)
+    inverter_info = replace(inverter_info, tou_v2_mode=tou_v2_mode)
 
     return inverter_info
 
@@ -62,9 +75,7 @@ def _get_inverter_detail(inverter_details: dict, field: str) -> str | None:
     return str(value) if (value := inverter_details.get(field)) is not None else None
 
 
-def _create_string_inverter(
-    inverter_info: InverterInfo,
-) -> Inverter:
+def _create_string_inverter(inverter_info: InverterInfo) -> Inverter:
     return Inverter(
         info=inverter_info,
         on_off=InverterOnOff(on_cid=48, off_cid=53),
@@ -74,40 +85,27 @@ def _create_string_inverter(
 
 
 def _create_hybrid_inverter(inverter_info: InverterInfo) -> Inverter:
-    if inverter_info.is_tou_v2_enabled:
-        charge_discharge_slots = InverterChargeDischargeSlots()
-        charge_discharge_settings = None
-    else:
-        charge_discharge_slots = None
-        charge_discharge_settings = InverterChargeDischargeSettings()
-
-    max_export_power = InverterMaxExportPower(
-        max_value=inverter_info.max_export_power, scale=inverter_info.max_export_power_scale
-    )
-
-    battery_max_charge_current = InverterBatteryMaxChargeCurrent(
-        parallel_battery_count=inverter_info.parallel_battery_count
-    )
-
-    battery_max_discharge_current = InverterBatteryMaxDischargeCurrent(
-        parallel_battery_count=inverter_info.parallel_battery_count
-    )
-
     return Inverter(
         info=inverter_info,
         on_off=InverterOnOff(),
         time=InverterTime(),
         storage_mode=InverterStorageMode(),
-        charge_discharge_slots=charge_discharge_slots,
-        charge_discharge_settings=charge_discharge_settings,
+        charge_discharge_slots=InverterChargeDischargeSlots() if inverter_info.is_tou_v2_enabled else None,
+        charge_discharge_settings=None if inverter_info.is_tou_v2_enabled else InverterChargeDischargeSettings(),
         max_output_power=InverterMaxOutputPower(),
-        max_export_power=max_export_power,
+        max_export_power=InverterMaxExportPower(
+            max_value=inverter_info.max_export_power, scale=inverter_info.max_export_power_scale
+        ),
         allow_export=InverterAllowExport(),
         battery_reserve_soc=InverterBatteryReserveSOC(),
         battery_over_discharge_soc=InverterBatteryOverDischargeSOC(),
         battery_force_charge_soc=InverterBatteryForceChargeSOC(),
         battery_recovery_soc=InverterBatteryRecoverySOC(),
         battery_max_charge_soc=InverterBatteryMaxChargeSOC(),
-        battery_max_charge_current=battery_max_charge_current,
-        battery_max_discharge_current=battery_max_discharge_current,
+        battery_max_charge_current=InverterBatteryMaxChargeCurrent(
+            parallel_battery_count=inverter_info.parallel_battery_count
+        ),
+        battery_max_discharge_current=InverterBatteryMaxDischargeCurrent(
+            parallel_battery_count=inverter_info.parallel_battery_count
+        ),
     )
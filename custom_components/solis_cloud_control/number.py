@@ -263,7 +263,14 @@ class BatteryCurrentV1(SolisCloudControlEntity, NumberEntity):
         slot_number: int,
         slot_type: Literal["charge", "discharge"],
     ) -> None:
-        super().__init__(coordinator, entity_description, inverter_charge_discharge_settings.cid)
+        super().__init__(
+            coordinator,
+            entity_description,
+            inverter_charge_discharge_settings.cid,
+            [inverter_battery_max_charge_discharge_current.cid]
+            if inverter_battery_max_charge_discharge_current
+            else [],
+        )
         self._attr_native_min_value = inverter_charge_discharge_settings.current_min_value
         self._attr_native_step = inverter_charge_discharge_settings.current_step
         self._attr_device_class = NumberDeviceClass.CURRENT
@@ -291,10 +298,11 @@ class BatteryCurrentV1(SolisCloudControlEntity, NumberEntity):
 
     @property
     def native_value(self) -> float | None:
-        current_value = self.coordinator.data.get(self.inverter_charge_discharge_settings.cid)
-
-        charge_discharge_settings = ChargeDischargeSettings.create(current_value)
+        charge_discharge_settings = self.coordinator.data_view.charge_discharge_settings(
+            self.inverter_charge_discharge_settings.cid
+        )
         if charge_discharge_settings is None:
+            current_value = self.coordinator.data.get(self.inverter_charge_discharge_settings.cid)
             _LOGGER.warning("Invalid '%s' settings: '%s'", self.name, current_value)
             return None
 
@@ -306,22 +314,25 @@ class BatteryCurrentV1(SolisCloudControlEntity, NumberEntity):
         return current
 
     async def async_set_native_value(self, value: float) -> None:
-        current_value = self.coordinator.data.get(self.inverter_charge_discharge_settings.cid)
-        charge_discharge_settings = ChargeDischargeSettings.create(current_value)
+        # applied to the latest settings by the coordinator, together with other slot edits made meanwhile
+        def set_current(current_value: str | None) -> str | None:
+            charge_discharge_settings = ChargeDischargeSettings.create(current_value)
 
-        if charge_discharge_settings is None:
-            _LOGGER.warning("Invalid '%s' settings: '%s'", self.name, current_value)
-            return None
+            if charge_discharge_settings is None:
+                _LOGGER.warning("Invalid '%s' settings: '%s'", self.name, current_value)
+                return None
 
-        if self.slot_type == "charge":
-            charge_discharge_settings.set_charge_current(self.slot_number, value)
-        else:
-            charge_discharge_settings.set_discharge_current(self.slot_number, value)
+            if self.slot_type == "charge":
+                charge_discharge_settings.set_charge_current(self.slot_number, value)
+            else:
+                charge_discharge_settings.set_discharge_current(self.slot_number, value)
 
-        value_str = charge_discharge_settings.to_value()
+            value_str = charge_discharge_settings.to_value()
 
-        _LOGGER.info("Set '%s' to %f (value: %s)", self.name, value, value_str)
-        await self.coordinator.control(self.inverter_charge_discharge_settings.cid, value_str)
+            _LOGGER.info("Set '%s' to %f (value: %s)", self.name, value, value_str)
+            return value_str
+
+        await self.coordinator.control_edit(self.inverter_charge_discharge_settings.cid, set_current)
 
 
 class BatteryCurrentV2(SolisCloudControlEntity, NumberEntity):
@@ -334,7 +345,14 @@ class BatteryCurrentV2(SolisCloudControlEntity, NumberEntity):
         | InverterBatteryMaxDischargeCurrent
         | None,
     ) -> None:
-        super().__init__(coordinator, entity_description, inverter_charge_discharge_slot.current_cid)
+        super().__init__(
+            coordinator,
+            entity_description,
+            inverter_charge_discharge_slot.current_cid,
+            [inverter_battery_max_charge_discharge_current.cid]
+            if inverter_battery_max_charge_discharge_current
+            else [],
+        )
         self._attr_native_min_value = inverter_charge_discharge_slot.current_min_value
         self._attr_native_step = inverter_charge_discharge_slot.current_step
         self._attr_device_class = NumberDeviceClass.CURRENT
@@ -378,7 +396,16 @@ class BatterySocV2(SolisCloudControlEntity, NumberEntity):
         inverter_battery_over_discharge_soc: InverterBatteryOverDischargeSOC | None,
         inverter_battery_max_charge_soc: InverterBatteryMaxChargeSOC | None,
     ) -> None:
-        super().__init__(coordinator, entity_description, inverter_charge_discharge_slot.soc_cid)
+        super().__init__(
+            coordinator,
+            entity_description,
+            inverter_charge_discharge_slot.soc_cid,
+            [
+                inverter_soc.cid
+                for inverter_soc in (inverter_battery_over_discharge_soc, inverter_battery_max_charge_soc)
+                if inverter_soc is not None
+            ],
+        )
         self._attr_native_step = inverter_charge_discharge_slot.soc_step
         self._attr_device_class = NumberDeviceClass.BATTERY
         self._attr_native_unit_of_measurement = PERCENTAGE
@@ -62,10 +62,9 @@ class StorageModeSelect(SolisCloudControlEntity, SelectEntity):
 
     @property
     def current_option(self) -> str | None:
-        current_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
-
-        storage_mode = StorageMode.create(current_value)
+        storage_mode = self.coordinator.data_view.storage_mode(self.inverter_storage_mode.cid)
         if storage_mode is None:
+            current_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
             _LOGGER.warning("Invalid '%s' storage mode: '%s'", self.name, current_value)
             return None
 
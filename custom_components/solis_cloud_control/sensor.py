@@ -1,8 +1,16 @@
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
-from homeassistant.const import PERCENTAGE, UnitOfElectricCurrent
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfElectricCurrent, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from custom_components.solis_cloud_control.api.solis_api_metrics import SolisCloudControlEndpointMetrics
 from custom_components.solis_cloud_control.data import SolisCloudControlConfigEntry
 from custom_components.solis_cloud_control.inverters.inverter import (
     InverterBatteryForceChargeSOC,
@@ -16,7 +24,7 @@ from custom_components.solis_cloud_control.inverters.inverter import (
 from custom_components.solis_cloud_control.utils.safe_converters import safe_get_float_value
 
 from .coordinator import SolisCloudControlCoordinator
-from .entity import SolisCloudControlEntity
+from .entity import SolisCloudControlDeviceEntity, SolisCloudControlEntity
 
 
 async def async_setup_entry(
@@ -121,9 +129,36 @@ async def async_setup_entry(
             )
         )
 
+    for endpoint, key, name in _API_ENDPOINTS:
+        entities.append(
+            ApiMetricsSensor(
+                coordinator=coordinator,
+                entity_description=SensorEntityDescription(
+                    key=f"api_{key}_latency",
+                    name=f"API {name} Latency",
+                    icon="mdi:timer-outline",
+                    device_class=SensorDeviceClass.DURATION,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    native_unit_of_measurement=UnitOfTime.SECONDS,
+                    entity_category=EntityCategory.DIAGNOSTIC,
+                    entity_registry_enabled_default=False,
+                ),
+                endpoint=endpoint,
+            )
+        )
+
     async_add_entities(entities)
 
 
+_API_ENDPOINTS = [
+    ("atRead", "read", "Read"),
+    ("atReadBatch", "read_batch", "Read Batch"),
+    ("control", "control", "Control"),
+    ("inverterDetail", "inverter_detail", "Inverter Detail"),
+    ("inverterList", "inverter_list", "Inverter List"),
+]
+
+
 class BatterySocSensor(SolisCloudControlEntity, SensorEntity):
     def __init__(
         self,
@@ -162,3 +197,30 @@ class BatteryCurrentSensor(SolisCloudControlEntity, SensorEntity):
     def native_value(self) -> float | None:
         value_str = self.coordinator.data.get(self.inverter_battery_current.cid)
         return safe_get_float_value(value_str)
+
+
+class ApiMetricsSensor(SolisCloudControlDeviceEntity, SensorEntity):
+    # not bound to any CID, the metrics are refreshed with every coordinator update
+    def __init__(
+        self,
+        coordinator: SolisCloudControlCoordinator,
+        entity_description: SensorEntityDescription,
+        endpoint: str,
+    ) -> None:
+        super().__init__(coordinator, entity_description)
+
+        self.endpoint = endpoint
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @property
+    def native_value(self) -> float | None:
+        endpoint_metrics = self.coordinator.api_metrics.get(self.endpoint)
+        return endpoint_metrics.latency.percentile(95) if endpoint_metrics is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        endpoint_metrics = self.coordinator.api_metrics.get(self.endpoint) or SolisCloudControlEndpointMetrics()
+        return endpoint_metrics.as_dict()
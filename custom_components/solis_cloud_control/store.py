@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from custom_components.solis_cloud_control.const import DOMAIN
+from custom_components.solis_cloud_control.inverters.inverter import InverterInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+_STORAGE_VERSION = 1
+
+_SAVE_DELAY_SECONDS = 60
+
+_INVERTER_INFO_STORAGE_KEY = f"{DOMAIN}.inverter_info"
+_INVERTER_INFO_REVALIDATION_INTERVAL = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class SolisCloudControlSnapshot:
+    data: dict[int, str | None]
+    # when each value was read, restored values age from it
+    updated_at: dict[int, datetime] = field(default_factory=dict)
+
+
+class SolisCloudControlStore:
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict] = Store(hass, _STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+    async def async_load(self) -> SolisCloudControlSnapshot | None:
+        stored = await self._store.async_load()
+        if stored is None:
+            return None
+
+        try:
+            return SolisCloudControlSnapshot(
+                data={int(cid): value for cid, value in stored["data"].items()},
+                # snapshots saved without the read times restore values of unknown age, as unavailable
+                updated_at={
+                    int(cid): datetime.fromisoformat(updated_at)
+                    for cid, updated_at in stored.get("updated_at", {}).items()
+                },
+            )
+        except (KeyError, TypeError, ValueError, AttributeError) as error:
+            _LOGGER.warning("Ignoring invalid stored snapshot: %s", error)
+            return None
+
+    def async_delay_save(self, snapshot: SolisCloudControlSnapshot) -> None:
+        # data changes every poll, batch the writes to spare the disk
+        self._store.async_delay_save(lambda: self._to_stored(snapshot), _SAVE_DELAY_SECONDS)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    @staticmethod
+    def _to_stored(snapshot: SolisCloudControlSnapshot) -> dict:
+        return {
+            "data": {str(cid): value for cid, value in snapshot.data.items()},
+            "updated_at": {str(cid): updated_at.isoformat() for cid, updated_at in snapshot.updated_at.items()},
+        }
+
+
+@dataclass(frozen=True)
+class CachedInverterInfo:
+    inverter_info: InverterInfo
+    validated_at: datetime
+
+    @property
+    def needs_revalidation(self) -> bool:
+        return dt_util.utcnow() - self.validated_at >= _INVERTER_INFO_REVALIDATION_INTERVAL
+
+
+class InverterInfoCache:
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict] = Store(hass, _STORAGE_VERSION, _INVERTER_INFO_STORAGE_KEY)
+        self._entries: dict[str, CachedInverterInfo] | None = None
+        self._load_lock = asyncio.Lock()
+
+    async def async_get(self, inverter_sn: str) -> CachedInverterInfo | None:
+        entries = await self._async_load()
+        return entries.get(inverter_sn)
+
+    async def async_set(self, inverter_info: InverterInfo) -> None:
+        entries = await self._async_load()
+        entries[inverter_info.serial_number] = CachedInverterInfo(inverter_info, dt_util.utcnow())
+        await self._async_save()
+
+    async def async_invalidate(self, inverter_sn: str) -> None:
+        entries = await self._async_load()
+        if entries.pop(inverter_sn, None) is not None:
+            await self._async_save()
+
+    async def _async_load(self) -> dict[str, CachedInverterInfo]:
+        # config entries are set up concurrently and share the cache
+        async with self._load_lock:
+            if self._entries is None:
+                stored = await self._store.async_load() or {}
+                entries: dict[str, CachedInverterInfo] = {}
+                for inverter_sn, entry in stored.items():
+                    try:
+                        entries[inverter_sn] = CachedInverterInfo(
+                            inverter_info=InverterInfo(**entry["inverter_info"]),
+                            validated_at=datetime.fromisoformat(entry["validated_at"]),
+                        )
+                    except (KeyError, TypeError, ValueError) as error:
+                        _LOGGER.warning("Ignoring invalid cached inverter info of '%s': %s", inverter_sn, error)
+                self._entries = entries
+
+        return self._entries
+
+    async def _async_save(self) -> None:
+        entries = self._entries or {}
+        await self._store.async_save(
+            {
+                inverter_sn: {
+                    "inverter_info": asdict(entry.inverter_info),
+                    "validated_at": entry.validated_at.isoformat(),
+                }
+                for inverter_sn, entry in entries.items()
+            }
+        )
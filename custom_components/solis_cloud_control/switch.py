@@ -187,7 +187,7 @@ class AllowExportSwitch(SolisCloudControlEntity, SwitchEntity):
         inverter_allow_export: InverterAllowExport,
         inverter_storage_mode: InverterStorageMode,
     ) -> None:
-        super().__init__(coordinator, entity_description, inverter_allow_export.cid)
+        super().__init__(coordinator, entity_description, inverter_allow_export.cid, [inverter_storage_mode.cid])
         self.inverter_allow_export = inverter_allow_export
         self.inverter_storage_mode = inverter_storage_mode
 
@@ -201,9 +201,9 @@ class AllowExportSwitch(SolisCloudControlEntity, SwitchEntity):
         if not super().available:
             return False
 
-        storage_mode_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
-        storage_mode = StorageMode.create(storage_mode_value)
+        storage_mode = self.coordinator.data_view.storage_mode(self.inverter_storage_mode.cid)
         if storage_mode is None:
+            storage_mode_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
             _LOGGER.warning("Invalid '%s' storage mode: '%s'", self.name, storage_mode_value)
             return False
 
@@ -267,30 +267,7 @@ class SlotV2Switch(SolisCloudControlEntity, SwitchEntity):
         await self.coordinator.control(self.inverter_charge_discharge_slot.switch_cid, "0", old_value)
 
     def _calculate_old_value(self) -> str:
-        slots = self.inverter_charge_discharge_slots
-        data = self.coordinator.data
-
-        slot_states = {
-            slots.bit_charge_slot1: data.get(slots.charge_slot1.switch_cid) == "1",
-            slots.bit_charge_slot2: data.get(slots.charge_slot2.switch_cid) == "1",
-            slots.bit_charge_slot3: data.get(slots.charge_slot3.switch_cid) == "1",
-            slots.bit_charge_slot4: data.get(slots.charge_slot4.switch_cid) == "1",
-            slots.bit_charge_slot5: data.get(slots.charge_slot5.switch_cid) == "1",
-            slots.bit_charge_slot6: data.get(slots.charge_slot6.switch_cid) == "1",
-            slots.bit_discharge_slot1: data.get(slots.discharge_slot1.switch_cid) == "1",
-            slots.bit_discharge_slot2: data.get(slots.discharge_slot2.switch_cid) == "1",
-            slots.bit_discharge_slot3: data.get(slots.discharge_slot3.switch_cid) == "1",
-            slots.bit_discharge_slot4: data.get(slots.discharge_slot4.switch_cid) == "1",
-            slots.bit_discharge_slot5: data.get(slots.discharge_slot5.switch_cid) == "1",
-            slots.bit_discharge_slot6: data.get(slots.discharge_slot6.switch_cid) == "1",
-        }
-
-        value = 0
-        for bit_position, is_enabled in slot_states.items():
-            if is_enabled:
-                value |= 1 << bit_position
-
-        return str(value)
+        return self.coordinator.data_view.slot_switches_value(self.inverter_charge_discharge_slots)
 
 
 class BatteryReserveSwitch(SolisCloudControlEntity, SwitchEntity):
@@ -305,10 +282,9 @@ class BatteryReserveSwitch(SolisCloudControlEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool | None:
-        current_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
-
-        storage_mode = StorageMode.create(current_value)
+        storage_mode = self.coordinator.data_view.storage_mode(self.inverter_storage_mode.cid)
         if storage_mode is None:
+            current_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
             _LOGGER.warning("Invalid '%s' storage mode: '%s'", self.name, current_value)
             return None
 
@@ -357,10 +333,9 @@ class AllowGridChargingSwitch(SolisCloudControlEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool | None:
-        current_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
-
-        storage_mode = StorageMode.create(current_value)
+        storage_mode = self.coordinator.data_view.storage_mode(self.inverter_storage_mode.cid)
         if storage_mode is None:
+            current_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
             _LOGGER.warning("Invalid '%s' storage mode: '%s'", self.name, current_value)
             return None
 
@@ -409,10 +384,9 @@ class GridPeakShavingSwitch(SolisCloudControlEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool | None:
-        current_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
-
-        storage_mode = StorageMode.create(current_value)
+        storage_mode = self.coordinator.data_view.storage_mode(self.inverter_storage_mode.cid)
         if storage_mode is None:
+            current_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
             _LOGGER.warning("Invalid '%s' storage mode: '%s'", self.name, current_value)
             return None
 
@@ -423,9 +397,9 @@ class GridPeakShavingSwitch(SolisCloudControlEntity, SwitchEntity):
         if not super().available:
             return False
 
-        storage_mode_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
-        storage_mode = StorageMode.create(storage_mode_value)
+        storage_mode = self.coordinator.data_view.storage_mode(self.inverter_storage_mode.cid)
         if storage_mode is None:
+            storage_mode_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
             _LOGGER.warning("Invalid '%s' storage mode: '%s'", self.name, storage_mode_value)
             return False
 
@@ -474,10 +448,9 @@ class TimeOfUseSwitch(SolisCloudControlEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool | None:
-        current_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
-
-        storage_mode = StorageMode.create(current_value)
+        storage_mode = self.coordinator.data_view.storage_mode(self.inverter_storage_mode.cid)
         if storage_mode is None:
+            current_value = self.coordinator.data.get(self.inverter_storage_mode.cid)
             _LOGGER.warning("Invalid '%s' storage mode: '%s'", self.name, current_value)
             return None
 
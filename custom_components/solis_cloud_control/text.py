@@ -112,10 +112,11 @@ class TimeSlotV1Text(SolisCloudControlEntity, TextEntity):
 
     @property
     def native_value(self) -> str | None:
-        current_value = self.coordinator.data.get(self.inverter_charge_discharge_settings.cid)
-
-        charge_discharge_settings = ChargeDischargeSettings.create(current_value)
+        charge_discharge_settings = self.coordinator.data_view.charge_discharge_settings(
+            self.inverter_charge_discharge_settings.cid
+        )
         if charge_discharge_settings is None:
+            current_value = self.coordinator.data.get(self.inverter_charge_discharge_settings.cid)
             _LOGGER.warning("Invalid '%s' settings: '%s'", self.name, current_value)
             return None
 
@@ -127,22 +128,25 @@ class TimeSlotV1Text(SolisCloudControlEntity, TextEntity):
         return time_slot
 
     async def async_set_value(self, value: str) -> None:
-        current_value = self.coordinator.data.get(self.inverter_charge_discharge_settings.cid)
-        charge_discharge_settings = ChargeDischargeSettings.create(current_value)
+        # applied to the latest settings by the coordinator, together with other slot edits made meanwhile
+        def set_time_slot(current_value: str | None) -> str | None:
+            charge_discharge_settings = ChargeDischargeSettings.create(current_value)
 
-        if charge_discharge_settings is None:
-            _LOGGER.warning("Invalid '%s' settings: '%s'", self.name, current_value)
-            return None
+            if charge_discharge_settings is None:
+                _LOGGER.warning("Invalid '%s' settings: '%s'", self.name, current_value)
+                return None
 
-        if self.slot_type == "charge":
-            charge_discharge_settings.set_charge_time_slot(self.slot_number, value)
-        else:
-            charge_discharge_settings.set_discharge_time_slot(self.slot_number, value)
+            if self.slot_type == "charge":
+                charge_discharge_settings.set_charge_time_slot(self.slot_number, value)
+            else:
+                charge_discharge_settings.set_discharge_time_slot(self.slot_number, value)
+
+            value_str = charge_discharge_settings.to_value()
 
-        value_str = charge_discharge_settings.to_value()
+            _LOGGER.info("Set '%s' to %s (value: %s)", self.name, value, value_str)
+            return value_str
 
-        _LOGGER.info("Set '%s' to %s (value: %s)", self.name, value, value_str)
-        await self.coordinator.control(self.inverter_charge_discharge_settings.cid, value_str)
+        await self.coordinator.control_edit(self.inverter_charge_discharge_settings.cid, set_time_slot)
 
 
 class TimeSlotV2Text(SolisCloudControlEntity, TextEntity):
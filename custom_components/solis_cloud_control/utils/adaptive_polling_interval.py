@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+# weight of the latest cycle in the moving averages of failure rate and latency
+_SMOOTHING = 0.5
+
+_STRUGGLING_FAILURE_RATE = 0.5
+_STRUGGLING_LATENCY_SECONDS = 30.0
+
+_BACKOFF_FACTOR = 2
+
+
+class AdaptivePollingInterval:
+    def __init__(
+        self,
+        min_interval: timedelta,
+        default_interval: timedelta,
+        max_interval: timedelta,
+        struggling_latency_seconds: float = _STRUGGLING_LATENCY_SECONDS,
+    ) -> None:
+        if not min_interval <= default_interval <= max_interval:
+            raise ValueError(
+                f"Invalid polling interval bounds: {min_interval} <= {default_interval} <= {max_interval} expected"
+            )
+
+        self.min_interval = min_interval
+        self.default_interval = default_interval
+        self.max_interval = max_interval
+        self._struggling_latency_seconds = struggling_latency_seconds
+        self._interval = default_interval
+        self._failure_rate = 0.0
+        self._latency_seconds = 0.0
+
+    @property
+    def interval(self) -> timedelta:
+        return self._interval
+
+    @property
+    def failure_rate(self) -> float:
+        return self._failure_rate
+
+    @property
+    def latency_seconds(self) -> float:
+        return self._latency_seconds
+
+    @property
+    def is_struggling(self) -> bool:
+        return (
+            self._failure_rate >= _STRUGGLING_FAILURE_RATE or self._latency_seconds >= self._struggling_latency_seconds
+        )
+
+    def record_cycle(self, latency_seconds: float, failed: bool) -> timedelta:
+        self._failure_rate += _SMOOTHING * (float(failed) - self._failure_rate)
+        self._latency_seconds += _SMOOTHING * (latency_seconds - self._latency_seconds)
+
+        if self.is_struggling:
+            # polling a struggling API more often only adds to the retries it can't serve
+            self._interval = min(self._interval * _BACKOFF_FACTOR, self.max_interval)
+        elif self._interval < self.default_interval:
+            self._interval = min(self._interval * _BACKOFF_FACTOR, self.default_interval)
+        else:
+            self._interval = max(self._interval / _BACKOFF_FACTOR, self.default_interval)
+
+        return self._interval
+
+    def tighten(self) -> timedelta:
+        # only back to the default while the API is struggling, the minimum would just pile up retries
+        self._interval = self.default_interval if self.is_struggling else self.min_interval
+        return self._interval
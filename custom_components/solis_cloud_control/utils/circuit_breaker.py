@@ -0,0 +1,89 @@
+import logging
+import time
+from collections.abc import Callable
+from enum import StrEnum
+
+from custom_components.solis_cloud_control.utils.retry_policy import MonotonicTimeProvider
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+CircuitStateListener = Callable[[CircuitState], None]
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 60.0,
+        monotonic_time: MonotonicTimeProvider = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._monotonic_time = monotonic_time
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._listeners: list[CircuitStateListener] = []
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def add_listener(self, listener: CircuitStateListener) -> Callable[[], None]:
+        self._listeners.append(listener)
+
+        def remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove_listener
+
+    def try_acquire(self) -> bool:
+        if self._state == CircuitState.CLOSED:
+            return True
+
+        if self._state == CircuitState.OPEN:
+            if self._monotonic_time() - self._opened_at < self._reset_timeout_seconds:
+                return False
+            self._set_state(CircuitState.HALF_OPEN)
+
+        # a single probe tells if the API is back, the other requests keep failing fast meanwhile
+        if self._probe_in_flight:
+            return False
+
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        self._probe_in_flight = False
+        self._failures = 0
+        self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        self._probe_in_flight = False
+        self._failures += 1
+
+        if self._state == CircuitState.HALF_OPEN or self._failures >= self._failure_threshold:
+            self._opened_at = self._monotonic_time()
+            self._set_state(CircuitState.OPEN)
+
+    def release(self) -> None:
+        # the request ended without telling anything about the API, e.g. it was cancelled
+        self._probe_in_flight = False
+
+    def _set_state(self, state: CircuitState) -> None:
+        if state == self._state:
+            return
+
+        _LOGGER.info("Circuit breaker state changed: %s -> %s", self._state, state)
+        self._state = state
+        for listener in list(self._listeners):
+            listener(state)
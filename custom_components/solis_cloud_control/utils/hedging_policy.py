@@ -0,0 +1,34 @@
+from collections import deque
+
+
+class HedgingPolicy:
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        window_size: int = 64,
+        min_samples: int = 16,
+        min_delay_seconds: float = 1.0,
+        max_delay_seconds: float = 10.0,
+    ) -> None:
+        if not 0 < percentile <= 100 or min_samples < 1 or window_size < min_samples:
+            raise ValueError("Invalid hedging policy parameters")
+
+        self._percentile = percentile
+        self._window_size = window_size
+        self._min_samples = min_samples
+        self._min_delay_seconds = min_delay_seconds
+        self._max_delay_seconds = max_delay_seconds
+        self._latencies: dict[str, deque[float]] = {}
+
+    def record_latency(self, key: str, latency_seconds: float) -> None:
+        self._latencies.setdefault(key, deque(maxlen=self._window_size)).append(latency_seconds)
+
+    def delay_seconds(self, key: str) -> float | None:
+        # hedge only the tail, once enough latencies are known to tell where it starts
+        latencies = self._latencies.get(key)
+        if latencies is None or len(latencies) < self._min_samples:
+            return None
+
+        sorted_latencies = sorted(latencies)
+        index = min(len(sorted_latencies) - 1, int(len(sorted_latencies) * self._percentile / 100))
+        return min(self._max_delay_seconds, max(self._min_delay_seconds, sorted_latencies[index]))
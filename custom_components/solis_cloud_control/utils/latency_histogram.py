@@ -0,0 +1,48 @@
+import math
+from bisect import bisect_left
+from collections.abc import Sequence
+
+# from the fast answers up to the request timeout, the last bucket takes anything slower
+_DEFAULT_BUCKET_BOUNDS_SECONDS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+
+class LatencyHistogram:
+    # fixed buckets keep the memory constant, however many latencies are recorded
+    def __init__(self, bucket_bounds_seconds: Sequence[float] = _DEFAULT_BUCKET_BOUNDS_SECONDS) -> None:
+        self._bucket_bounds_seconds = tuple(bucket_bounds_seconds)
+        self._bucket_counts = [0] * (len(self._bucket_bounds_seconds) + 1)
+        self._count = 0
+        self._sum_seconds = 0.0
+        self._max_seconds = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean_seconds(self) -> float | None:
+        return self._sum_seconds / self._count if self._count else None
+
+    @property
+    def max_seconds(self) -> float | None:
+        return self._max_seconds if self._count else None
+
+    def record(self, latency_seconds: float) -> None:
+        self._bucket_counts[bisect_left(self._bucket_bounds_seconds, latency_seconds)] += 1
+        self._count += 1
+        self._sum_seconds += latency_seconds
+        self._max_seconds = max(self._max_seconds, latency_seconds)
+
+    def percentile(self, percentile: float) -> float | None:
+        # the upper bound of the bucket holding the percentile, never above the slowest latency seen
+        if not self._count:
+            return None
+
+        rank = max(1, math.ceil(self._count * percentile / 100))
+        cumulative_count = 0
+        for index, bucket_count in enumerate(self._bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= rank and index < len(self._bucket_bounds_seconds):
+                return min(self._bucket_bounds_seconds[index], self._max_seconds)
+
+        return self._max_seconds
@@ -0,0 +1,96 @@
+import math
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from custom_components.solis_cloud_control.utils.retry_policy import RandomProvider
+
+# polls are jittered within this share of their slot, so neighbouring slots never overlap
+_JITTER_SLOT_RATIO = 0.2
+
+
+@dataclass(eq=False)
+class _ScheduledPoll:
+    poll: CALLBACK_TYPE
+    interval: timedelta
+    polled_at: datetime
+    due_at: datetime
+    phase: float = 0.0
+
+
+class PollingScheduler:
+    def __init__(self, hass: HomeAssistant, random_value: RandomProvider = random.random) -> None:
+        self._hass = hass
+        self._random_value = random_value
+        self._epoch = dt_util.utcnow()
+        self._polls: list[_ScheduledPoll] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(self, poll: CALLBACK_TYPE, interval: timedelta) -> CALLBACK_TYPE:
+        # the setup does the first poll, the scheduler takes over from there
+        now = dt_util.utcnow()
+        scheduled_poll = _ScheduledPoll(poll, interval, polled_at=now, due_at=now)
+        self._polls.append(scheduled_poll)
+        self._rebalance()
+
+        @callback
+        def unregister() -> None:
+            if scheduled_poll in self._polls:
+                self._polls.remove(scheduled_poll)
+                self._rebalance()
+
+        return unregister
+
+    @callback
+    def async_update_interval(self, poll: CALLBACK_TYPE, interval: timedelta) -> None:
+        scheduled_poll = next((scheduled_poll for scheduled_poll in self._polls if scheduled_poll.poll == poll), None)
+        if scheduled_poll is None:
+            return
+
+        scheduled_poll.interval = interval
+        self._schedule_next_poll(scheduled_poll)
+        self._schedule_timer()
+
+    @callback
+    def _rebalance(self) -> None:
+        # every member owns an equal slot of the interval, so the polls of an account are spread evenly
+        for scheduled_poll in self._polls:
+            self._schedule_next_poll(scheduled_poll)
+        self._schedule_timer()
+
+    def _schedule_next_poll(self, scheduled_poll: _ScheduledPoll) -> None:
+        slot = self._polls.index(scheduled_poll)
+        scheduled_poll.phase = (slot + self._random_value() * _JITTER_SLOT_RATIO) / len(self._polls)
+
+        # the next occurrence of the phase, at least half an interval after the last poll
+        interval_seconds = scheduled_poll.interval.total_seconds()
+        earliest_at = scheduled_poll.polled_at + scheduled_poll.interval / 2
+        cycles = math.ceil((earliest_at - self._epoch).total_seconds() / interval_seconds - scheduled_poll.phase)
+        scheduled_poll.due_at = self._epoch + scheduled_poll.interval * (cycles + scheduled_poll.phase)
+
+    @callback
+    def _schedule_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        if self._polls:
+            due_at = min(scheduled_poll.due_at for scheduled_poll in self._polls)
+            self._unsub_timer = async_track_point_in_utc_time(self._hass, self._handle_timer, due_at)
+
+    @callback
+    def _handle_timer(self, now: datetime) -> None:
+        self._unsub_timer = None
+
+        for scheduled_poll in list(self._polls):
+            if scheduled_poll.due_at <= now:
+                scheduled_poll.polled_at = now
+                self._schedule_next_poll(scheduled_poll)
+                scheduled_poll.poll()
+
+        self._schedule_timer()
@@ -0,0 +1,89 @@
+import asyncio
+import time
+from collections import deque
+from enum import IntEnum
+
+from custom_components.solis_cloud_control.utils.retry_policy import MonotonicTimeProvider, SleepFunction
+
+
+class RequestPriority(IntEnum):
+    CONTROL = 0
+    READ_BACK = 1
+    POLL = 2
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: int,
+        monotonic_time: MonotonicTimeProvider = time.monotonic,
+        sleep: SleepFunction = asyncio.sleep,
+    ) -> None:
+        self._requests_per_second = requests_per_second
+        self._burst = burst
+        self._monotonic_time = monotonic_time
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._refilled_at = monotonic_time()
+        self._queues: dict[RequestPriority, dict[str, deque[asyncio.Future[None]]]] = {
+            priority: {} for priority in RequestPriority
+        }
+        self._dispatcher: asyncio.Task[None] | None = None
+
+    async def acquire(self, queue_key: str = "", priority: RequestPriority = RequestPriority.READ_BACK) -> None:
+        self._refill()
+
+        if not self._has_waiters() and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._queues[priority].setdefault(queue_key, deque()).append(future)
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = loop.create_task(self._dispatch())
+
+        await future
+
+    def try_acquire(self) -> bool:
+        # take a token only if it is spare, never ahead of the queued requests
+        self._refill()
+
+        if self._has_waiters() or self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        return True
+
+    async def _dispatch(self) -> None:
+        while self._has_waiters():
+            self._refill()
+
+            if self._tokens < 1:
+                await self._sleep((1 - self._tokens) / self._requests_per_second)
+                continue
+
+            # interactive requests go first, background polling only gets the tokens left over
+            queues = next(queues for queues in self._queues.values() if queues)
+
+            # serve queues round-robin, so a busy inverter can't starve the others sharing the same API key
+            queue_key, queue = next(iter(queues.items()))
+            del queues[queue_key]
+            future = queue.popleft()
+            if queue:
+                queues[queue_key] = queue
+
+            if not future.done():
+                self._tokens -= 1
+                future.set_result(None)
+
+    def _has_waiters(self) -> bool:
+        return any(self._queues.values())
+
+    def _refill(self) -> None:
+        now = self._monotonic_time()
+        elapsed_time = now - self._refilled_at
+        self._refilled_at = now
+        self._tokens = min(self._burst, self._tokens + elapsed_time * self._requests_per_second)
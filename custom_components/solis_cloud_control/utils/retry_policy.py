@@ -1,7 +1,10 @@
 import asyncio
 import logging
+import random
 import time
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import StrEnum
 from typing import Any, Protocol
 
 _LOGGER = logging.getLogger(__name__)
@@ -15,6 +18,72 @@ class SleepFunction(Protocol):
     def __call__(self, delay: float) -> Awaitable[None]: ...
 
 
+class RandomProvider(Protocol):
+    def __call__(self) -> float: ...
+
+
+OperationClosure = Callable[[], Awaitable[Any]]
+
+
+class RetryDecision(StrEnum):
+    RETRYABLE = "retryable"
+    NON_RETRYABLE = "non_retryable"
+    THROTTLED = "throttled"
+
+
+@dataclass(frozen=True)
+class ErrorClassification:
+    decision: RetryDecision
+    retry_after_seconds: float | None = None
+
+
+class ErrorClassifier(Protocol):
+    def __call__(self, error: Exception) -> ErrorClassification: ...
+
+
+class RetryJitter(StrEnum):
+    NONE = "none"
+    FULL = "full"
+    DECORRELATED = "decorrelated"
+
+
+class RetryStopReason(StrEnum):
+    SUCCEEDED = "succeeded"
+    NON_RETRYABLE = "non_retryable"
+    RETRY_TIME_EXCEEDED = "retry_time_exceeded"
+
+
+@dataclass(frozen=True)
+class RetryResult:
+    value: Any
+    error: Exception | None
+    stop_reason: RetryStopReason
+    attempts: int
+    elapsed_time: float
+
+
+class Deadline:
+    # a single time budget shared by all the attempts and waits of an operation
+    def __init__(self, timeout_seconds: float, monotonic_time: MonotonicTimeProvider = time.monotonic) -> None:
+        self._monotonic_time = monotonic_time
+        self._expires_at = monotonic_time() + timeout_seconds
+
+    @property
+    def remaining_seconds(self) -> float:
+        return max(0.0, self._expires_at - self._monotonic_time())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining_seconds <= 0
+
+    def cap(self, timeout_seconds: float) -> float:
+        return min(timeout_seconds, self.remaining_seconds)
+
+
+def retry_all_errors(error: Exception) -> ErrorClassification:  # noqa: ARG001
+    return ErrorClassification(RetryDecision.RETRYABLE)
+
+
 class RetryPolicy:
     def __init__(
         self,
@@ -23,33 +92,69 @@ class RetryPolicy:
         delay_multiplier: float = 2.0,
         monotonic_time: MonotonicTimeProvider = time.monotonic,
         sleep: SleepFunction = asyncio.sleep,
+        classify_error: ErrorClassifier = retry_all_errors,
+        jitter: RetryJitter = RetryJitter.NONE,
+        random_value: RandomProvider = random.random,
     ) -> None:
         self._initial_delay_seconds = initial_delay_seconds
         self._delay_multiplier = delay_multiplier
         self._retryable_exception = retryable_exception
         self._monotonic_time = monotonic_time
         self._sleep = sleep
+        self._classify_error = classify_error
+        self._jitter = jitter
+        self._random_value = random_value
 
     async def __call__(
         self,
-        operation_closure: Callable[[], Awaitable[Any]],
+        operation_closure: OperationClosure,
         max_retry_time: float,
+        deadline: Deadline | None = None,
     ) -> Any:  # noqa: ANN401
+        result = await self.run(operation_closure, max_retry_time, deadline)
+        if result.error is not None:
+            raise result.error
+        return result.value
+
+    async def run(
+        self,
+        operation_closure: OperationClosure,
+        max_retry_time: float,
+        deadline: Deadline | None = None,
+    ) -> RetryResult:
         start_time = self._monotonic_time()
+        backoff_delay = self._initial_delay_seconds
         delay = self._initial_delay_seconds
 
         attempt = 0
 
         while True:
+            attempt += 1
             try:
-                return await operation_closure()
+                value = await operation_closure()
             except self._retryable_exception as err:
                 elapsed_time = self._monotonic_time() - start_time
+                remaining_time = max_retry_time - elapsed_time
+                if deadline is not None:
+                    remaining_time = min(remaining_time, deadline.remaining_seconds)
+                classification = self._classify_error(err)
+
+                if classification.decision == RetryDecision.NON_RETRYABLE:
+                    return self._stop(err, RetryStopReason.NON_RETRYABLE, attempt, elapsed_time)
+
+                if remaining_time <= 0:
+                    return self._stop(err, RetryStopReason.RETRY_TIME_EXCEEDED, attempt, elapsed_time)
 
-                if elapsed_time >= max_retry_time:
-                    raise err
+                delay = self._jittered_delay(backoff_delay, delay)
+                backoff_delay *= self._delay_multiplier
+
+                retry_after = classification.retry_after_seconds
+                if classification.decision == RetryDecision.THROTTLED and retry_after is not None:
+                    # retrying before the server is ready again would only count against the quota
+                    if retry_after > remaining_time:
+                        return self._stop(err, RetryStopReason.RETRY_TIME_EXCEEDED, attempt, elapsed_time)
+                    delay = max(delay, retry_after)
 
-                attempt += 1
                 _LOGGER.warning(
                     "Retrying due to error: %s (attempt %d, elapsed time: %.1fs)",
                     str(err),
@@ -57,6 +162,23 @@ class RetryPolicy:
                     elapsed_time,
                 )
 
-                delay = min(delay, max_retry_time - elapsed_time)
-                await self._sleep(delay)
-                delay *= self._delay_multiplier
+                await self._sleep(min(delay, remaining_time))
+            else:
+                elapsed_time = self._monotonic_time() - start_time
+                return RetryResult(value, None, RetryStopReason.SUCCEEDED, attempt, elapsed_time)
+
+    def _jittered_delay(self, backoff_delay: float, previous_delay: float) -> float:
+        # jitter keeps the retries of clients failing at the same moment from hitting the API in sync
+        if self._jitter == RetryJitter.FULL:
+            return self._random_value() * backoff_delay
+        if self._jitter == RetryJitter.DECORRELATED:
+            max_delay = previous_delay * self._delay_multiplier
+            return self._initial_delay_seconds + self._random_value() * (max_delay - self._initial_delay_seconds)
+        return backoff_delay
+
+    @staticmethod
+    def _stop(error: Exception, stop_reason: RetryStopReason, attempts: int, elapsed_time: float) -> RetryResult:
+        _LOGGER.debug(
+            "Giving up after %d attempts (%s, elapsed time: %.1fs): %s", attempts, stop_reason, elapsed_time, error
+        )
+        return RetryResult(None, error, stop_reason, attempts, elapsed_time)
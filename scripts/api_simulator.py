@@ -0,0 +1,263 @@
+import argparse
+import asyncio
+import json
+import logging
+import random
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+
+from aiohttp import web
+
+from custom_components.solis_cloud_control.api.solis_api_utils import digest, sign_authorization
+
+_LOGGER = logging.getLogger(__name__)
+
+_READ_ENDPOINT = "/v2/api/atRead"
+_READ_BATCH_ENDPOINT = "/v2/api/atReadBatch"
+_CONTROL_ENDPOINT = "/v2/api/control"
+_INVERTER_LIST_ENDPOINT = "/v1/api/inverterList"
+_INVERTER_DETAILS_ENDPOINT = "/v1/api/inverterDetail"
+
+_INVALID_AUTH_CODE = "Z0001"
+_SIMULATED_ERROR_CODE = "S0001"
+_UNKNOWN_INVERTER_CODE = "S0002"
+
+# read by the integration to tell TOU v2 hybrid inverters apart
+_TOU_V2_MODE_CID = 6798
+_TOU_V2_MODE = "43605"
+
+
+@dataclass(frozen=True)
+class SimulatorProfile:
+    latency_seconds: float = 0.0
+    latency_jitter_seconds: float = 0.0
+    error_rate: float = 0.0
+    server_error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after_seconds: int = 1
+    timeout_rate: float = 0.0
+    # longer than the client timeout, the request is answered too late to be of any use
+    timeout_seconds: float = 60.0
+
+
+PROFILES = {
+    "ideal": SimulatorProfile(),
+    "production": SimulatorProfile(
+        latency_seconds=0.8,
+        latency_jitter_seconds=1.5,
+        error_rate=0.02,
+        server_error_rate=0.01,
+        throttle_rate=0.01,
+        timeout_rate=0.005,
+    ),
+    "degraded": SimulatorProfile(
+        latency_seconds=3.0,
+        latency_jitter_seconds=8.0,
+        error_rate=0.1,
+        server_error_rate=0.1,
+        throttle_rate=0.1,
+        timeout_rate=0.05,
+    ),
+    "outage": SimulatorProfile(server_error_rate=1.0),
+}
+
+
+@dataclass
+class VirtualInverter:
+    serial_number: str
+    details: dict[str, str | int]
+    values: dict[int, str] = field(default_factory=dict)
+
+    def read(self, cid: int) -> str:
+        # unknown CIDs read as zero, as unset registers do
+        return self.values.get(cid, "0")
+
+
+def create_string_inverter(serial_number: str) -> VirtualInverter:
+    return VirtualInverter(
+        serial_number=serial_number,
+        details={
+            "sn": serial_number,
+            "model": "0200",
+            "version": "3f1c",
+            "machine": "S6-GR1P5K",
+            "energyStorageControl": "0",
+            "collectorModel": "WiFi",
+            "power": 5,
+            "powerStr": "kW",
+        },
+    )
+
+
+def create_hybrid_inverter(serial_number: str, tou_v2: bool = True) -> VirtualInverter:
+    return VirtualInverter(
+        serial_number=serial_number,
+        details={
+            "sn": serial_number,
+            "model": "3331",
+            "version": "4b02",
+            "machine": "S6-EH3P10K-H",
+            "energyStorageControl": "1",
+            "smartSupport": "1",
+            "generatorSupport": "1",
+            "collectorModel": "WiFi",
+            "power": 10,
+            "powerStr": "kW",
+            "parallelNumber": "1",
+            "parallelBattery": "1",
+        },
+        values={_TOU_V2_MODE_CID: _TOU_V2_MODE if tou_v2 else "0"},
+    )
+
+
+def create_inverters(string_inverter_count: int, hybrid_inverter_count: int) -> list[VirtualInverter]:
+    return [create_string_inverter(f"SIMSTRING{index:04d}") for index in range(string_inverter_count)] + [
+        create_hybrid_inverter(f"SIMHYBRID{index:04d}") for index in range(hybrid_inverter_count)
+    ]
+
+
+class SolisCloudSimulator:
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        inverters: Iterable[VirtualInverter],
+        profile: SimulatorProfile = PROFILES["ideal"],
+        random_value: Callable[[], float] = random.random,
+    ) -> None:
+        self._api_key = api_key
+        self._api_secret = api_secret
+        self._inverters = {inverter.serial_number: inverter for inverter in inverters}
+        self._random_value = random_value
+        self.profile = profile
+        self.request_count = 0
+
+    def inverter(self, serial_number: str) -> VirtualInverter:
+        return self._inverters[serial_number]
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post(_READ_ENDPOINT, self._handle(self._read))
+        app.router.add_post(_READ_BATCH_ENDPOINT, self._handle(self._read_batch))
+        app.router.add_post(_CONTROL_ENDPOINT, self._handle(self._control))
+        app.router.add_post(_INVERTER_LIST_ENDPOINT, self._handle(self._inverter_list))
+        app.router.add_post(_INVERTER_DETAILS_ENDPOINT, self._handle(self._inverter_details))
+        return app
+
+    def _handle(self, operation: Callable[[dict], object]) -> Callable[[web.Request], Awaitable[web.StreamResponse]]:
+        async def handler(request: web.Request) -> web.StreamResponse:
+            self.request_count += 1
+            body = await request.read()
+
+            if not self._is_signed(request, body):
+                return _api_response(_INVALID_AUTH_CODE, "Invalid signature")
+
+            failure = await self._simulate_conditions()
+            if failure is not None:
+                return failure
+
+            payload = json.loads(body)
+            try:
+                return _api_response("0", "Success", operation(payload))
+            except KeyError as err:
+                return _api_response(_UNKNOWN_INVERTER_CODE, f"Unknown inverter: {err}")
+
+        return handler
+
+    def _is_signed(self, request: web.Request, body: bytes) -> bool:
+        # the same signature as the cloud checks, over the exact bytes received
+        content_md5 = request.headers.get("Content-MD5", "")
+        if content_md5 != digest(body):
+            _LOGGER.warning("Content-MD5 does not match the body of '%s' request", request.path)
+            return False
+
+        authorization_str = "\n".join(
+            [
+                "POST",
+                content_md5,
+                request.headers.get("Content-Type", ""),
+                request.headers.get("Date", ""),
+                request.path,
+            ]
+        )
+        expected_authorization = f"API {self._api_key}:{sign_authorization(self._api_secret, authorization_str)}"
+        if request.headers.get("Authorization") != expected_authorization:
+            _LOGGER.warning("Invalid authorization of '%s' request", request.path)
+            return False
+
+        return True
+
+    async def _simulate_conditions(self) -> web.StreamResponse | None:
+        profile = self.profile
+        await asyncio.sleep(profile.latency_seconds + profile.latency_jitter_seconds * self._random_value())
+
+        # a single draw, the rates add up to the share of failed requests
+        draw = self._random_value()
+        if (draw := draw - profile.timeout_rate) < 0:
+            await asyncio.sleep(profile.timeout_seconds)
+            return web.Response(status=504, text="Gateway Timeout")
+        if (draw := draw - profile.throttle_rate) < 0:
+            return web.Response(
+                status=429, text="Too Many Requests", headers={"Retry-After": str(profile.retry_after_seconds)}
+            )
+        if (draw := draw - profile.server_error_rate) < 0:
+            return web.Response(status=502, text="Bad Gateway")
+        if draw - profile.error_rate < 0:
+            return _api_response(_SIMULATED_ERROR_CODE, "Simulated error")
+
+        return None
+
+    def _read(self, payload: dict) -> dict:
+        cid = int(payload["cid"])
+        return {"msg": self._inverters[payload["inverterSn"]].read(cid)}
+
+    def _read_batch(self, payload: dict) -> list[list[dict]]:
+        inverter = self._inverters[payload["inverterSn"]]
+        cids = [int(cid) for cid in str(payload["cids"]).split(",")]
+        return [[{"cid": cid, "msg": inverter.read(cid)} for cid in cids]]
+
+    def _control(self, payload: dict) -> list[dict]:
+        inverter = self._inverters[payload["inverterSn"]]
+        cid = int(payload["cid"])
+        inverter.values[cid] = str(payload["value"])
+        return [{"code": "0", "msg": inverter.values[cid]}]
+
+    def _inverter_list(self, payload: dict) -> dict:  # noqa: ARG002
+        records = [{"sn": serial_number, "stationName": "Simulated Station"} for serial_number in self._inverters]
+        return {"page": {"records": records, "total": len(records)}}
+
+    def _inverter_details(self, payload: dict) -> dict:
+        return self._inverters[payload["sn"]].details
+
+
+def _api_response(code: str, msg: str, data: object = None) -> web.Response:
+    response: dict[str, object] = {"code": code, "msg": msg}
+    if data is not None:
+        response["data"] = data
+    return web.json_response(response)
+
+
+#
+# uv run -m scripts.api_simulator --profile production --hybrid-inverters 10
+# SOLIS_API_BASE_URL=http://localhost:13333 uv run -m scripts.api_tester
+#
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Local stand-in for the SolisCloud API")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=13333)
+    parser.add_argument("--api-key", default="your_api_key")
+    parser.add_argument("--api-secret", default="your_api_secret")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="ideal")
+    parser.add_argument("--string-inverters", type=int, default=1)
+    parser.add_argument("--hybrid-inverters", type=int, default=1)
+    args = parser.parse_args()
+
+    simulator = SolisCloudSimulator(
+        args.api_key,
+        args.api_secret,
+        create_inverters(args.string_inverters, args.hybrid_inverters),
+        PROFILES[args.profile],
+    )
+    web.run_app(simulator.create_app(), host=args.host, port=args.port)
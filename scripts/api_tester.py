@@ -34,11 +34,13 @@ if __name__ == "__main__":
     api_key = os.environ.get("SOLIS_API_KEY", "your_api_key")
     api_secret = os.environ.get("SOLIS_API_SECRET", "your_api_secret")
     inverter_sn = os.environ.get("SOLIS_INVERTER_SN", "your_inverter_sn")
+    # point to scripts.api_simulator to work offline
+    base_url = os.environ.get("SOLIS_API_BASE_URL", API_BASE_URL)
 
     async def _run_script() -> None:
         async with aiohttp.ClientSession() as session:
             client = SolisCloudControlApiClient(
-                base_url=API_BASE_URL,
+                base_url=base_url,
                 api_key=api_key,
                 api_token=api_secret,
                 session=session,
@@ -1,7 +1,36 @@
+import asyncio
+import json
+import logging
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiohttp
 import pytest
 from aiohttp import web
 
-from custom_components.solis_cloud_control.api.solis_api import SolisCloudControlApiClient, SolisCloudControlApiError
+from custom_components.solis_cloud_control.api.solis_api import (
+    SolisCloudControlApiCircuitOpenError,
+    SolisCloudControlApiClient,
+    SolisCloudControlApiControlRejectedError,
+    SolisCloudControlApiDeadlineExceededError,
+    SolisCloudControlApiError,
+    SolisCloudControlApiPartialReadError,
+    SolisCloudControlApiTimeoutError,
+    _error_code,
+    _parse_retry_after,
+    _PrettyJson,
+    classify_api_error,
+)
+from custom_components.solis_cloud_control.api.solis_api_utils import digest
+from custom_components.solis_cloud_control.utils.circuit_breaker import CircuitBreaker, CircuitState
+from custom_components.solis_cloud_control.utils.hedging_policy import HedgingPolicy
+from custom_components.solis_cloud_control.utils.rate_limiter import RateLimiter, RequestPriority
+from custom_components.solis_cloud_control.utils.retry_policy import (
+    Deadline,
+    ErrorClassification,
+    RetryDecision,
+    RetryPolicy,
+)
 
 
 @pytest.fixture
@@ -39,6 +68,31 @@ async def test_read(create_api_client, aiohttp_client):
     assert result == any_result
 
 
+async def test_read_acquires_rate_limiter(aiohttp_client):
+    any_inverter_sn = "any inverter sn"
+
+    async def mock_read_endpoint(request):
+        return web.json_response({"code": "0", "msg": "Success", "data": {"msg": "any result"}})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint)
+
+    client = await aiohttp_client(app)
+    rate_limiter = Mock()
+    rate_limiter.acquire = AsyncMock()
+    api_client = SolisCloudControlApiClient(
+        base_url="",
+        api_key="any key",
+        api_token="any token",
+        session=client,
+        rate_limiter=rate_limiter,
+    )
+
+    await api_client.read(inverter_sn=any_inverter_sn, cid=-1, max_retry_time=0, priority=RequestPriority.POLL)
+
+    rate_limiter.acquire.assert_awaited_once_with(any_inverter_sn, RequestPriority.POLL)
+
+
 async def test_read_batch(create_api_client, aiohttp_client):
     any_inverter_sn = "any inverter sn"
     any_cids = [-1, -2, -3]
@@ -62,6 +116,300 @@ async def test_read_batch(create_api_client, aiohttp_client):
     assert result == any_results
 
 
+@pytest.fixture
+def no_sleep_retry_policy():
+    async def no_sleep(delay: float) -> None:
+        pass
+
+    return RetryPolicy(retryable_exception=SolisCloudControlApiError, sleep=no_sleep)
+
+
+async def test_read_batch_splits_cids_into_chunks(aiohttp_client):
+    any_inverter_sn = "any inverter sn"
+    any_results = {-1: "any result 1", -2: "any result 2", -3: "any result 3"}
+    requested_cids: list[str] = []
+
+    async def mock_read_batch_endpoint(request):
+        body = await request.json()
+        requested_cids.append(body.get("cids"))
+        cids = [int(cid) for cid in body.get("cids").split(",")]
+        data = [[{"cid": cid, "msg": any_results[cid]} for cid in cids]]
+        return web.json_response({"code": "0", "msg": "Success", "data": data})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_BATCH_ENDPOINT, mock_read_batch_endpoint)
+
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient(
+        base_url="",
+        api_key="any key",
+        api_token="any token",
+        session=client,
+        read_batch_chunk_size=2,
+    )
+
+    result = await api_client.read_batch(inverter_sn=any_inverter_sn, cids=list(any_results), max_retry_time=0)
+
+    assert result == any_results
+    assert sorted(requested_cids) == ["-1,-2", "-3"]
+
+
+async def test_read_batch_retries_failed_chunks_only(aiohttp_client, no_sleep_retry_policy):
+    any_inverter_sn = "any inverter sn"
+    any_results = {-1: "any result 1", -2: "any result 2", -3: "any result 3"}
+    requested_cids: list[str] = []
+
+    async def mock_read_batch_endpoint(request):
+        body = await request.json()
+        requested_cids.append(body.get("cids"))
+        if body.get("cids") == "-3" and requested_cids.count("-3") == 1:
+            return web.json_response({"code": "100", "msg": "API Error"})
+        cids = [int(cid) for cid in body.get("cids").split(",")]
+        data = [[{"cid": cid, "msg": any_results[cid]} for cid in cids]]
+        return web.json_response({"code": "0", "msg": "Success", "data": data})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_BATCH_ENDPOINT, mock_read_batch_endpoint)
+
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient(
+        base_url="",
+        api_key="any key",
+        api_token="any token",
+        session=client,
+        retry_policy=no_sleep_retry_policy,
+        read_batch_chunk_size=2,
+    )
+
+    result = await api_client.read_batch(inverter_sn=any_inverter_sn, cids=list(any_results), max_retry_time=10)
+
+    assert result == any_results
+    assert sorted(requested_cids) == ["-1,-2", "-3", "-3"]
+
+
+async def test_read_batch_returns_partial_result_on_error(aiohttp_client):
+    any_inverter_sn = "any inverter sn"
+
+    async def mock_read_batch_endpoint(request):
+        body = await request.json()
+        if body.get("cids") == "-3":
+            return web.json_response({"code": "100", "msg": "API Error"})
+        data = [[{"cid": -1, "msg": "any result 1"}, {"cid": -2, "msg": "any result 2"}]]
+        return web.json_response({"code": "0", "msg": "Success", "data": data})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_BATCH_ENDPOINT, mock_read_batch_endpoint)
+
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient(
+        base_url="",
+        api_key="any key",
+        api_token="any token",
+        session=client,
+        read_batch_chunk_size=2,
+    )
+
+    with pytest.raises(SolisCloudControlApiPartialReadError) as excinfo:
+        await api_client.read_batch(inverter_sn=any_inverter_sn, cids=[-1, -2, -3], max_retry_time=0)
+
+    assert excinfo.value.result == {-1: "any result 1", -2: "any result 2"}
+
+
+async def test_read_batch_bisects_chunk_on_timeout(aiohttp_client, no_sleep_retry_policy):
+    any_inverter_sn = "any inverter sn"
+    any_results = {-1: "any result 1", -2: "any result 2", -3: "any result 3", -4: "any result 4"}
+    requested_cids: list[str] = []
+
+    async def mock_read_batch_endpoint(request):
+        body = await request.json()
+        requested_cids.append(body.get("cids"))
+        cids = [int(cid) for cid in body.get("cids").split(",")]
+        if len(cids) > 2:
+            await asyncio.sleep(1)
+        data = [[{"cid": cid, "msg": any_results[cid]} for cid in cids]]
+        return web.json_response({"code": "0", "msg": "Success", "data": data})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_BATCH_ENDPOINT, mock_read_batch_endpoint)
+
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient(
+        base_url="",
+        api_key="any key",
+        api_token="any token",
+        session=client,
+        timeout=0.1,
+        retry_policy=no_sleep_retry_policy,
+        read_batch_chunk_size=4,
+    )
+
+    result = await api_client.read_batch(inverter_sn=any_inverter_sn, cids=list(any_results), max_retry_time=10)
+
+    assert result == any_results
+    assert requested_cids[0] == "-1,-2,-3,-4"
+    assert sorted(requested_cids[1:]) == ["-1,-2", "-3,-4"]
+
+    # the next call starts again from the configured chunk size
+    requested_cids.clear()
+    await api_client.read_batch(inverter_sn=any_inverter_sn, cids=list(any_results), max_retry_time=10)
+    assert requested_cids[0] == "-1,-2,-3,-4"
+
+
+async def test_read_coalesces_identical_in_flight_reads(create_api_client, aiohttp_client):
+    any_inverter_sn = "any inverter sn"
+    any_cid = -1
+    any_result = "any result"
+    requests_count = 0
+    response_gate = asyncio.Event()
+
+    async def mock_read_endpoint(request):
+        nonlocal requests_count
+        requests_count += 1
+        await response_gate.wait()
+        return web.json_response({"code": "0", "msg": "Success", "data": {"msg": any_result}})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint)
+
+    client = await aiohttp_client(app)
+    api_client = create_api_client(client)
+
+    read1 = asyncio.create_task(api_client.read(inverter_sn=any_inverter_sn, cid=any_cid, max_retry_time=0))
+    read2 = asyncio.create_task(api_client.read(inverter_sn=any_inverter_sn, cid=any_cid, max_retry_time=0))
+    await asyncio.sleep(0.1)
+    response_gate.set()
+
+    assert await read1 == any_result
+    assert await read2 == any_result
+    assert requests_count == 1
+
+
+async def test_read_joins_in_flight_read_batch_covering_cid(create_api_client, aiohttp_client):
+    any_inverter_sn = "any inverter sn"
+    any_results = {-1: "any result 1", -2: "any result 2"}
+    response_gate = asyncio.Event()
+
+    async def mock_read_batch_endpoint(request):
+        await response_gate.wait()
+        data = [[{"cid": cid, "msg": msg} for cid, msg in any_results.items()]]
+        return web.json_response({"code": "0", "msg": "Success", "data": data})
+
+    async def mock_read_endpoint(request):
+        raise AssertionError("read should be served by the in-flight read batch")
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_BATCH_ENDPOINT, mock_read_batch_endpoint)
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint)
+
+    client = await aiohttp_client(app)
+    api_client = create_api_client(client)
+
+    read_batch = asyncio.create_task(
+        api_client.read_batch(inverter_sn=any_inverter_sn, cids=list(any_results), max_retry_time=0)
+    )
+    await asyncio.sleep(0)
+    read = asyncio.create_task(api_client.read(inverter_sn=any_inverter_sn, cid=-2, max_retry_time=0))
+    await asyncio.sleep(0.1)
+    response_gate.set()
+
+    assert await read_batch == any_results
+    assert await read == "any result 2"
+    assert api_client._in_flight_reads == {}
+
+
+async def test_read_joined_to_partly_failed_read_batch_returns_its_cid(aiohttp_client):
+    any_inverter_sn = "any inverter sn"
+    response_gate = asyncio.Event()
+
+    async def mock_read_batch_endpoint(request):
+        await response_gate.wait()
+        body = await request.json()
+        if body.get("cids") == "-3":
+            return web.json_response({"code": "100", "msg": "API Error"})
+        data = [[{"cid": -1, "msg": "any result 1"}, {"cid": -2, "msg": "any result 2"}]]
+        return web.json_response({"code": "0", "msg": "Success", "data": data})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_BATCH_ENDPOINT, mock_read_batch_endpoint)
+
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient(
+        base_url="",
+        api_key="any key",
+        api_token="any token",
+        session=client,
+        read_batch_chunk_size=2,
+    )
+
+    read_batch = asyncio.create_task(
+        api_client.read_batch(inverter_sn=any_inverter_sn, cids=[-1, -2, -3], max_retry_time=0)
+    )
+    await asyncio.sleep(0)
+    read = asyncio.create_task(api_client.read(inverter_sn=any_inverter_sn, cid=-2, max_retry_time=0))
+    failed_read = asyncio.create_task(api_client.read(inverter_sn=any_inverter_sn, cid=-3, max_retry_time=0))
+    await asyncio.sleep(0.1)
+    response_gate.set()
+
+    with pytest.raises(SolisCloudControlApiPartialReadError):
+        await read_batch
+    assert await read == "any result 2"
+    with pytest.raises(SolisCloudControlApiPartialReadError):
+        await failed_read
+
+
+async def test_read_does_not_join_lower_priority_read(create_api_client, aiohttp_client):
+    any_inverter_sn = "any inverter sn"
+    requests_count = 0
+    response_gate = asyncio.Event()
+
+    async def mock_read_endpoint(request):
+        nonlocal requests_count
+        requests_count += 1
+        if requests_count == 1:
+            await response_gate.wait()
+            return web.json_response({"code": "0", "msg": "Success", "data": {"msg": "polled value"}})
+        return web.json_response({"code": "0", "msg": "Success", "data": {"msg": "read back value"}})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint)
+
+    client = await aiohttp_client(app)
+    api_client = create_api_client(client)
+
+    poll = asyncio.create_task(api_client.read(any_inverter_sn, -1, max_retry_time=0, priority=RequestPriority.POLL))
+    await asyncio.sleep(0.1)
+
+    assert await api_client.read(any_inverter_sn, -1, max_retry_time=0) == "read back value"
+
+    response_gate.set()
+    assert await poll == "polled value"
+    assert requests_count == 2
+
+
+async def test_joined_read_keeps_the_callers_deadline(create_api_client, aiohttp_client):
+    any_inverter_sn = "any inverter sn"
+    response_gate = asyncio.Event()
+
+    async def mock_read_endpoint(request):
+        await response_gate.wait()
+        return web.json_response({"code": "0", "msg": "Success", "data": {"msg": "any value"}})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint)
+
+    client = await aiohttp_client(app)
+    api_client = create_api_client(client)
+
+    first_read = asyncio.create_task(api_client.read(any_inverter_sn, -1, max_retry_time=0))
+    await asyncio.sleep(0.1)
+
+    with pytest.raises(SolisCloudControlApiDeadlineExceededError):
+        await api_client.read(any_inverter_sn, -1, max_retry_time=0, deadline=Deadline(0.1))
+
+    response_gate.set()
+    assert await first_read == "any value"
+
+
 async def test_control(create_api_client, aiohttp_client):
     any_inverter_sn = "any inverter sn"
     any_cid = -1
@@ -302,6 +650,26 @@ async def test_control_errors(mock_endpoint, expected_error, create_api_client,
     assert str(excinfo.value) == str(expected_error)
 
 
+async def test_control_rejected_by_inverter_is_not_retried(create_api_client, aiohttp_client):
+    requests = 0
+
+    async def control_endpoint(request):
+        nonlocal requests
+        requests += 1
+        return await mock_control_endpoint_control_error(request)
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._CONTROL_ENDPOINT, control_endpoint)
+
+    client = await aiohttp_client(app)
+    api_client = create_api_client(client)
+
+    with pytest.raises(SolisCloudControlApiControlRejectedError):
+        await api_client.control(inverter_sn="any inverter", cid=-1, value="any value", max_retry_time=60)
+
+    assert requests == 1
+
+
 async def mock_inverter_list_endpoint_missing_data_field(request):
     return web.json_response({"code": "0", "msg": "Success"})
 
@@ -378,3 +746,529 @@ async def test_inverter_details_errors(mock_endpoint, expected_error, create_api
         await api_client.inverter_details(inverter_sn="any_inverter_sn", max_retry_time=0)
 
     assert str(excinfo.value) == str(expected_error)
+
+
+async def test_read_throttled_error_has_retry_after(create_api_client, aiohttp_client):
+    async def mock_read_endpoint_throttled(request):
+        return web.Response(status=429, text="Too Many Requests", headers={"Retry-After": "7"})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint_throttled)
+    client = await aiohttp_client(app)
+    api_client = create_api_client(client)
+
+    with pytest.raises(SolisCloudControlApiError) as exc_info:
+        await api_client.read("any inverter sn", -1, max_retry_time=0)
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.retry_after_seconds == 7.0
+
+
+async def test_read_does_not_retry_invalid_credentials(create_api_client, aiohttp_client):
+    requests = 0
+
+    async def mock_read_endpoint_invalid_credentials(request):
+        nonlocal requests
+        requests += 1
+        return web.json_response({"code": "Z0001", "msg": "Invalid credentials"})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint_invalid_credentials)
+    client = await aiohttp_client(app)
+    api_client = create_api_client(client)
+
+    with pytest.raises(SolisCloudControlApiError):
+        await api_client.read("any inverter sn", -1, max_retry_time=60)
+
+    assert requests == 1
+
+
+@pytest.mark.parametrize(
+    "error,expected",
+    [
+        (
+            SolisCloudControlApiError("any error", response_code="Z0001"),
+            ErrorClassification(RetryDecision.NON_RETRYABLE),
+        ),
+        (
+            SolisCloudControlApiError("any error", response_code="B0115"),
+            ErrorClassification(RetryDecision.NON_RETRYABLE),
+        ),
+        (SolisCloudControlApiError("any error", response_code="100"), ErrorClassification(RetryDecision.RETRYABLE)),
+        (SolisCloudControlApiError("any error", status_code=401), ErrorClassification(RetryDecision.NON_RETRYABLE)),
+        (SolisCloudControlApiError("any error", status_code=408), ErrorClassification(RetryDecision.RETRYABLE)),
+        (SolisCloudControlApiError("any error", status_code=500), ErrorClassification(RetryDecision.RETRYABLE)),
+        (
+            SolisCloudControlApiError("any error", status_code=429, retry_after_seconds=5.0),
+            ErrorClassification(RetryDecision.THROTTLED, 5.0),
+        ),
+        (
+            SolisCloudControlApiError("any error", status_code=503),
+            ErrorClassification(RetryDecision.THROTTLED),
+        ),
+        (SolisCloudControlApiTimeoutError("any error"), ErrorClassification(RetryDecision.RETRYABLE)),
+        (SolisCloudControlApiCircuitOpenError("any error"), ErrorClassification(RetryDecision.NON_RETRYABLE)),
+        (
+            SolisCloudControlApiControlRejectedError("any error", response_code="100"),
+            ErrorClassification(RetryDecision.NON_RETRYABLE),
+        ),
+        (SolisCloudControlApiDeadlineExceededError("any error"), ErrorClassification(RetryDecision.NON_RETRYABLE)),
+        (ValueError("any error"), ErrorClassification(RetryDecision.RETRYABLE)),
+    ],
+)
+def test_classify_api_error(error, expected):
+    assert classify_api_error(error) == expected
+
+
+@pytest.mark.parametrize(
+    "cause,expected",
+    [
+        (
+            SolisCloudControlApiError("any error", response_code="Z0001"),
+            ErrorClassification(RetryDecision.NON_RETRYABLE),
+        ),
+        (
+            SolisCloudControlApiError("any error", status_code=429, retry_after_seconds=5.0),
+            ErrorClassification(RetryDecision.THROTTLED, 5.0),
+        ),
+        (SolisCloudControlApiTimeoutError("any error"), ErrorClassification(RetryDecision.RETRYABLE)),
+        (None, ErrorClassification(RetryDecision.RETRYABLE)),
+    ],
+)
+def test_classify_api_error_partial_read_by_cause(cause, expected):
+    error = SolisCloudControlApiPartialReadError("any error", {1: "any value"})
+    error.__cause__ = cause
+
+    assert classify_api_error(error) == expected
+
+
+@pytest.mark.parametrize(
+    "retry_after,expected",
+    [
+        (None, None),
+        ("7", 7.0),
+        ("-1", 0.0),
+        ("Wed, 21 Oct 2015 07:28:10 GMT", 10.0),
+        ("Wed, 21 Oct 2015 07:28:10 -0000", 10.0),
+        ("Wed, 21 Oct 2015 07:27:00 GMT", 0.0),
+        ("invalid", None),
+    ],
+)
+def test_parse_retry_after(retry_after, expected):
+    with patch(
+        "custom_components.solis_cloud_control.api.solis_api.current_date",
+        return_value=datetime(2015, 10, 21, 7, 28, 0, tzinfo=UTC),
+    ):
+        assert _parse_retry_after(retry_after) == expected
+
+
+async def test_circuit_breaker_opens_on_outage_and_fails_fast(aiohttp_client):
+    requests = 0
+
+    async def mock_read_endpoint_outage(request):
+        nonlocal requests
+        requests += 1
+        return web.Response(status=502, text="Bad Gateway")
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint_outage)
+    client = await aiohttp_client(app)
+    circuit_breaker = CircuitBreaker(failure_threshold=2)
+    api_client = SolisCloudControlApiClient("", "any key", "any token", client, circuit_breaker=circuit_breaker)
+
+    for _ in range(2):
+        with pytest.raises(SolisCloudControlApiError):
+            await api_client.read("any inverter sn", -1, max_retry_time=0)
+
+    assert api_client.circuit_breaker.state == CircuitState.OPEN
+
+    with pytest.raises(SolisCloudControlApiCircuitOpenError):
+        await api_client.read("any inverter sn", -1, max_retry_time=60)
+
+    assert requests == 2
+
+
+async def test_circuit_breaker_ignores_api_error_codes(aiohttp_client):
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint_api_error)
+    client = await aiohttp_client(app)
+    circuit_breaker = CircuitBreaker(failure_threshold=1)
+    api_client = SolisCloudControlApiClient("", "any key", "any token", client, circuit_breaker=circuit_breaker)
+
+    with pytest.raises(SolisCloudControlApiError):
+        await api_client.read("any inverter sn", -1, max_retry_time=0)
+
+    assert api_client.circuit_breaker.state == CircuitState.CLOSED
+
+
+async def test_circuit_breaker_releases_cancelled_request():
+    circuit_breaker = Mock(wraps=CircuitBreaker())
+    rate_limiter = Mock()
+    rate_limiter.acquire = AsyncMock(side_effect=asyncio.CancelledError)
+    api_client = SolisCloudControlApiClient(
+        "", "any key", "any token", Mock(), rate_limiter=rate_limiter, circuit_breaker=circuit_breaker
+    )
+
+    with pytest.raises(asyncio.CancelledError):
+        await api_client.read("any inverter sn", -1, max_retry_time=0)
+
+    circuit_breaker.release.assert_called_once()
+    circuit_breaker.record_failure.assert_not_called()
+
+
+async def test_expired_deadline_fails_without_request():
+    circuit_breaker = Mock(wraps=CircuitBreaker())
+    session = Mock()
+    api_client = SolisCloudControlApiClient("", "any key", "any token", session, circuit_breaker=circuit_breaker)
+
+    with pytest.raises(SolisCloudControlApiDeadlineExceededError):
+        await api_client.read("any inverter sn", -1, max_retry_time=60, deadline=Deadline(0))
+
+    session.post.assert_not_called()
+    circuit_breaker.try_acquire.assert_not_called()
+
+
+async def test_deadline_caps_attempt_timeout(aiohttp_client):
+    async def mock_read_endpoint_slow(request):
+        await asyncio.sleep(1)
+        return web.json_response({"code": "0", "msg": "Success", "data": {"msg": "any value"}})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint_slow)
+    client = await aiohttp_client(app)
+    circuit_breaker = CircuitBreaker(failure_threshold=1)
+    api_client = SolisCloudControlApiClient("", "any key", "any token", client, circuit_breaker=circuit_breaker)
+
+    with pytest.raises(SolisCloudControlApiDeadlineExceededError):
+        await api_client.read("any inverter sn", -1, max_retry_time=60, deadline=Deadline(0.1))
+
+    # running out of time is no outage of the API
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+
+async def test_deadline_bounds_rate_limiter_wait():
+    async def acquire_slowly(*_args: object) -> None:
+        await asyncio.sleep(1)
+
+    circuit_breaker = Mock(wraps=CircuitBreaker())
+    rate_limiter = Mock()
+    rate_limiter.acquire = AsyncMock(side_effect=acquire_slowly)
+    api_client = SolisCloudControlApiClient(
+        "", "any key", "any token", Mock(), rate_limiter=rate_limiter, circuit_breaker=circuit_breaker
+    )
+
+    with pytest.raises(SolisCloudControlApiDeadlineExceededError):
+        await api_client.read_batch("any inverter sn", [-1, -2], max_retry_time=60, deadline=Deadline(0.1))
+
+    circuit_breaker.release.assert_called_once()
+    circuit_breaker.record_failure.assert_not_called()
+
+
+async def test_async_cancel_cancels_in_flight_reads(aiohttp_client):
+    response_gate = asyncio.Event()
+
+    async def mock_read_endpoint_blocked(request):
+        await response_gate.wait()
+        return web.json_response({"code": "0", "msg": "Success", "data": {"msg": "any value"}})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint_blocked)
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient("", "any key", "any token", client)
+
+    read = asyncio.create_task(api_client.read("any inverter sn", -1, max_retry_time=60))
+    await asyncio.sleep(0.1)
+
+    await api_client.async_cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await read
+    assert api_client._in_flight_reads == {}
+    response_gate.set()
+
+
+def _hedging_policy(*endpoints: str) -> HedgingPolicy:
+    hedging_policy = HedgingPolicy(min_samples=1, min_delay_seconds=0.05)
+    for endpoint in endpoints:
+        hedging_policy.record_latency(endpoint, 0.05)
+    return hedging_policy
+
+
+async def test_read_hedged_when_primary_is_slow(aiohttp_client):
+    requests = 0
+    response_gate = asyncio.Event()
+
+    async def mock_read_endpoint(request):
+        nonlocal requests
+        requests += 1
+        if requests == 1:
+            await response_gate.wait()
+        return web.json_response({"code": "0", "msg": "Success", "data": {"msg": f"response {requests}"}})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint)
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient(
+        "", "any key", "any token", client, hedging_policy=_hedging_policy(SolisCloudControlApiClient._READ_ENDPOINT)
+    )
+
+    assert await api_client.read("any inverter sn", -1, max_retry_time=0) == "response 2"
+    assert requests == 2
+    response_gate.set()
+
+
+async def test_hedge_delay_and_latency_exclude_rate_limiter_wait(aiohttp_client):
+    requests = 0
+
+    async def mock_read_endpoint(request):
+        nonlocal requests
+        requests += 1
+        await asyncio.sleep(0.01)
+        return web.json_response({"code": "0", "msg": "Success", "data": {"msg": "any value"}})
+
+    async def acquire_slowly(*_args: object) -> None:
+        await asyncio.sleep(0.2)
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint)
+    client = await aiohttp_client(app)
+    rate_limiter = Mock()
+    rate_limiter.acquire = AsyncMock(side_effect=acquire_slowly)
+    rate_limiter.try_acquire.return_value = True
+    hedging_policy = HedgingPolicy(min_samples=1, min_delay_seconds=0.1)
+    hedging_policy.record_latency(SolisCloudControlApiClient._READ_ENDPOINT, 0.1)
+    api_client = SolisCloudControlApiClient(
+        "", "any key", "any token", client, rate_limiter=rate_limiter, hedging_policy=hedging_policy
+    )
+
+    assert await api_client.read("any inverter sn", -1, max_retry_time=0) == "any value"
+    assert requests == 1
+    rate_limiter.try_acquire.assert_not_called()
+    assert hedging_policy._latencies[SolisCloudControlApiClient._READ_ENDPOINT][-1] < 0.1
+
+
+async def test_read_batch_not_hedged_without_latency_samples(aiohttp_client):
+    requests = 0
+
+    async def mock_read_batch_endpoint(request):
+        nonlocal requests
+        requests += 1
+        await asyncio.sleep(0.2)
+        return web.json_response({"code": "0", "msg": "Success", "data": [[{"cid": -1, "msg": "any value"}]]})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_BATCH_ENDPOINT, mock_read_batch_endpoint)
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient(
+        "", "any key", "any token", client, hedging_policy=_hedging_policy(SolisCloudControlApiClient._READ_ENDPOINT)
+    )
+
+    assert await api_client.read_batch("any inverter sn", [-1], max_retry_time=0) == {-1: "any value"}
+    assert requests == 1
+
+
+async def test_read_not_hedged_without_spare_token(aiohttp_client):
+    requests = 0
+
+    async def mock_read_endpoint(request):
+        nonlocal requests
+        requests += 1
+        await asyncio.sleep(0.2)
+        return web.json_response({"code": "0", "msg": "Success", "data": {"msg": "any value"}})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint)
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient(
+        "",
+        "any key",
+        "any token",
+        client,
+        rate_limiter=RateLimiter(requests_per_second=0.1, burst=1),
+        hedging_policy=_hedging_policy(SolisCloudControlApiClient._READ_ENDPOINT),
+    )
+
+    assert await api_client.read("any inverter sn", -1, max_retry_time=0) == "any value"
+    assert requests == 1
+
+
+async def test_hedged_read_fails_with_primary_error(aiohttp_client):
+    requests = 0
+
+    async def mock_read_endpoint(request):
+        nonlocal requests
+        requests += 1
+        if requests == 1:
+            await asyncio.sleep(0.2)
+            return web.json_response({"code": "1", "msg": "primary error"})
+        return web.json_response({"code": "1", "msg": "hedge error"})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint)
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient(
+        "", "any key", "any token", client, hedging_policy=_hedging_policy(SolisCloudControlApiClient._READ_ENDPOINT)
+    )
+
+    with pytest.raises(SolisCloudControlApiError, match="primary error"):
+        await api_client.read("any inverter sn", -1, max_retry_time=0)
+    assert requests == 2
+
+
+async def test_control_never_hedged(aiohttp_client):
+    requests = 0
+
+    async def mock_control_endpoint(request):
+        nonlocal requests
+        requests += 1
+        await asyncio.sleep(0.2)
+        return web.json_response({"code": "0", "msg": "Success", "data": [{"code": "0"}]})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._CONTROL_ENDPOINT, mock_control_endpoint)
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient(
+        "",
+        "any key",
+        "any token",
+        client,
+        hedging_policy=_hedging_policy(SolisCloudControlApiClient._CONTROL_ENDPOINT),
+    )
+
+    await api_client.control("any inverter sn", -1, "any value", max_retry_time=0)
+
+    assert requests == 1
+
+
+async def test_async_warm_up_opens_connection(aiohttp_client):
+    requests = []
+
+    async def mock_root(request):
+        requests.append(request.method)
+        return web.Response(status=404)
+
+    app = web.Application()
+    app.router.add_route("HEAD", "/", mock_root)
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient("/", "any key", "any token", client)
+
+    await api_client.async_warm_up()
+
+    assert requests == ["HEAD"]
+
+
+async def test_async_warm_up_ignores_errors():
+    session = Mock()
+    session.head.side_effect = aiohttp.ClientError("any error")
+    api_client = SolisCloudControlApiClient("", "any key", "any token", session)
+
+    await api_client.async_warm_up()
+
+
+async def test_records_metrics_per_endpoint(aiohttp_client, no_sleep_retry_policy):
+    requests = 0
+
+    async def mock_read_endpoint_flaky(request):
+        nonlocal requests
+        requests += 1
+        if requests == 1:
+            return web.json_response({"code": "B0107", "msg": "any error"})
+        if requests == 2:
+            return web.Response(status=502)
+        return web.json_response({"code": "0", "msg": "Success", "data": {"msg": "any value"}})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint_flaky)
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient("", "any key", "any token", client, retry_policy=no_sleep_retry_policy)
+
+    assert await api_client.read("any inverter sn", -1, max_retry_time=10) == "any value"
+
+    read_metrics = api_client.metrics.endpoint("atRead")
+    assert read_metrics.request_count == 3
+    assert read_metrics.error_counts == {"B0107": 1, "http_502": 1}
+    assert read_metrics.retry_count == 2
+    assert read_metrics.latency.count == 3
+
+
+@pytest.mark.parametrize(
+    ("error", "expected_error_code"),
+    [
+        (SolisCloudControlApiError("any error", response_code="B0107"), "B0107"),
+        (SolisCloudControlApiError("any error", status_code=500), "http_500"),
+        (SolisCloudControlApiDeadlineExceededError("any error"), "deadline_exceeded"),
+        (SolisCloudControlApiTimeoutError("any error"), "timeout"),
+        (SolisCloudControlApiError("any error"), "connection_error"),
+    ],
+)
+def test_error_code(error, expected_error_code):
+    assert _error_code(error) == expected_error_code
+
+
+async def test_signs_the_sent_body(aiohttp_client):
+    async def mock_read_endpoint(request):
+        body = await request.read()
+        assert request.headers["Content-MD5"] == digest(body)
+        assert json.loads(body) == {"inverterSn": "any inverter sn", "cid": -1}
+        return web.json_response({"code": "0", "msg": "Success", "data": {"msg": "any value"}})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint)
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient("", "any key", "any token", client)
+
+    assert await api_client.read("any inverter sn", -1, max_retry_time=0) == "any value"
+
+
+async def test_logs_request_and_response_trace(aiohttp_client, caplog):
+    async def mock_read_endpoint(request):
+        return web.json_response({"code": "0", "msg": "Success", "data": {"msg": "any value"}})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint)
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient("", "any key", "any token", client)
+
+    with caplog.at_level(logging.DEBUG, logger="custom_components.solis_cloud_control.api.solis_api"):
+        await api_client.read("any inverter sn", -1, max_retry_time=0)
+
+    assert "API request #1 '/v2/api/atRead' (44 bytes):" in caplog.text
+    assert '"inverterSn": "any inverter sn"' in caplog.text
+    assert "API response #1 in" in caplog.text
+    assert '"msg": "any value"' in caplog.text
+
+
+async def test_logs_failed_request_trace(aiohttp_client, caplog):
+    async def mock_read_endpoint(request):
+        return web.Response(status=502, text="Bad Gateway")
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint)
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient("", "any key", "any token", client)
+
+    with (
+        caplog.at_level(logging.DEBUG, logger="custom_components.solis_cloud_control.api.solis_api"),
+        pytest.raises(SolisCloudControlApiError),
+    ):
+        await api_client.read("any inverter sn", -1, max_retry_time=0)
+
+    assert "API request #1 '/v2/api/atRead' failed after" in caplog.text
+
+
+async def test_does_not_format_trace_with_debug_logging_off(aiohttp_client, caplog):
+    async def mock_read_endpoint(request):
+        return web.json_response({"code": "0", "msg": "Success", "data": {"msg": "any value"}})
+
+    app = web.Application()
+    app.router.add_route("POST", SolisCloudControlApiClient._READ_ENDPOINT, mock_read_endpoint)
+    client = await aiohttp_client(app)
+    api_client = SolisCloudControlApiClient("", "any key", "any token", client)
+
+    with (
+        caplog.at_level(logging.INFO, logger="custom_components.solis_cloud_control.api.solis_api"),
+        patch.object(_PrettyJson, "__str__") as pretty_json_str,
+    ):
+        await api_client.read("any inverter sn", -1, max_retry_time=0)
+
+    pretty_json_str.assert_not_called()
@@ -0,0 +1,29 @@
+from aiohttp import web
+
+from custom_components.solis_cloud_control.api.solis_api_connection_pool import SolisCloudControlConnectionPool
+
+
+async def test_connection_pool_keeps_connections_alive(aiohttp_server):
+    async def mock_endpoint(request):
+        return web.json_response({"code": "0"})
+
+    app = web.Application()
+    app.router.add_route("POST", "/any", mock_endpoint)
+    server = await aiohttp_server(app)
+    connection_pool = SolisCloudControlConnectionPool()
+
+    for _ in range(3):
+        async with connection_pool.session.post(f"http://localhost:{server.port}/any") as response:
+            assert await response.json() == {"code": "0"}
+
+    metrics = connection_pool.metrics
+    assert metrics.connection_limit == 8
+    assert metrics.connections_created == 1
+    assert metrics.connections_reused == 2
+    assert metrics.connections_queued == 0
+    assert metrics.connection_setup_seconds > 0
+    assert metrics.dns_cache_misses == 1
+    assert metrics.dns_cache_hits == 0
+
+    await connection_pool.async_close()
+    assert connection_pool.session.closed
@@ -0,0 +1,73 @@
+from custom_components.solis_cloud_control.api.solis_api_metrics import (
+    SolisCloudControlApiMetrics,
+    SolisCloudControlApiTotals,
+)
+
+
+def test_records_requests_per_endpoint():
+    metrics = SolisCloudControlApiMetrics()
+
+    metrics.record_request("/v2/api/atRead", 0.25, bytes_sent=40)
+    metrics.record_bytes_received("/v2/api/atRead", 100)
+    metrics.record_request("/v2/api/atRead", 0.75, error_code="B0107")
+    metrics.record_request("/v2/api/atRead", 12.0, error_code="timeout")
+    metrics.record_request("/v2/api/atRead", 0.5, error_code="B0107")
+    metrics.record_retries("/v2/api/atRead", 2)
+    metrics.record_request("/v2/api/control", 1.2)
+
+    read_metrics = metrics.endpoint("atRead")
+    assert read_metrics is metrics.endpoint("/v2/api/atRead")
+    assert metrics.get("/v2/api/atRead") is read_metrics
+    assert read_metrics.request_count == 4
+    assert read_metrics.error_count == 3
+    assert read_metrics.retry_count == 2
+    assert metrics.as_dict() == {
+        "atRead": {
+            "request_count": 4,
+            "error_count": 3,
+            "error_counts": {"B0107": 2, "timeout": 1},
+            "retry_count": 2,
+            "bytes_sent": 40,
+            "bytes_received": 100,
+            "latency_mean_seconds": 3.375,
+            "latency_max_seconds": 12.0,
+            "latency_p50_seconds": 0.5,
+            "latency_p90_seconds": 12.0,
+            "latency_p95_seconds": 12.0,
+            "latency_p99_seconds": 12.0,
+        },
+        "control": {
+            "request_count": 1,
+            "error_count": 0,
+            "error_counts": {},
+            "retry_count": 0,
+            "bytes_sent": 0,
+            "bytes_received": 0,
+            "latency_mean_seconds": 1.2,
+            "latency_max_seconds": 1.2,
+            "latency_p50_seconds": 1.2,
+            "latency_p90_seconds": 1.2,
+            "latency_p95_seconds": 1.2,
+            "latency_p99_seconds": 1.2,
+        },
+    }
+
+
+def test_totals():
+    metrics = SolisCloudControlApiMetrics()
+
+    metrics.record_request("/v2/api/atReadBatch", 0.5, bytes_sent=60)
+    metrics.record_bytes_received("/v2/api/atReadBatch", 900)
+    metrics.record_request("/v2/api/atRead", 0.25, error_code="timeout", bytes_sent=40)
+    metrics.record_retries("/v2/api/atRead", 1)
+
+    assert metrics.totals() == SolisCloudControlApiTotals(
+        request_count=2, retry_count=1, error_count=1, bytes_sent=100, bytes_received=900
+    )
+
+
+def test_get_does_not_add_endpoint():
+    metrics = SolisCloudControlApiMetrics()
+
+    assert metrics.get("atRead") is None
+    assert metrics.as_dict() == {}
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -5,7 +6,9 @@ from homeassistant.const import CONF_API_KEY, CONF_API_TOKEN
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pytest_socket import enable_socket, socket_allow_hosts
 
+from custom_components.solis_cloud_control.api.solis_api_metrics import SolisCloudControlApiMetrics
 from custom_components.solis_cloud_control.const import CONF_INVERTER_SN, DOMAIN
+from custom_components.solis_cloud_control.coordinator import SolisCloudControlDataView
 from custom_components.solis_cloud_control.inverters.inverter import (
     Inverter,
     InverterAllowExport,
@@ -26,6 +29,7 @@ from custom_components.solis_cloud_control.inverters.inverter import (
     InverterTime,
 )
 from custom_components.solis_cloud_control.number import InverterPowerLimit
+from custom_components.solis_cloud_control.utils.circuit_breaker import CircuitBreaker
 
 
 # https://github.com/MatthewFlamm/pytest-homeassistant-custom-component/issues/154
@@ -40,9 +44,31 @@ def auto_enable_custom_integrations(enable_custom_integrations):
     yield
 
 
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleep_delays: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleep_delays.append(delay)
+        self.now += delay
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    return FakeClock()
+
+
 @pytest.fixture
 def mock_api_client():
-    return AsyncMock()
+    api_client = AsyncMock()
+    api_client.circuit_breaker = CircuitBreaker()
+    api_client.metrics = SolisCloudControlApiMetrics()
+    return api_client
 
 
 @pytest.fixture
@@ -50,8 +76,21 @@ def mock_coordinator():
     coordinator = Mock()
     coordinator.control = AsyncMock()
     coordinator.control_no_check = AsyncMock()
+
+    async def control_edit(cid, edit):
+        value = edit(coordinator.data.get(cid))
+        if value is not None:
+            await coordinator.control(cid, value)
+
+    coordinator.control_edit = AsyncMock(side_effect=control_edit)
     coordinator.data = {}
     coordinator.last_update_success = True
+    coordinator.is_fresh = Mock(return_value=True)
+    coordinator.is_restored = Mock(return_value=False)
+    type(coordinator).data_view = property(lambda self: SolisCloudControlDataView(self.data))
+    type(coordinator).available_cids = property(
+        lambda self: frozenset(cid for cid, value in self.data.items() if value is not None and self.is_fresh(cid))
+    )
     coordinator.config_entry = Mock()
     coordinator.config_entry.entry_id = "any_entry_id"
     coordinator.config_entry.domain = "any_domain"
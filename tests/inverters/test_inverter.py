@@ -2,7 +2,14 @@ from dataclasses import replace
 
 import pytest
 
-from custom_components.solis_cloud_control.inverters.inverter import InverterInfo, InverterOnOff
+from custom_components.solis_cloud_control.inverters.inverter import (
+    InverterChargeDischargeSlots,
+    InverterInfo,
+    InverterOnOff,
+    ReadBackCheck,
+    ReadBackMatch,
+    RefreshTier,
+)
 
 
 @pytest.mark.parametrize(
@@ -135,3 +142,91 @@ def test_inverter_info_parallel_battery_count(any_inverter_info, parallel_batter
 def test_inverter_on_off_is_valid_value(value, expected):
     inverter_on_off = InverterOnOff()
     assert inverter_on_off.is_valid_value(value) == expected
+
+
+def test_inverter_features(any_inverter):
+    features = any_inverter.features
+
+    assert features[0] is any_inverter.on_off
+    assert any_inverter.charge_discharge_slots in features
+    assert None not in features
+    assert any_inverter.time.cids == (any_inverter.time.cid,)
+    assert any_inverter.time.coupled_cids == ()
+
+
+@pytest.mark.parametrize(
+    "read_back_check,value,expected",
+    [
+        (ReadBackCheck(), "80", True),
+        (ReadBackCheck(), "80.0", False),
+        (ReadBackCheck(ReadBackMatch.TOLERANCE, tolerance=0.5), "80.0", True),
+        (ReadBackCheck(ReadBackMatch.TOLERANCE, tolerance=0.5), "81", False),
+        (ReadBackCheck(ReadBackMatch.TOLERANCE, tolerance=0.5), None, False),
+        (ReadBackCheck(ReadBackMatch.NONE), "79", True),
+    ],
+)
+def test_read_back_check_is_confirmed(read_back_check, value, expected):
+    assert read_back_check.is_confirmed("80", value) == expected
+
+
+def test_inverter_read_back_check(any_inverter):
+    assert any_inverter.read_back_check(any_inverter.time.cid).match == ReadBackMatch.NONE
+    assert any_inverter.read_back_check(any_inverter.battery_reserve_soc.cid).match == ReadBackMatch.TOLERANCE
+    assert any_inverter.read_back_check(any_inverter.on_off.on_cid).match == ReadBackMatch.EXACT
+    assert any_inverter.read_back_check(-1) == ReadBackCheck()
+
+
+def test_inverter_refresh_tiers(any_inverter):
+    refresh_tiers = any_inverter.refresh_tiers
+
+    assert tuple(refresh_tiers) == any_inverter.all_cids
+    assert refresh_tiers[any_inverter.on_off.on_cid] == RefreshTier.FAST
+    assert refresh_tiers[any_inverter.storage_mode.cid] == RefreshTier.FAST
+    assert refresh_tiers[any_inverter.max_output_power.cid] == RefreshTier.SLOW
+    assert refresh_tiers[any_inverter.battery_reserve_soc.cid] == RefreshTier.SLOW
+    assert refresh_tiers[any_inverter.charge_discharge_settings.cid] == RefreshTier.SLOW
+    assert refresh_tiers[any_inverter.charge_discharge_slots.charge_slot1.time_cid] == RefreshTier.SLOW
+
+
+def test_inverter_coupled_cids(any_inverter):
+    on_off = any_inverter.on_off
+    slots = any_inverter.charge_discharge_slots
+
+    assert any_inverter.coupled_cids(on_off.on_cid) == (on_off.on_cid, on_off.off_cid)
+    assert any_inverter.coupled_cids(slots.charge_slot1.switch_cid) == slots.switch_cids
+    assert any_inverter.coupled_cids(slots.charge_slot1.time_cid) == ()
+    assert any_inverter.coupled_cids(any_inverter.battery_reserve_soc.cid) == ()
+
+
+def test_inverter_cid_plan(any_inverter):
+    cid_plan = any_inverter.cid_plan
+    fast_cids = cid_plan.read_batch_cids_for({RefreshTier.FAST})
+    slow_cids = cid_plan.read_batch_cids_for({RefreshTier.SLOW})
+
+    assert any_inverter.cid_plan is cid_plan
+    assert cid_plan.read_batch_cids_for(RefreshTier) == any_inverter.read_batch_cids
+    assert cid_plan.read_batch_cids_for(set()) == ()
+    assert set(fast_cids) | set(slow_cids) == set(any_inverter.read_batch_cids)
+    assert any_inverter.on_off.on_cid in fast_cids
+    assert any_inverter.battery_reserve_soc.cid in slow_cids
+    assert cid_plan.read_cids_for({RefreshTier.SLOW}) == (any_inverter.charge_discharge_settings.cid,)
+    assert cid_plan.read_cids_for({RefreshTier.FAST}) == ()
+    assert any_inverter.charge_discharge_settings.cid not in any_inverter.read_batch_cids
+
+
+@pytest.mark.parametrize("slot_number", [1, 6])
+def test_inverter_charge_discharge_slots_get_slot(slot_number):
+    slots = InverterChargeDischargeSlots()
+
+    assert slots.get_charge_slot(slot_number) == getattr(slots, f"charge_slot{slot_number}")
+    assert slots.get_discharge_slot(slot_number) == getattr(slots, f"discharge_slot{slot_number}")
+
+
+@pytest.mark.parametrize("slot_number", [0, 7, -1])
+def test_inverter_charge_discharge_slots_get_invalid_slot(slot_number):
+    slots = InverterChargeDischargeSlots()
+
+    with pytest.raises(ValueError, match="Invalid charge slot number"):
+        slots.get_charge_slot(slot_number)
+    with pytest.raises(ValueError, match="Invalid discharge slot number"):
+        slots.get_discharge_slot(slot_number)
@@ -63,6 +63,10 @@ async def test_create_inverter_info(mock_api_client):
     assert result.parallel_battery == "any parallel battery"
     assert result.tou_v2_mode == "any tou v2 mode"
 
+    # both requests share a single time budget
+    deadline = mock_api_client.inverter_details.call_args.args[2]
+    assert mock_api_client.read.call_args.kwargs["deadline"] is deadline
+
 
 @pytest.mark.asyncio
 async def test_create_inverter_info_missing_fields(mock_api_client):
@@ -101,6 +105,29 @@ async def test_create_inverter_info_string_inverter(mock_api_client):
     mock_api_client.read.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_create_inverter_info_reuses_cached_tou_v2_mode(mock_api_client, any_inverter_info):
+    cached_inverter_info = replace(any_inverter_info, version="any version", tou_v2_mode="cached tou v2 mode")
+    mock_api_client.inverter_details.return_value = {"energyStorageControl": "1", "version": "any version"}
+
+    result = await create_inverter_info(mock_api_client, "any serial number", cached_inverter_info)
+
+    assert result.tou_v2_mode == "cached tou v2 mode"
+    mock_api_client.read.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_inverter_info_reads_tou_v2_mode_after_firmware_update(mock_api_client, any_inverter_info):
+    cached_inverter_info = replace(any_inverter_info, version="old version", tou_v2_mode="cached tou v2 mode")
+    mock_api_client.inverter_details.return_value = {"energyStorageControl": "1", "version": "new version"}
+    mock_api_client.read.return_value = "any tou v2 mode"
+
+    result = await create_inverter_info(mock_api_client, "any serial number", cached_inverter_info)
+
+    assert result.tou_v2_mode == "any tou v2 mode"
+    mock_api_client.read.assert_called_once()
+
+
 def test_create_string_inverter(any_inverter_info):
     inverter_info = replace(any_inverter_info, energy_storage_control="0")
     result = create_inverter(inverter_info)
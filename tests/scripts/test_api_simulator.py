@@ -0,0 +1,138 @@
+import pytest
+
+from custom_components.solis_cloud_control.api.solis_api import (
+    SolisCloudControlApiClient,
+    SolisCloudControlApiError,
+    SolisCloudControlApiTimeoutError,
+)
+from custom_components.solis_cloud_control.utils.retry_policy import RetryPolicy
+from scripts.api_simulator import (
+    PROFILES,
+    SimulatorProfile,
+    SolisCloudSimulator,
+    create_hybrid_inverter,
+    create_inverters,
+    create_string_inverter,
+)
+
+_API_KEY = "any key"
+_API_SECRET = "any secret"
+
+
+@pytest.fixture
+def simulator():
+    return SolisCloudSimulator(
+        _API_KEY,
+        _API_SECRET,
+        [create_string_inverter("any string sn"), create_hybrid_inverter("any hybrid sn")],
+        random_value=lambda: 0.5,
+    )
+
+
+@pytest.fixture
+def create_api_client(simulator, aiohttp_client):
+    async def _create_api_client(api_secret=_API_SECRET, timeout=30):
+        client = await aiohttp_client(simulator.create_app())
+        return SolisCloudControlApiClient("", _API_KEY, api_secret, client, timeout=timeout)
+
+    return _create_api_client
+
+
+async def test_inverter_list_and_details(create_api_client):
+    api_client = await create_api_client()
+
+    inverters = await api_client.inverter_list(max_retry_time=0)
+    details = await api_client.inverter_details("any hybrid sn", max_retry_time=0)
+
+    assert [inverter["sn"] for inverter in inverters] == ["any string sn", "any hybrid sn"]
+    assert details["energyStorageControl"] == "1"
+
+
+async def test_control_then_read(create_api_client, simulator):
+    api_client = await create_api_client()
+
+    await api_client.control("any hybrid sn", 157, "20", max_retry_time=0)
+
+    assert await api_client.read("any hybrid sn", 157, max_retry_time=0) == "20"
+    assert await api_client.read_batch("any hybrid sn", [157, 6798, 158], max_retry_time=0) == {
+        157: "20",
+        6798: "43605",
+        158: "0",
+    }
+    assert simulator.inverter("any hybrid sn").values[157] == "20"
+
+
+async def test_rejects_invalid_signature(create_api_client):
+    api_client = await create_api_client(api_secret="wrong secret")
+
+    with pytest.raises(SolisCloudControlApiError) as error:
+        await api_client.read("any hybrid sn", 157, max_retry_time=0)
+
+    assert error.value.response_code == "Z0001"
+
+
+async def test_unknown_inverter(create_api_client):
+    api_client = await create_api_client()
+
+    with pytest.raises(SolisCloudControlApiError) as error:
+        await api_client.read("unknown sn", 157, max_retry_time=0)
+
+    assert error.value.response_code == "S0002"
+
+
+@pytest.mark.parametrize(
+    ("profile", "expected_status_code", "expected_response_code"),
+    [
+        (SimulatorProfile(throttle_rate=1.0), 429, None),
+        (SimulatorProfile(server_error_rate=1.0), 502, None),
+        (SimulatorProfile(error_rate=1.0), None, "S0001"),
+    ],
+)
+async def test_failure_profiles(create_api_client, simulator, profile, expected_status_code, expected_response_code):
+    simulator.profile = profile
+    api_client = await create_api_client()
+
+    with pytest.raises(SolisCloudControlApiError) as error:
+        await api_client.read("any hybrid sn", 157, max_retry_time=0)
+
+    assert error.value.status_code == expected_status_code
+    assert error.value.response_code == expected_response_code
+
+
+async def test_throttling_is_retried_after_retry_after(aiohttp_client):
+    draws = iter([0.0, 0.0, 0.0, 0.5])
+    simulator = SolisCloudSimulator(
+        _API_KEY,
+        _API_SECRET,
+        [create_hybrid_inverter("any hybrid sn")],
+        SimulatorProfile(throttle_rate=0.1, retry_after_seconds=0),
+        random_value=lambda: next(draws),
+    )
+    client = await aiohttp_client(simulator.create_app())
+    api_client = SolisCloudControlApiClient(
+        "", _API_KEY, _API_SECRET, client, retry_policy=RetryPolicy(retryable_exception=SolisCloudControlApiError)
+    )
+
+    assert await api_client.read("any hybrid sn", 6798, max_retry_time=10) == "43605"
+    assert simulator.request_count == 2
+
+
+async def test_timeout_profile(create_api_client, simulator):
+    simulator.profile = SimulatorProfile(timeout_rate=1.0, timeout_seconds=1.0)
+    api_client = await create_api_client(timeout=0.05)
+
+    with pytest.raises(SolisCloudControlApiTimeoutError):
+        await api_client.read("any hybrid sn", 157, max_retry_time=0)
+
+
+def test_create_inverters():
+    inverters = create_inverters(string_inverter_count=2, hybrid_inverter_count=3)
+
+    assert [inverter.details["energyStorageControl"] for inverter in inverters] == ["0", "0", "1", "1", "1"]
+    assert len({inverter.serial_number for inverter in inverters}) == 5
+
+
+def test_profiles_fail_less_than_all_requests():
+    for profile in PROFILES.values():
+        failure_rate = profile.error_rate + profile.server_error_rate + profile.throttle_rate + profile.timeout_rate
+        assert failure_rate <= 1.0
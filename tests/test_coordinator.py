@@ -1,20 +1,44 @@
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+from datetime import timedelta
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
+from freezegun.api import FrozenDateTimeFactory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
-
-from custom_components.solis_cloud_control.api.solis_api import SolisCloudControlApiError
-from custom_components.solis_cloud_control.coordinator import SolisCloudControlCoordinator
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_capture_events, async_fire_time_changed
+
+from custom_components.solis_cloud_control.api.solis_api import (
+    SolisCloudControlApiCircuitOpenError,
+    SolisCloudControlApiError,
+    SolisCloudControlApiPartialReadError,
+)
+from custom_components.solis_cloud_control.const import EVENT_SLOW_UPDATE_CYCLE
+from custom_components.solis_cloud_control.coordinator import (
+    SolisCloudControlCoordinator,
+    SolisCloudControlData,
+    SolisCloudControlDataView,
+)
+from custom_components.solis_cloud_control.inverters.inverter import RefreshTier
+from custom_components.solis_cloud_control.store import SolisCloudControlSnapshot
+from custom_components.solis_cloud_control.utils.rate_limiter import RequestPriority
+from custom_components.solis_cloud_control.utils.retry_policy import RetryPolicy
 
 
 @pytest.fixture
-def coordinator(hass: HomeAssistant, mock_config_entry, mock_api_client, any_inverter):
+def coordinator(hass: HomeAssistant, mock_config_entry, mock_api_client, any_inverter, fake_clock):
     return SolisCloudControlCoordinator(
         hass=hass,
         config_entry=mock_config_entry,
         api_client=mock_api_client,
         inverter=any_inverter,
+        read_back_retry_policy=RetryPolicy(
+            retryable_exception=SolisCloudControlApiError,
+            monotonic_time=fake_clock.monotonic,
+            sleep=fake_clock.sleep,
+        ),
+        control_edit_window_seconds=0,
     )
 
 
@@ -34,6 +58,8 @@ async def test_async_update_data(hass: HomeAssistant, coordinator, mock_api_clie
         any_inverter.info.serial_number,
         read_batch_cids,
         max_retry_time=180,
+        priority=RequestPriority.POLL,
+        deadline=ANY,
     )
 
     for read_cid in read_cids:
@@ -41,6 +67,8 @@ async def test_async_update_data(hass: HomeAssistant, coordinator, mock_api_clie
             any_inverter.info.serial_number,
             read_cid,
             max_retry_time=60,
+            priority=RequestPriority.POLL,
+            deadline=ANY,
         )
 
     assert data == {cid: f"value_{cid}" for cid in any_inverter.all_cids}
@@ -49,6 +77,7 @@ async def test_async_update_data(hass: HomeAssistant, coordinator, mock_api_clie
 async def test_async_update_data_api_error(hass: HomeAssistant, coordinator, mock_api_client):
     any_error = "any error"
     mock_api_client.read_batch.side_effect = SolisCloudControlApiError(any_error)
+    mock_api_client.read.side_effect = SolisCloudControlApiError("other error")
 
     with pytest.raises(UpdateFailed) as exc_info:
         await coordinator._async_update_data()
@@ -59,11 +88,128 @@ async def test_async_update_data_api_error(hass: HomeAssistant, coordinator, moc
         coordinator._inverter.info.serial_number,
         coordinator._inverter.read_batch_cids,
         max_retry_time=180,
+        priority=RequestPriority.POLL,
+        deadline=ANY,
     )
 
 
+async def test_async_update_data_partial_result(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    read_batch_cids = any_inverter.read_batch_cids
+    read_cid = any_inverter.read_cids[0]
+    received_cid, missing_cid = read_batch_cids[0], read_batch_cids[1]
+
+    mock_api_client.read_batch.return_value = dict.fromkeys(read_batch_cids, "old value")
+    mock_api_client.read.return_value = "old value"
+    coordinator.data = await coordinator._async_update_data()
+
+    mock_api_client.read_batch.side_effect = SolisCloudControlApiPartialReadError(
+        "any error", {received_cid: "new value"}
+    )
+    mock_api_client.read.side_effect = SolisCloudControlApiError("any error")
+
+    data = await coordinator._async_update_data()
+
+    assert data[received_cid] == "new value"
+    assert data[missing_cid] == "old value"
+    assert data[read_cid] == "old value"
+
+
+async def test_async_update_data_drops_stale_values(
+    hass: HomeAssistant, coordinator, mock_api_client, any_inverter, freezer: FrozenDateTimeFactory
+):
+    read_batch_cids = any_inverter.read_batch_cids
+    received_cid, missing_cid = read_batch_cids[0], read_batch_cids[1]
+
+    mock_api_client.read_batch.return_value = dict.fromkeys(read_batch_cids, "old value")
+    coordinator.data = await coordinator._async_update_data()
+
+    freezer.tick(timedelta(minutes=16))
+
+    mock_api_client.read_batch.return_value = {received_cid: "new value"}
+
+    data = await coordinator._async_update_data()
+
+    assert data[received_cid] == "new value"
+    assert data[missing_cid] is None
+    assert coordinator.is_fresh(received_cid)
+    assert not coordinator.is_fresh(missing_cid)
+
+
+async def test_async_update_data_reads_due_tiers_only(
+    hass: HomeAssistant, coordinator, mock_api_client, any_inverter, freezer: FrozenDateTimeFactory
+):
+    refresh_tiers = any_inverter.refresh_tiers
+    fast_cids = tuple(cid for cid in any_inverter.read_batch_cids if refresh_tiers[cid] == RefreshTier.FAST)
+    mock_api_client.read_batch.return_value = {}
+
+    await coordinator._async_update_data()
+    assert mock_api_client.read_batch.call_args.args[1] == any_inverter.read_batch_cids
+    assert mock_api_client.read.call_count == len(any_inverter.read_cids)
+
+    freezer.tick(timedelta(minutes=5))
+    mock_api_client.read.reset_mock()
+
+    await coordinator._async_update_data()
+    assert mock_api_client.read_batch.call_args.args[1] == fast_cids
+    mock_api_client.read.assert_not_called()
+
+    # a poll jittered ahead of the fast tier interval still reads the fast tier
+    freezer.tick(timedelta(minutes=4))
+
+    await coordinator._async_update_data()
+    assert mock_api_client.read_batch.call_args.args[1] == fast_cids
+
+    freezer.tick(timedelta(minutes=21))
+
+    await coordinator._async_update_data()
+    assert mock_api_client.read_batch.call_args.args[1] == any_inverter.read_batch_cids
+    assert mock_api_client.read.call_count == len(any_inverter.read_cids)
+
+
+async def test_async_update_data_marks_tiers_refreshed_by_their_cids(
+    hass: HomeAssistant, coordinator, mock_api_client, any_inverter, freezer: FrozenDateTimeFactory
+):
+    slow_cid = any_inverter.battery_reserve_soc.cid
+    mock_api_client.read_batch.side_effect = SolisCloudControlApiPartialReadError("any error", {slow_cid: "any value"})
+    mock_api_client.read.side_effect = SolisCloudControlApiError("any error")
+
+    await coordinator._async_update_data()
+    freezer.tick(timedelta(minutes=5))
+
+    assert coordinator._due_tiers() == {RefreshTier.FAST}
+
+
+async def test_is_fresh_slow_tier(hass: HomeAssistant, coordinator, mock_api_client, any_inverter, freezer):
+    slow_cid = any_inverter.battery_reserve_soc.cid
+    mock_api_client.read_batch.return_value = {slow_cid: "any value"}
+
+    await coordinator._async_update_data()
+
+    freezer.tick(timedelta(minutes=90))
+    assert coordinator.is_fresh(slow_cid)
+
+    freezer.tick(timedelta(seconds=1))
+    assert not coordinator.is_fresh(slow_cid)
+
+
+async def test_is_fresh(hass: HomeAssistant, coordinator, mock_api_client, any_inverter, freezer):
+    any_cid = any_inverter.read_batch_cids[0]
+    mock_api_client.read_batch.return_value = {any_cid: "any value"}
+
+    assert not coordinator.is_fresh(any_cid)
+
+    await coordinator._async_update_data()
+    assert coordinator.is_fresh(any_cid)
+
+    freezer.tick(timedelta(minutes=15))
+    assert coordinator.is_fresh(any_cid)
+
+    freezer.tick(timedelta(seconds=1))
+    assert not coordinator.is_fresh(any_cid)
+
+
 async def test_control_success(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
-    any_cid = 123
+    any_cid = any_inverter.battery_reserve_soc.cid
     any_value = "any_value"
     any_old_value = "any_old_value"
     any_initial_value = "initial_value"
@@ -71,42 +217,189 @@ async def test_control_success(hass: HomeAssistant, coordinator, mock_api_client
     coordinator.data = {any_cid: any_initial_value}
 
     mock_api_client.control.return_value = None
+    mock_api_client.read_batch.return_value = {any_cid: any_value}
 
     with (
         patch.object(coordinator, "async_request_refresh", AsyncMock()) as mock_request_refresh,
         patch.object(coordinator, "async_set_updated_data", Mock()) as mock_set_updated_data,
     ):
         await coordinator.control(any_cid, any_value, any_old_value)
+        await hass.async_block_till_done()
 
-        mock_set_updated_data.assert_called_once_with({any_cid: any_value})
+        mock_set_updated_data.assert_called_with({any_cid: any_value})
         mock_api_client.control.assert_called_once_with(
             any_inverter.info.serial_number, any_cid, any_value, any_old_value
         )
-        mock_request_refresh.assert_called_once()
+        mock_api_client.read_batch.assert_called_once_with(
+            any_inverter.info.serial_number,
+            [any_cid],
+            max_retry_time=0,
+            priority=RequestPriority.READ_BACK,
+            deadline=ANY,
+        )
+        mock_request_refresh.assert_not_called()
+
+    assert coordinator.is_fresh(any_cid)
 
 
 async def test_control_success_without_data(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
-    any_cid = 123
+    any_cid = any_inverter.battery_reserve_soc.cid
     any_value = "any_value"
     any_old_value = "any_old_value"
 
     mock_api_client.control.return_value = None
+    mock_api_client.read_batch.return_value = {any_cid: any_value}
 
-    with (
-        patch.object(coordinator, "async_request_refresh", AsyncMock()) as mock_request_refresh,
-        patch.object(coordinator, "async_set_updated_data", Mock()) as mock_set_updated_data,
-    ):
+    with patch.object(coordinator, "async_set_updated_data", Mock()) as mock_set_updated_data:
         await coordinator.control(any_cid, any_value, any_old_value)
+        await hass.async_block_till_done()
 
-        mock_set_updated_data.assert_not_called()
+        mock_set_updated_data.assert_called_once_with({any_cid: any_value})
         mock_api_client.control.assert_called_once_with(
             any_inverter.info.serial_number, any_cid, any_value, any_old_value
         )
-        mock_request_refresh.assert_called_once()
 
 
-async def test_control_api_error(hass: HomeAssistant, coordinator, mock_api_client):
-    any_cid = 123
+async def test_control_reads_back_until_applied(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    any_cid = any_inverter.battery_reserve_soc.cid
+    any_value = "any_value"
+
+    mock_api_client.read_batch.side_effect = [{any_cid: "old_value"}, {any_cid: any_value}]
+
+    with patch.object(coordinator, "async_set_updated_data", Mock()) as mock_set_updated_data:
+        await coordinator.control(any_cid, any_value)
+        await hass.async_block_till_done()
+
+        assert mock_api_client.read_batch.call_count == 2
+        mock_set_updated_data.assert_called_with({any_cid: any_value})
+
+
+async def test_control_reads_back_number_in_another_format(
+    hass: HomeAssistant, coordinator, mock_api_client, any_inverter
+):
+    any_cid = any_inverter.battery_reserve_soc.cid
+
+    mock_api_client.read_batch.return_value = {any_cid: "80.0"}
+
+    await coordinator.control(any_cid, "80")
+    await hass.async_block_till_done()
+
+    mock_api_client.read_batch.assert_called_once()
+
+
+async def test_control_reads_back_time_once(hass: HomeAssistant, coordinator, mock_api_client, any_inverter, caplog):
+    time_cid = any_inverter.time.cid
+
+    mock_api_client.read_batch.return_value = {time_cid: "2025-01-01 12:00:03"}
+
+    await coordinator.control(time_cid, "2025-01-01 12:00:00")
+    await hass.async_block_till_done()
+
+    mock_api_client.read_batch.assert_called_once()
+    assert coordinator.data == {time_cid: "2025-01-01 12:00:03"}
+    assert "Read back" not in caplog.text
+
+
+async def test_control_returns_before_read_back(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    any_cid = any_inverter.battery_reserve_soc.cid
+    read_back_released = asyncio.Event()
+
+    async def read_batch(*_args: object, **_kwargs: object) -> dict[int, str]:
+        await read_back_released.wait()
+        return {any_cid: "any value"}
+
+    mock_api_client.read_batch.side_effect = read_batch
+
+    await coordinator.control(any_cid, "any value")
+    assert mock_api_client.read_batch.call_count == 1
+
+    read_back_released.set()
+    await hass.async_block_till_done()
+
+    assert coordinator.data == {any_cid: "any value"}
+
+
+async def test_control_cancels_superseded_read_back(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    any_cid = any_inverter.battery_reserve_soc.cid
+    read_back_released = asyncio.Event()
+    cancelled_read_backs = 0
+
+    async def read_batch(*_args: object, **_kwargs: object) -> dict[int, str]:
+        nonlocal cancelled_read_backs
+        try:
+            await read_back_released.wait()
+        except asyncio.CancelledError:
+            cancelled_read_backs += 1
+            raise
+        return {any_cid: "new value"}
+
+    mock_api_client.read_batch.side_effect = read_batch
+
+    await coordinator.control(any_cid, "old value")
+    await coordinator.control(any_cid, "new value")
+    read_back_released.set()
+    await hass.async_block_till_done()
+
+    assert cancelled_read_backs == 1
+    assert coordinator.data == {any_cid: "new value"}
+
+
+async def test_control_read_back_error(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    any_cid = any_inverter.battery_reserve_soc.cid
+    any_value = "any_value"
+
+    mock_api_client.read_batch.side_effect = SolisCloudControlApiError("any error")
+
+    with patch.object(coordinator, "async_set_updated_data", Mock()):
+        await coordinator.control(any_cid, any_value)
+        await hass.async_block_till_done()
+
+    mock_api_client.control.assert_called_once()
+    assert mock_api_client.read_batch.call_count > 1
+
+
+async def test_control_reads_back_coupled_cids(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    on_cid = any_inverter.on_off.on_cid
+    off_cid = any_inverter.on_off.off_cid
+    on_value = any_inverter.on_off.on_value
+
+    mock_api_client.read_batch.return_value = {on_cid: on_value, off_cid: on_value}
+
+    with patch.object(coordinator, "async_set_updated_data", Mock()):
+        await coordinator.control(on_cid, on_value)
+        await hass.async_block_till_done()
+
+    mock_api_client.read_batch.assert_called_once_with(
+        any_inverter.info.serial_number,
+        [on_cid, off_cid],
+        max_retry_time=0,
+        priority=RequestPriority.READ_BACK,
+        deadline=ANY,
+    )
+
+
+async def test_control_reads_back_read_cid(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    read_cid = any_inverter.read_cids[0]
+    any_value = "any_value"
+
+    mock_api_client.read.return_value = any_value
+
+    with patch.object(coordinator, "async_set_updated_data", Mock()):
+        await coordinator.control(read_cid, any_value)
+        await hass.async_block_till_done()
+
+    mock_api_client.read.assert_called_once_with(
+        any_inverter.info.serial_number,
+        read_cid,
+        max_retry_time=0,
+        priority=RequestPriority.READ_BACK,
+        deadline=ANY,
+    )
+    mock_api_client.read_batch.assert_not_called()
+
+
+async def test_control_api_error(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    any_cid = any_inverter.battery_reserve_soc.cid
     any_value = "any_value"
     any_old_value = "any_old_value"
     any_initial_value = "initial_value"
@@ -115,18 +408,529 @@ async def test_control_api_error(hass: HomeAssistant, coordinator, mock_api_clie
     coordinator.data = {any_cid: any_initial_value}
 
     mock_api_client.control.side_effect = SolisCloudControlApiError(any_error)
+    mock_api_client.read_batch.return_value = {any_cid: any_initial_value}
 
-    with (
-        patch.object(coordinator, "async_request_refresh", AsyncMock()) as mock_request_refresh,
-        patch.object(coordinator, "async_set_updated_data", Mock()) as mock_set_updated_data,
-    ):
+    with patch.object(coordinator, "async_set_updated_data", Mock()) as mock_set_updated_data:
         with pytest.raises(SolisCloudControlApiError) as exc_info:
             await coordinator.control(any_cid, any_value, any_old_value)
+        await hass.async_block_till_done()
 
         assert str(exc_info.value) == any_error
 
-        mock_set_updated_data.assert_called_once_with({any_cid: any_value})
+        mock_set_updated_data.assert_any_call({any_cid: any_value})
+        mock_set_updated_data.assert_called_with({any_cid: any_initial_value})
         mock_api_client.control.assert_called_once_with(
             coordinator._inverter.info.serial_number, any_cid, any_value, any_old_value
         )
-        mock_request_refresh.assert_called_once()
+        mock_api_client.read_batch.assert_called_once()
+
+
+async def test_async_update_data_deadline_bounded_by_polling_interval(
+    hass: HomeAssistant, coordinator, mock_api_client
+):
+    mock_api_client.read_batch.return_value = {}
+
+    await coordinator._async_update_data()
+
+    deadline = mock_api_client.read_batch.call_args.kwargs["deadline"]
+    assert 0 < deadline.remaining_seconds <= timedelta(minutes=5).total_seconds()
+    assert mock_api_client.read.call_args.kwargs["deadline"] is deadline
+
+
+async def test_async_shutdown_cancels_pending_work(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, any_inverter
+):
+    cid = any_inverter.charge_discharge_settings.cid
+    coordinator = SolisCloudControlCoordinator(
+        hass, mock_config_entry, mock_api_client, any_inverter, control_edit_window_seconds=60
+    )
+    coordinator.data = {cid: "0,0,0"}
+    control_edit = asyncio.create_task(coordinator.control_edit(cid, _set_field(0, "1")))
+    await asyncio.sleep(0)
+
+    await coordinator.async_shutdown()
+
+    with pytest.raises(asyncio.CancelledError):
+        await control_edit
+    mock_api_client.control.assert_not_called()
+    mock_api_client.async_cancel.assert_awaited_once()
+
+
+async def test_async_shutdown_cancels_running_control_and_read_back(
+    hass: HomeAssistant, coordinator, mock_api_client, any_inverter
+):
+    control_cid = any_inverter.battery_reserve_soc.cid
+    read_back_cid = any_inverter.battery_max_charge_soc.cid
+    never_released = asyncio.Event()
+
+    async def wait_forever(*_args: object, **_kwargs: object) -> None:
+        await never_released.wait()
+
+    mock_api_client.read_batch.side_effect = wait_forever
+    await coordinator.control(read_back_cid, "any value")
+    mock_api_client.control.side_effect = wait_forever
+    control = asyncio.create_task(coordinator.control(control_cid, "any value"))
+    await asyncio.sleep(0)
+
+    await coordinator.async_shutdown()
+
+    with pytest.raises(asyncio.CancelledError):
+        await control
+    assert coordinator._read_back_tasks == {}
+    assert coordinator._control_tasks == set()
+
+
+async def test_control_after_shutdown_does_nothing(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    await coordinator.async_shutdown()
+
+    await coordinator.control(any_inverter.battery_reserve_soc.cid, "any value")
+
+    mock_api_client.control.assert_not_called()
+
+
+def _set_field(index: int, field: str):
+    def edit(value: str | None) -> str | None:
+        fields = value.split(",")
+        fields[index] = field
+        return ",".join(fields)
+
+    return edit
+
+
+async def test_control_edit_merges_concurrent_edits(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    cid = any_inverter.charge_discharge_settings.cid
+    coordinator.data = {cid: "0,0,0"}
+    mock_api_client.read.return_value = "1,3,2"
+    mock_api_client.read_batch.return_value = {cid: "1,3,2"}
+
+    with patch.object(coordinator, "async_set_updated_data", Mock()):
+        await asyncio.gather(
+            coordinator.control_edit(cid, _set_field(0, "1")),
+            coordinator.control_edit(cid, _set_field(1, "2")),
+            coordinator.control_edit(cid, _set_field(2, "2")),
+            coordinator.control_edit(cid, _set_field(1, "3")),
+        )
+
+    mock_api_client.control.assert_called_once_with(any_inverter.info.serial_number, cid, "1,3,2", None)
+
+
+async def test_control_edit_after_window_starts_new_control(
+    hass: HomeAssistant, coordinator, mock_api_client, any_inverter
+):
+    cid = any_inverter.charge_discharge_settings.cid
+    coordinator.data = {cid: "0,0"}
+    mock_api_client.read.side_effect = ["1,0", "1,1"]
+    mock_api_client.read_batch.side_effect = [{cid: "1,0"}, {cid: "1,1"}]
+
+    await coordinator.control_edit(cid, _set_field(0, "1"))
+    await coordinator.control_edit(cid, _set_field(1, "1"))
+
+    assert [call.args[2] for call in mock_api_client.control.call_args_list] == ["1,0", "1,1"]
+
+
+async def test_control_edit_without_change(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    cid = any_inverter.charge_discharge_settings.cid
+    coordinator.data = {cid: "0,0"}
+
+    await asyncio.gather(
+        coordinator.control_edit(cid, lambda _value: None),
+        coordinator.control_edit(cid, _set_field(0, "0")),
+    )
+
+    mock_api_client.control.assert_not_called()
+
+
+async def test_control_edit_api_error(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    cid = any_inverter.charge_discharge_settings.cid
+    coordinator.data = {cid: "0,0"}
+    mock_api_client.control.side_effect = SolisCloudControlApiError("any error")
+    mock_api_client.read.return_value = "0,0"
+    mock_api_client.read_batch.return_value = {cid: "0,0"}
+
+    with patch.object(coordinator, "async_set_updated_data", Mock()):
+        results = await asyncio.gather(
+            coordinator.control_edit(cid, _set_field(0, "1")),
+            coordinator.control_edit(cid, _set_field(1, "1")),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(result, SolisCloudControlApiError) for result in results)
+    mock_api_client.control.assert_called_once()
+
+
+async def test_restore(hass: HomeAssistant, coordinator, mock_api_client, any_inverter, freezer):
+    any_cid = any_inverter.read_batch_cids[0]
+    other_cid = any_inverter.read_batch_cids[1]
+
+    now = dt_util.utcnow()
+
+    coordinator.restore(
+        {any_cid: "restored value", other_cid: "restored value"},
+        {any_cid: now, other_cid: now - timedelta(minutes=10)},
+    )
+
+    assert coordinator.data == {any_cid: "restored value", other_cid: "restored value"}
+    assert coordinator.is_fresh(any_cid)
+    assert coordinator.is_restored(any_cid)
+
+    mock_api_client.read_batch.return_value = {any_cid: "any value"}
+    await coordinator._async_update_data()
+
+    assert not coordinator.is_restored(any_cid)
+    assert coordinator.is_restored(other_cid)
+
+    freezer.tick(timedelta(minutes=6))
+    assert not coordinator.is_fresh(other_cid)
+
+
+async def test_restore_ages_values_from_when_they_were_read(hass: HomeAssistant, coordinator, any_inverter):
+    old_cid = any_inverter.storage_mode.cid
+    recent_cid = any_inverter.battery_reserve_soc.cid
+    unknown_age_cid = any_inverter.time.cid
+
+    coordinator.restore(
+        {old_cid: "restored value", recent_cid: "restored value", unknown_age_cid: "restored value"},
+        {old_cid: dt_util.utcnow() - timedelta(days=2), recent_cid: dt_util.utcnow()},
+    )
+
+    assert coordinator.available_cids == {recent_cid}
+
+
+async def test_async_update_data_saves_snapshot(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, any_inverter, freezer
+):
+    store = Mock()
+    coordinator = SolisCloudControlCoordinator(
+        hass=hass,
+        config_entry=mock_config_entry,
+        api_client=mock_api_client,
+        inverter=any_inverter,
+        store=store,
+    )
+    mock_api_client.read_batch.return_value = {}
+    mock_api_client.read.return_value = "any value"
+
+    data = await coordinator._async_update_data()
+
+    store.async_delay_save.assert_called_once_with(
+        SolisCloudControlSnapshot(dict(data), {any_inverter.charge_discharge_settings.cid: dt_util.utcnow()})
+    )
+
+
+async def test_data_view_is_cached_per_snapshot(hass: HomeAssistant, coordinator, any_inverter):
+    cid = any_inverter.storage_mode.cid
+    coordinator.data = SolisCloudControlData({cid: "33"})
+
+    data_view = coordinator.data_view
+    storage_mode = data_view.storage_mode(cid)
+
+    assert storage_mode is not None
+    assert storage_mode.mode == 33
+    assert coordinator.data_view is data_view
+    assert data_view.storage_mode(cid) is storage_mode
+
+    coordinator.async_set_updated_data(SolisCloudControlData({cid: "35"}))
+
+    assert coordinator.data_view is not data_view
+    assert coordinator.data_view.storage_mode(cid).mode == 35
+
+
+def test_data_view_charge_discharge_settings():
+    data_view = SolisCloudControlDataView({103: "50,0,09:00-10:00,11:00-12:00,0,0,,,0,0,,", 104: "invalid"})
+
+    settings = data_view.charge_discharge_settings(103)
+
+    assert settings is not None
+    assert settings.get_charge_current(1) == 50
+    assert data_view.charge_discharge_settings(103) is settings
+    assert data_view.charge_discharge_settings(104) is None
+    assert data_view.storage_mode(105) is None
+
+
+def test_data_view_slot_switches_value(any_inverter):
+    slots = any_inverter.charge_discharge_slots
+    data_view = SolisCloudControlDataView(
+        {
+            slots.charge_slot1.switch_cid: "1",
+            slots.charge_slot2.switch_cid: "0",
+            slots.discharge_slot1.switch_cid: "1",
+        }
+    )
+
+    expected_value = (1 << slots.bit_charge_slot1) | (1 << slots.bit_discharge_slot1)
+    assert data_view.slot_switches_value(slots) == str(expected_value)
+
+
+async def test_update_listeners_notifies_changed_cids_only(hass: HomeAssistant, coordinator):
+    listener1 = Mock()
+    listener2 = Mock()
+    other_listener = Mock()
+    coordinator.async_add_listener(listener1, frozenset({1}))
+    remove_listener2 = coordinator.async_add_listener(listener2, frozenset({2, 3}))
+    coordinator.async_add_listener(other_listener)
+
+    coordinator.async_set_updated_data(SolisCloudControlData({1: "a", 2: "b", 3: "c"}))
+    assert (listener1.call_count, listener2.call_count, other_listener.call_count) == (1, 1, 1)
+
+    coordinator.async_set_updated_data(SolisCloudControlData({1: "a", 2: "b", 3: "c"}))
+    assert (listener1.call_count, listener2.call_count, other_listener.call_count) == (1, 1, 2)
+
+    coordinator.async_set_updated_data(SolisCloudControlData({1: "a", 2: "b", 3: None}))
+    assert (listener1.call_count, listener2.call_count, other_listener.call_count) == (1, 2, 3)
+
+    remove_listener2()
+    coordinator.async_set_updated_data(SolisCloudControlData({1: "x", 2: "y"}))
+    assert (listener1.call_count, listener2.call_count, other_listener.call_count) == (2, 2, 4)
+
+
+async def test_update_listeners_notifies_all_on_update_success_change(hass: HomeAssistant, coordinator):
+    listener = Mock()
+    coordinator.async_add_listener(listener, frozenset({1}))
+    coordinator.async_set_updated_data(SolisCloudControlData({1: "a"}))
+
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+
+    assert listener.call_count == 2
+
+
+async def test_update_listeners_notifies_unrestored_cids(
+    hass: HomeAssistant, coordinator, mock_api_client, any_inverter
+):
+    cid = any_inverter.battery_reserve_soc.cid
+    listener = Mock()
+    coordinator.async_add_listener(listener, frozenset({cid}))
+    coordinator.restore({cid: "any value"}, {cid: dt_util.utcnow()})
+    coordinator.async_update_listeners()
+
+    mock_api_client.read_batch.return_value = {cid: "any value"}
+    await coordinator.control(cid, "any value")
+    await hass.async_block_till_done()
+
+    assert listener.call_count == 2
+    assert not coordinator.is_restored(cid)
+
+
+async def test_available_cids(hass: HomeAssistant, coordinator, mock_api_client, any_inverter, freezer):
+    fast_cid = any_inverter.storage_mode.cid
+    slow_cid = any_inverter.battery_reserve_soc.cid
+    missing_cid = any_inverter.max_output_power.cid
+    mock_api_client.read_batch.return_value = {fast_cid: "any value", slow_cid: "any value"}
+
+    coordinator.async_set_updated_data(await coordinator._async_update_data())
+
+    available_cids = coordinator.available_cids
+    assert {fast_cid, slow_cid} <= available_cids
+    assert missing_cid not in available_cids
+    assert coordinator.available_cids is available_cids
+
+    freezer.tick(timedelta(minutes=16))
+    assert fast_cid not in coordinator.available_cids
+    assert slow_cid in coordinator.available_cids
+
+
+async def test_stale_values_become_unavailable_while_polls_fail(
+    hass: HomeAssistant, coordinator, mock_api_client, any_inverter, freezer
+):
+    fast_cid = any_inverter.storage_mode.cid
+    slow_cid = any_inverter.battery_reserve_soc.cid
+    mock_api_client.read_batch.return_value = {fast_cid: "any value", slow_cid: "any value"}
+    mock_api_client.read.return_value = "any value"
+    fast_listener = Mock()
+    slow_listener = Mock()
+    coordinator.async_add_listener(fast_listener, frozenset({fast_cid}))
+    coordinator.async_add_listener(slow_listener, frozenset({slow_cid}))
+    await coordinator.async_refresh()
+
+    mock_api_client.read_batch.side_effect = SolisCloudControlApiError("any error", response_code="B0107")
+    mock_api_client.read.side_effect = SolisCloudControlApiError("any error", response_code="B0107")
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert (fast_listener.call_count, slow_listener.call_count) == (2, 2)
+
+    # failed polls back off, which extends the max data age up to three max polling intervals
+    freezer.tick(timedelta(minutes=46))
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+
+    assert fast_cid not in coordinator.available_cids
+    assert (fast_listener.call_count, slow_listener.call_count) == (3, 2)
+
+    await coordinator.async_shutdown()
+
+
+async def test_available_cids_without_data(hass: HomeAssistant, coordinator):
+    assert coordinator.available_cids == frozenset()
+
+
+async def test_open_circuit_makes_cids_unavailable(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    cid = any_inverter.storage_mode.cid
+    mock_api_client.read_batch.return_value = {cid: "any value"}
+    coordinator.async_set_updated_data(await coordinator._async_update_data())
+    listener = Mock()
+    coordinator.async_add_listener(listener, frozenset({cid}))
+    circuit_breaker = mock_api_client.circuit_breaker
+
+    for _ in range(5):
+        circuit_breaker.record_failure()
+
+    assert not coordinator.cloud_available
+    assert coordinator.available_cids == frozenset()
+    assert listener.call_count == 1
+
+    circuit_breaker.record_success()
+
+    assert coordinator.cloud_available
+    assert cid in coordinator.available_cids
+    assert listener.call_count == 2
+
+
+async def test_polling_scheduler_drives_refresh(hass: HomeAssistant, mock_config_entry, mock_api_client, any_inverter):
+    polling_scheduler = Mock()
+    coordinator = SolisCloudControlCoordinator(
+        hass, mock_config_entry, mock_api_client, any_inverter, polling_scheduler=polling_scheduler
+    )
+    poll, interval = polling_scheduler.async_register.call_args.args
+    read_released = asyncio.Event()
+
+    async def read_batch(*_args: object, **_kwargs: object) -> dict[int, str]:
+        await read_released.wait()
+        return {}
+
+    mock_api_client.read_batch.side_effect = read_batch
+
+    assert coordinator.update_interval is None
+    assert interval == timedelta(minutes=5)
+
+    poll()
+    poll()
+    read_released.set()
+    await hass.async_block_till_done()
+
+    assert mock_api_client.read_batch.call_count == 1
+
+    poll()
+    await hass.async_block_till_done()
+
+    assert mock_api_client.read_batch.call_count == 2
+
+
+async def test_async_update_data_api_error_backs_off_polling(hass: HomeAssistant, coordinator, mock_api_client):
+    mock_api_client.read_batch.side_effect = SolisCloudControlApiError("any error")
+    mock_api_client.read.side_effect = SolisCloudControlApiError("any error")
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    assert coordinator.update_interval == timedelta(minutes=10)
+    assert coordinator.polling_interval.failure_rate == 0.5
+
+
+async def test_async_update_data_open_circuit_keeps_polling_interval(hass: HomeAssistant, coordinator, mock_api_client):
+    mock_api_client.read_batch.side_effect = SolisCloudControlApiCircuitOpenError("any error")
+    mock_api_client.read.side_effect = SolisCloudControlApiCircuitOpenError("any error")
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    assert coordinator.update_interval == timedelta(minutes=5)
+    assert coordinator.polling_interval.failure_rate == 0
+
+
+async def test_control_tightens_polling(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    any_cid = any_inverter.battery_reserve_soc.cid
+    mock_api_client.read_batch.return_value = {any_cid: "any value"}
+
+    await coordinator.control(any_cid, "any value")
+    await hass.async_block_till_done()
+
+    assert coordinator.update_interval == timedelta(minutes=1)
+
+
+async def test_request_refresh_tightens_polling(hass: HomeAssistant, coordinator):
+    await coordinator.async_request_refresh()
+
+    assert coordinator.update_interval == timedelta(minutes=1)
+
+
+async def test_tightened_polling_reads_fast_tier_and_keeps_data_age(
+    hass: HomeAssistant, coordinator, mock_api_client, any_inverter, freezer: FrozenDateTimeFactory
+):
+    fast_cid = any_inverter.storage_mode.cid
+    mock_api_client.read_batch.return_value = {fast_cid: "any value"}
+
+    await coordinator._async_update_data()
+    coordinator._set_polling_interval(coordinator.polling_interval.tighten())
+    freezer.tick(timedelta(minutes=4))
+
+    assert coordinator.is_fresh(fast_cid)
+    assert coordinator._due_tiers() == {RefreshTier.FAST}
+
+
+async def test_polling_scheduler_follows_polling_interval(
+    hass: HomeAssistant, mock_config_entry, mock_api_client, any_inverter
+):
+    polling_scheduler = Mock()
+    coordinator = SolisCloudControlCoordinator(
+        hass, mock_config_entry, mock_api_client, any_inverter, polling_scheduler=polling_scheduler
+    )
+    poll, _ = polling_scheduler.async_register.call_args.args
+
+    await coordinator.async_request_refresh()
+    await coordinator.async_request_refresh()
+
+    polling_scheduler.async_update_interval.assert_called_once_with(poll, timedelta(minutes=1))
+    assert coordinator.update_interval is None
+
+
+async def test_async_refresh_records_cycle_trace(hass: HomeAssistant, coordinator, mock_api_client, any_inverter):
+    mock_api_client.read_batch.return_value = dict.fromkeys(any_inverter.read_batch_cids, "any value")
+    mock_api_client.read.return_value = "any value"
+    listener = Mock()
+    coordinator.async_add_listener(listener)
+
+    await coordinator.async_refresh()
+
+    (trace,) = coordinator.cycle_traces
+    assert not trace.failed
+    assert trace.entities_notified == 1
+    assert [phase.name for phase in trace.phases] == ["read_batch", "read", "merge", "notify"]
+
+
+async def test_async_refresh_records_failed_cycle_trace(hass: HomeAssistant, coordinator, mock_api_client):
+    mock_api_client.read_batch.side_effect = SolisCloudControlApiError("any error")
+    mock_api_client.read.side_effect = SolisCloudControlApiError("any error")
+
+    await coordinator.async_refresh()
+
+    (trace,) = coordinator.cycle_traces
+    assert trace.failed
+    assert [phase.name for phase in trace.phases] == ["read_batch", "read", "notify"]
+
+
+async def test_slow_cycle_fires_event(hass: HomeAssistant, mock_config_entry, mock_api_client, any_inverter):
+    coordinator = SolisCloudControlCoordinator(
+        hass, mock_config_entry, mock_api_client, any_inverter, slow_cycle_threshold_seconds=-1
+    )
+    mock_api_client.read_batch.return_value = {}
+    mock_api_client.read.return_value = "any value"
+    events = async_capture_events(hass, EVENT_SLOW_UPDATE_CYCLE)
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    (event,) = events
+    assert event.data["config_entry_id"] == mock_config_entry.entry_id
+    assert event.data["threshold_seconds"] == -1
+    assert event.data["duration_seconds"] == coordinator.cycle_traces[0].duration_seconds
+
+
+async def test_fast_cycle_fires_no_event(hass: HomeAssistant, coordinator, mock_api_client):
+    mock_api_client.read_batch.return_value = {}
+    mock_api_client.read.return_value = "any value"
+    events = async_capture_events(hass, EVENT_SLOW_UPDATE_CYCLE)
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert events == []
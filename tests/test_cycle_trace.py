@@ -0,0 +1,67 @@
+from custom_components.solis_cloud_control.api.solis_api_metrics import SolisCloudControlApiMetrics
+from custom_components.solis_cloud_control.cycle_trace import CyclePhase, CycleTracer
+
+
+def test_traces_phases_of_a_cycle(fake_clock):
+    metrics = SolisCloudControlApiMetrics()
+    tracer = CycleTracer(metrics.totals, monotonic_time=fake_clock.monotonic)
+
+    assert tracer.start()
+    with tracer.phase("read_batch"):
+        fake_clock.now += 2.0
+        metrics.record_request("/v2/api/atReadBatch", 1.0, error_code="timeout", bytes_sent=60)
+        metrics.record_request("/v2/api/atReadBatch", 1.0, bytes_sent=60)
+        metrics.record_bytes_received("/v2/api/atReadBatch", 900)
+        metrics.record_retries("/v2/api/atReadBatch", 1)
+    with tracer.phase("notify"):
+        fake_clock.now += 0.5
+        tracer.record_entities_notified(3)
+    trace = tracer.finish(failed=False)
+
+    assert trace is not None
+    assert trace.duration_seconds == 2.5
+    assert not trace.failed
+    assert trace.entities_notified == 3
+    assert trace.phases == (
+        CyclePhase("read_batch", 2.0, requests=2, retries=1, errors=1, bytes_sent=120, bytes_received=900),
+        CyclePhase("notify", 0.5, requests=0, retries=0, errors=0, bytes_sent=0, bytes_received=0),
+    )
+    assert tracer.traces == (trace,)
+
+
+def test_keeps_last_traces():
+    tracer = CycleTracer(SolisCloudControlApiMetrics().totals, max_traces=2)
+
+    for _ in range(3):
+        tracer.start()
+        with tracer.phase("read_batch"):
+            pass
+        tracer.finish(failed=True)
+
+    assert len(tracer.traces) == 2
+
+
+def test_ignores_phases_outside_a_cycle():
+    tracer = CycleTracer(SolisCloudControlApiMetrics().totals)
+
+    with tracer.phase("notify"):
+        tracer.record_entities_notified(3)
+
+    assert tracer.finish(failed=False) is None
+    assert tracer.traces == ()
+
+
+def test_does_not_trace_overlapping_cycle():
+    tracer = CycleTracer(SolisCloudControlApiMetrics().totals)
+
+    assert tracer.start()
+    assert not tracer.start()
+
+
+def test_drops_cycle_without_phases():
+    tracer = CycleTracer(SolisCloudControlApiMetrics().totals)
+
+    tracer.start()
+
+    assert tracer.finish(failed=False) is None
+    assert tracer.traces == ()
@@ -1,11 +1,26 @@
 from dataclasses import asdict
+from datetime import UTC, datetime
 
+from custom_components.solis_cloud_control.api.solis_api_connection_pool import SolisCloudControlConnectionPool
+from custom_components.solis_cloud_control.api.solis_api_metrics import SolisCloudControlApiMetrics
+from custom_components.solis_cloud_control.cycle_trace import CyclePhase, CycleTrace
 from custom_components.solis_cloud_control.data import SolisCloudControlData
 from custom_components.solis_cloud_control.diagnostics import async_get_config_entry_diagnostics
 
+any_cycle_trace = CycleTrace(
+    started_at=datetime(2025, 1, 1, tzinfo=UTC),
+    duration_seconds=1.5,
+    failed=False,
+    entities_notified=3,
+    phases=(CyclePhase("read_batch", 1.5, requests=1, retries=0, errors=0, bytes_sent=60, bytes_received=900),),
+)
+
 
 async def test_diagnostics(hass, mock_coordinator, mock_config_entry, any_inverter) -> None:
     mock_coordinator.data = {1: "any value"}
+    mock_coordinator.api_metrics = SolisCloudControlApiMetrics()
+    mock_coordinator.api_metrics.record_request("/v2/api/atRead", 0.3)
+    mock_coordinator.cycle_traces = (any_cycle_trace,)
     mock_config_entry.runtime_data = SolisCloudControlData(inverter=any_inverter, coordinator=mock_coordinator)
 
     diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
@@ -16,4 +31,21 @@ async def test_diagnostics(hass, mock_coordinator, mock_config_entry, any_invert
     assert diagnostics == {
         "inverter_info": expected_inverter_info,
         "coordinator_data": mock_coordinator.data,
+        "api_metrics": {"atRead": mock_coordinator.api_metrics.endpoint("atRead").as_dict()},
+        "cycle_traces": [asdict(any_cycle_trace)],
+        "connection_pool": None,
     }
+
+
+async def test_diagnostics_connection_pool(hass, mock_coordinator, mock_config_entry, any_inverter) -> None:
+    mock_coordinator.api_metrics = SolisCloudControlApiMetrics()
+    mock_coordinator.cycle_traces = ()
+    connection_pool = SolisCloudControlConnectionPool()
+    mock_config_entry.runtime_data = SolisCloudControlData(
+        inverter=any_inverter, coordinator=mock_coordinator, connection_pool=connection_pool
+    )
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    assert diagnostics["connection_pool"] == asdict(connection_pool.metrics)
+    await connection_pool.async_close()
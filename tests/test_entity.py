@@ -5,7 +5,21 @@ from custom_components.solis_cloud_control.entity import SolisCloudControlEntity
 
 
 class TestSolisCloudControlEntity:
+    def test_available_when_cid_is_stale(self, mock_coordinator):
+        mock_coordinator.data = {1: "any value"}
+        mock_coordinator.is_fresh.return_value = False
+
+        entity = SolisCloudControlEntity(
+            coordinator=mock_coordinator,
+            entity_description=EntityDescription(key="any_key", name="any name"),
+            cids=1,
+        )
+
+        assert entity.available is False
+        mock_coordinator.is_fresh.assert_called_once_with(1)
+
     def test_available_when_coordinator_last_update_failed(self, mock_coordinator):
+        mock_coordinator.data = {1: "any value"}
         mock_coordinator.last_update_success = False
 
         entity = SolisCloudControlEntity(
@@ -14,7 +28,7 @@ class TestSolisCloudControlEntity:
             cids=1,
         )
 
-        assert entity.available is False
+        assert entity.available is True
 
     @pytest.mark.parametrize(
         ("coordinator_data", "expected_available"),
@@ -56,3 +70,33 @@ class TestSolisCloudControlEntity:
         )
         mock_coordinator.data = coordinator_data
         assert entity.available == expected_available
+
+    @pytest.mark.parametrize(
+        ("restored_cids", "expected_attributes"),
+        [
+            ({1}, {"restored": True}),
+            ({3}, {"restored": True}),
+            (set(), None),
+        ],
+    )
+    def test_extra_state_attributes_restored(self, mock_coordinator, restored_cids, expected_attributes):
+        mock_coordinator.is_restored.side_effect = lambda cid: cid in restored_cids
+
+        entity = SolisCloudControlEntity(
+            coordinator=mock_coordinator,
+            entity_description=EntityDescription(key="any_key", name="any name"),
+            cids=[1, 3],
+        )
+
+        assert entity.extra_state_attributes == expected_attributes
+
+    def test_coordinator_context(self, mock_coordinator):
+        entity = SolisCloudControlEntity(
+            coordinator=mock_coordinator,
+            entity_description=EntityDescription(key="any_key", name="any name"),
+            cids=[1, 2],
+            dependent_cids=[3],
+        )
+
+        assert entity.cids == [1, 2]
+        assert entity.coordinator_context == frozenset({1, 2, 3})
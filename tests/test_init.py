@@ -1,15 +1,33 @@
 from collections import Counter
+from dataclasses import asdict, replace
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import CONF_API_KEY, CONF_API_TOKEN, CONF_TOKEN, Platform
+from homeassistant.const import (
+    CONF_API_KEY,
+    CONF_API_TOKEN,
+    CONF_TOKEN,
+    EVENT_HOMEASSISTANT_CLOSE,
+    EntityCategory,
+    Platform,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.solis_cloud_control import async_migrate_entry, async_remove_config_entry_device
-from custom_components.solis_cloud_control.const import CONF_INVERTER_SN, DOMAIN
+from custom_components.solis_cloud_control import (
+    _create_api_client,
+    _get_connection_pool,
+    _get_polling_scheduler,
+    async_migrate_entry,
+    async_remove_config_entry_device,
+    async_remove_entry,
+)
+from custom_components.solis_cloud_control.api.solis_api import SolisCloudControlApiError
+from custom_components.solis_cloud_control.const import API_BASE_URL, CONF_INVERTER_SN, DOMAIN
 from custom_components.solis_cloud_control.inverters.inverter import Inverter
 
 
@@ -39,7 +57,7 @@ async def test_async_setup_entry(hass, mock_api_client, mock_config_entry, any_i
 
     charge_discharge_settings = "0,0,00:00,00:00,00:00,00:00,0,0,00:00,00:00,00:00,00:00,0,0,00:00,00:00,00:00,00:00"
 
-    mock_api_client.read.side_effect = lambda inverter_sn, cid, max_retry_time: (  # noqa: ARG005
+    mock_api_client.read.side_effect = lambda inverter_sn, cid, max_retry_time, **kwargs: (  # noqa: ARG005
         charge_discharge_settings if cid == 103 else None
     )
 
@@ -69,6 +87,8 @@ async def test_async_setup_entry(hass, mock_api_client, mock_config_entry, any_i
     assert hasattr(mock_config_entry, "runtime_data")
     assert mock_config_entry.runtime_data.coordinator is not None
     assert mock_config_entry.runtime_data.inverter is not None
+    assert mock_config_entry.runtime_data.connection_pool is _get_connection_pool(hass, API_BASE_URL)
+    mock_api_client.async_warm_up.assert_awaited_once()
 
     # check device registration
     device_registry = dr.async_get(hass)
@@ -89,7 +109,7 @@ async def test_async_setup_entry(hass, mock_api_client, mock_config_entry, any_i
     assert platform_counts[Platform.DATETIME] == 1
     assert platform_counts[Platform.NUMBER] == 40
     assert platform_counts[Platform.SELECT] == 1
-    assert platform_counts[Platform.SENSOR] == 7
+    assert platform_counts[Platform.SENSOR] == 12
     assert platform_counts[Platform.SWITCH] == 18
     assert platform_counts[Platform.TEXT] == 18
 
@@ -97,13 +117,14 @@ async def test_async_setup_entry(hass, mock_api_client, mock_config_entry, any_i
     assert platform_disabled_counts[Platform.DATETIME] == 0
     assert platform_disabled_counts[Platform.NUMBER] == 0
     assert platform_disabled_counts[Platform.SELECT] == 0
-    assert platform_disabled_counts[Platform.SENSOR] == 7
+    assert platform_disabled_counts[Platform.SENSOR] == 12
     assert platform_disabled_counts[Platform.SWITCH] == 0
     assert platform_disabled_counts[Platform.TEXT] == 0
 
 
 async def test_async_setup_entry_undefined_inverter(hass, mock_api_client, mock_config_entry, any_inverter_info):
     undefined_inverter = Inverter(info=any_inverter_info)
+    mock_api_client.read_batch.return_value = {}
 
     with (
         patch(
@@ -125,7 +146,182 @@ async def test_async_setup_entry_undefined_inverter(hass, mock_api_client, mock_
     # check entity registration
     entity_registry = er.async_get(hass)
     entries = er.async_entries_for_config_entry(entity_registry, mock_config_entry.entry_id)
-    assert len(entries) == 0
+    assert [entry for entry in entries if entry.entity_category != EntityCategory.DIAGNOSTIC] == []
+
+
+def _store_snapshot(hass_storage, config_entry, data):
+    key = f"{DOMAIN}.{config_entry.entry_id}"
+    updated_at = dt_util.utcnow().isoformat()
+    hass_storage[key] = {
+        "version": 1,
+        "key": key,
+        "data": {
+            "data": {str(cid): value for cid, value in data.items()},
+            "updated_at": {str(cid): updated_at for cid in data},
+        },
+    }
+
+
+def _store_inverter_info(hass_storage, inverter_info, validated_at):
+    key = f"{DOMAIN}.inverter_info"
+    hass_storage[key] = {
+        "version": 1,
+        "key": key,
+        "data": {
+            inverter_info.serial_number: {
+                "inverter_info": asdict(inverter_info),
+                "validated_at": validated_at.isoformat(),
+            },
+        },
+    }
+
+
+async def _setup_entry(hass, config_entry, api_client, inverter, **create_inverter_info_kwargs: object):
+    with (
+        patch(
+            "custom_components.solis_cloud_control._create_api_client",
+            return_value=api_client,
+        ),
+        patch(
+            "custom_components.solis_cloud_control.create_inverter_info",
+            **create_inverter_info_kwargs,
+        ) as mock_create_inverter_info,
+        patch(
+            "custom_components.solis_cloud_control.create_inverter",
+            return_value=inverter,
+        ) as mock_create_inverter,
+        patch.object(hass.config_entries, "async_schedule_reload") as mock_schedule_reload,
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    return mock_create_inverter_info, mock_create_inverter, mock_schedule_reload
+
+
+async def test_async_setup_entry_restores_snapshot(
+    hass, hass_storage, mock_api_client, mock_config_entry, any_inverter_info
+):
+    _store_inverter_info(hass_storage, any_inverter_info, dt_util.utcnow())
+    _store_snapshot(hass_storage, mock_config_entry, {103: "restored value"})
+    mock_api_client.read_batch.side_effect = SolisCloudControlApiError("any error")
+
+    mock_create_inverter_info, mock_create_inverter, _ = await _setup_entry(
+        hass, mock_config_entry, mock_api_client, Inverter(info=any_inverter_info)
+    )
+
+    # neither the inverter info nor the failing refresh block the setup
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert mock_config_entry.runtime_data.coordinator.data == {103: "restored value"}
+    assert mock_config_entry.runtime_data.coordinator.is_restored(103)
+    assert mock_config_entry.runtime_data.coordinator.is_fresh(103)
+    mock_create_inverter_info.assert_not_called()
+    mock_create_inverter.assert_called_once_with(any_inverter_info)
+
+
+async def test_async_setup_entry_caches_inverter_info(
+    hass, hass_storage, mock_api_client, mock_config_entry, any_inverter_info
+):
+    mock_api_client.read_batch.return_value = {}
+
+    mock_create_inverter_info, _, _ = await _setup_entry(
+        hass, mock_config_entry, mock_api_client, Inverter(info=any_inverter_info), return_value=any_inverter_info
+    )
+
+    mock_create_inverter_info.assert_called_once_with(mock_api_client, any_inverter_info.serial_number)
+    stored = hass_storage[f"{DOMAIN}.inverter_info"]["data"]
+    assert stored[any_inverter_info.serial_number]["inverter_info"] == asdict(any_inverter_info)
+
+
+async def test_async_setup_entry_revalidates_cached_inverter_info(
+    hass, hass_storage, mock_api_client, mock_config_entry, any_inverter_info
+):
+    _store_inverter_info(hass_storage, any_inverter_info, dt_util.utcnow() - timedelta(days=2))
+    mock_api_client.read_batch.return_value = {}
+
+    mock_create_inverter_info, mock_create_inverter, mock_schedule_reload = await _setup_entry(
+        hass, mock_config_entry, mock_api_client, Inverter(info=any_inverter_info), return_value=any_inverter_info
+    )
+
+    mock_create_inverter.assert_called_once_with(any_inverter_info)
+    mock_create_inverter_info.assert_called_once_with(
+        mock_api_client, any_inverter_info.serial_number, any_inverter_info
+    )
+    mock_schedule_reload.assert_not_called()
+
+    stored = hass_storage[f"{DOMAIN}.inverter_info"]["data"][any_inverter_info.serial_number]
+    assert dt_util.utcnow() - datetime.fromisoformat(stored["validated_at"]) < timedelta(minutes=1)
+
+
+async def test_async_setup_entry_reloads_on_changed_inverter_info(
+    hass, hass_storage, mock_api_client, mock_config_entry, any_inverter_info
+):
+    changed_inverter_info = replace(any_inverter_info, version="other_version")
+    _store_inverter_info(hass_storage, any_inverter_info, dt_util.utcnow() - timedelta(days=2))
+    mock_api_client.read_batch.return_value = {}
+
+    _, _, mock_schedule_reload = await _setup_entry(
+        hass, mock_config_entry, mock_api_client, Inverter(info=any_inverter_info), return_value=changed_inverter_info
+    )
+
+    mock_schedule_reload.assert_called_once_with(mock_config_entry.entry_id)
+    stored = hass_storage[f"{DOMAIN}.inverter_info"]["data"][any_inverter_info.serial_number]
+    assert stored["inverter_info"]["version"] == "other_version"
+
+
+async def test_async_setup_entry_keeps_inverter_info_on_revalidation_error(
+    hass, hass_storage, mock_api_client, mock_config_entry, any_inverter_info
+):
+    _store_inverter_info(hass_storage, any_inverter_info, dt_util.utcnow() - timedelta(days=2))
+    mock_api_client.read_batch.return_value = {}
+
+    _, _, mock_schedule_reload = await _setup_entry(
+        hass,
+        mock_config_entry,
+        mock_api_client,
+        Inverter(info=any_inverter_info),
+        side_effect=SolisCloudControlApiError("any error"),
+    )
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    mock_schedule_reload.assert_not_called()
+
+
+async def test_connection_pool_is_warmed_up_once_and_closed_with_last_entry(
+    hass, mock_api_client, mock_config_entry, any_inverter_info
+):
+    other_config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={**mock_config_entry.data, CONF_INVERTER_SN: "other_inverter_sn"},
+    )
+    other_config_entry.add_to_hass(hass)
+    inverter = Inverter(info=any_inverter_info)
+    mock_api_client.read_batch.return_value = {}
+
+    # setting up the integration sets up both entries
+    await _setup_entry(hass, mock_config_entry, mock_api_client, inverter, return_value=any_inverter_info)
+    connection_pool = _get_connection_pool(hass, API_BASE_URL)
+
+    assert other_config_entry.state is ConfigEntryState.LOADED
+    mock_api_client.async_warm_up.assert_awaited_once()
+    assert other_config_entry.runtime_data.connection_pool is connection_pool
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    assert not connection_pool.session.closed
+
+    await hass.config_entries.async_unload(other_config_entry.entry_id)
+    assert connection_pool.session.closed
+    assert _get_connection_pool(hass, API_BASE_URL) is not connection_pool
+
+
+async def test_async_remove_entry(hass, hass_storage, mock_config_entry, any_inverter_info):
+    _store_inverter_info(hass_storage, any_inverter_info, dt_util.utcnow())
+    _store_snapshot(hass_storage, mock_config_entry, {})
+
+    await async_remove_entry(hass, mock_config_entry)
+
+    assert f"{DOMAIN}.{mock_config_entry.entry_id}" not in hass_storage
+    assert hass_storage[f"{DOMAIN}.inverter_info"]["data"] == {}
 
 
 async def test_migrate_config_entry_v1_to_v2(hass: HomeAssistant):
@@ -155,3 +351,48 @@ async def test_remove_config_entry_device(hass: HomeAssistant, mock_config_entry
         dr.DeviceEntry(),
     )
     assert result is True
+
+
+async def test_create_api_client_shares_rate_limiter_per_api_key(hass: HomeAssistant):
+    api_client1 = _create_api_client(hass, "any api key", "any api token")
+    api_client2 = _create_api_client(hass, "any api key", "any api token")
+    api_client3 = _create_api_client(hass, "other api key", "other api token")
+
+    assert api_client1._rate_limiter is api_client2._rate_limiter
+    assert api_client1._rate_limiter is not api_client3._rate_limiter
+
+
+async def test_get_polling_scheduler_shares_scheduler_per_api_key(hass: HomeAssistant):
+    polling_scheduler1 = _get_polling_scheduler(hass, "any api key")
+    polling_scheduler2 = _get_polling_scheduler(hass, "any api key")
+    polling_scheduler3 = _get_polling_scheduler(hass, "other api key")
+
+    assert polling_scheduler1 is polling_scheduler2
+    assert polling_scheduler1 is not polling_scheduler3
+
+
+async def test_create_api_client_shares_circuit_breaker_per_api_key(hass: HomeAssistant):
+    api_client1 = _create_api_client(hass, "any api key", "any api token")
+    api_client2 = _create_api_client(hass, "any api key", "any api token")
+    api_client3 = _create_api_client(hass, "other api key", "other api token")
+
+    assert api_client1.circuit_breaker is api_client2.circuit_breaker
+    assert api_client1.circuit_breaker is not api_client3.circuit_breaker
+
+
+async def test_get_connection_pool_shares_pool_per_host(hass: HomeAssistant):
+    connection_pool1 = _get_connection_pool(hass, "https://any.host")
+    connection_pool2 = _get_connection_pool(hass, "https://any.host")
+    connection_pool3 = _get_connection_pool(hass, "https://other.host")
+
+    assert connection_pool1 is connection_pool2
+    assert connection_pool1 is not connection_pool3
+    assert _create_api_client(hass, "any api key", "any api token")._session is (
+        _get_connection_pool(hass, API_BASE_URL).session
+    )
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+    assert connection_pool1.session.closed
+    assert connection_pool3.session.closed
@@ -2,7 +2,9 @@ import pytest
 from homeassistant.components.sensor import SensorEntityDescription
 from homeassistant.const import PERCENTAGE, UnitOfElectricCurrent
 
+from custom_components.solis_cloud_control.api.solis_api_metrics import SolisCloudControlApiMetrics
 from custom_components.solis_cloud_control.sensor import (
+    ApiMetricsSensor,
     BatteryCurrentSensor,
     BatterySocSensor,
 )
@@ -62,3 +64,31 @@ class TestBatteryCurrentSensor:
     def test_native_value(self, battery_current_sensor, value, expected):
         battery_current_sensor.coordinator.data = {battery_current_sensor.inverter_battery_current.cid: value}
         assert battery_current_sensor.native_value == expected
+
+
+class TestApiMetricsSensor:
+    @pytest.fixture
+    def api_metrics_sensor(self, mock_coordinator):
+        mock_coordinator.api_metrics = SolisCloudControlApiMetrics()
+        return ApiMetricsSensor(
+            coordinator=mock_coordinator,
+            entity_description=SensorEntityDescription(key="any_key", name="any name"),
+            endpoint="atReadBatch",
+        )
+
+    def test_without_requests(self, api_metrics_sensor):
+        assert api_metrics_sensor.available
+        assert api_metrics_sensor.native_value is None
+        assert api_metrics_sensor.extra_state_attributes["request_count"] == 0
+        assert api_metrics_sensor.coordinator.api_metrics.as_dict() == {}
+
+    def test_native_value_is_p95_latency(self, api_metrics_sensor):
+        api_metrics = api_metrics_sensor.coordinator.api_metrics
+        for _ in range(19):
+            api_metrics.record_request("/v2/api/atReadBatch", 0.4)
+        api_metrics.record_request("/v2/api/atReadBatch", 25.0, error_code="timeout")
+        api_metrics.record_request("/v2/api/atRead", 60.0)
+
+        assert api_metrics_sensor.native_value == 0.5
+        assert api_metrics_sensor.extra_state_attributes["error_counts"] == {"timeout": 1}
+        assert api_metrics_sensor.extra_state_attributes["latency_p99_seconds"] == 25.0
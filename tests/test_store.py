@@ -0,0 +1,111 @@
+from dataclasses import asdict, replace
+from datetime import UTC, datetime, timedelta
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.solis_cloud_control.const import DOMAIN
+from custom_components.solis_cloud_control.store import (
+    InverterInfoCache,
+    SolisCloudControlSnapshot,
+    SolisCloudControlStore,
+)
+
+
+async def test_save_and_load(hass: HomeAssistant):
+    store = SolisCloudControlStore(hass, "any_entry_id")
+    snapshot = SolisCloudControlSnapshot(
+        {103: "any value", 636: None}, {103: datetime(2025, 1, 1, tzinfo=UTC), 636: datetime(2025, 1, 2, tzinfo=UTC)}
+    )
+
+    store.async_delay_save(snapshot)
+    hass.bus.async_fire("homeassistant_final_write")
+    await hass.async_block_till_done()
+
+    assert await SolisCloudControlStore(hass, "any_entry_id").async_load() == snapshot
+
+
+async def test_load_without_snapshot(hass: HomeAssistant):
+    store = SolisCloudControlStore(hass, "any_entry_id")
+
+    assert await store.async_load() is None
+
+
+async def test_load_invalid_snapshot(hass: HomeAssistant, hass_storage):
+    hass_storage[f"{DOMAIN}.any_entry_id"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.any_entry_id",
+        "data": {"data": {"not a cid": "any value"}},
+    }
+    store = SolisCloudControlStore(hass, "any_entry_id")
+
+    assert await store.async_load() is None
+
+
+async def test_load_snapshot_without_updated_at(hass: HomeAssistant, hass_storage):
+    hass_storage[f"{DOMAIN}.any_entry_id"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.any_entry_id",
+        "data": {"data": {"103": "any value"}},
+    }
+    store = SolisCloudControlStore(hass, "any_entry_id")
+
+    assert await store.async_load() == SolisCloudControlSnapshot({103: "any value"})
+
+
+async def test_delay_save(hass: HomeAssistant, hass_storage):
+    store = SolisCloudControlStore(hass, "any_entry_id")
+
+    store.async_delay_save(SolisCloudControlSnapshot({103: "any value"}))
+    hass.bus.async_fire("homeassistant_final_write")
+    await hass.async_block_till_done()
+
+    assert hass_storage[f"{DOMAIN}.any_entry_id"]["data"]["data"] == {"103": "any value"}
+
+
+async def test_remove(hass: HomeAssistant):
+    store = SolisCloudControlStore(hass, "any_entry_id")
+    store.async_delay_save(SolisCloudControlSnapshot({}))
+    hass.bus.async_fire("homeassistant_final_write")
+    await hass.async_block_till_done()
+
+    await store.async_remove()
+
+    assert await store.async_load() is None
+
+
+async def test_inverter_info_cache(hass: HomeAssistant, any_inverter_info, freezer):
+    cache = InverterInfoCache(hass)
+    other_inverter_info = replace(any_inverter_info, serial_number="other_inverter_sn")
+
+    await cache.async_set(any_inverter_info)
+    await cache.async_set(other_inverter_info)
+
+    cached = await InverterInfoCache(hass).async_get(any_inverter_info.serial_number)
+    assert cached is not None
+    assert cached.inverter_info == any_inverter_info
+    assert not cached.needs_revalidation
+
+    freezer.tick(timedelta(days=1))
+    assert cached.needs_revalidation
+
+
+async def test_inverter_info_cache_invalidate(hass: HomeAssistant, any_inverter_info):
+    cache = InverterInfoCache(hass)
+    await cache.async_set(any_inverter_info)
+
+    await cache.async_invalidate(any_inverter_info.serial_number)
+    await cache.async_invalidate("unknown_inverter_sn")
+
+    assert await InverterInfoCache(hass).async_get(any_inverter_info.serial_number) is None
+
+
+async def test_inverter_info_cache_ignores_invalid_entry(hass: HomeAssistant, hass_storage, any_inverter_info):
+    hass_storage[f"{DOMAIN}.inverter_info"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.inverter_info",
+        "data": {
+            "any_inverter_sn": {"inverter_info": asdict(any_inverter_info), "validated_at": "invalid"},
+        },
+    }
+
+    assert await InverterInfoCache(hass).async_get("any_inverter_sn") is None
@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+import pytest
+
+from custom_components.solis_cloud_control.utils.adaptive_polling_interval import AdaptivePollingInterval
+
+_MIN_INTERVAL = timedelta(minutes=1)
+_DEFAULT_INTERVAL = timedelta(minutes=5)
+_MAX_INTERVAL = timedelta(minutes=15)
+
+
+@pytest.fixture
+def polling_interval() -> AdaptivePollingInterval:
+    return AdaptivePollingInterval(_MIN_INTERVAL, _DEFAULT_INTERVAL, _MAX_INTERVAL, struggling_latency_seconds=30.0)
+
+
+def test_starts_at_default_interval(polling_interval: AdaptivePollingInterval):
+    assert polling_interval.interval == _DEFAULT_INTERVAL
+    assert not polling_interval.is_struggling
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError, match="Invalid polling interval bounds"):
+        AdaptivePollingInterval(_DEFAULT_INTERVAL, _MIN_INTERVAL, _MAX_INTERVAL)
+
+
+def test_healthy_cycles_keep_default_interval(polling_interval: AdaptivePollingInterval):
+    for _ in range(3):
+        assert polling_interval.record_cycle(latency_seconds=1.0, failed=False) == _DEFAULT_INTERVAL
+
+
+def test_failed_cycles_back_off_up_to_max_interval(polling_interval: AdaptivePollingInterval):
+    assert polling_interval.record_cycle(latency_seconds=1.0, failed=True) == timedelta(minutes=10)
+    assert polling_interval.failure_rate == 0.5
+    assert polling_interval.record_cycle(latency_seconds=1.0, failed=True) == _MAX_INTERVAL
+
+
+def test_slow_cycles_back_off(polling_interval: AdaptivePollingInterval):
+    assert polling_interval.record_cycle(latency_seconds=60.0, failed=False) == timedelta(minutes=10)
+    assert polling_interval.latency_seconds == 30.0
+
+
+def test_recovers_to_default_interval(polling_interval: AdaptivePollingInterval):
+    polling_interval.record_cycle(latency_seconds=1.0, failed=True)
+    polling_interval.record_cycle(latency_seconds=1.0, failed=True)
+
+    assert polling_interval.record_cycle(latency_seconds=1.0, failed=False) == timedelta(minutes=7.5)
+    assert polling_interval.record_cycle(latency_seconds=1.0, failed=False) == _DEFAULT_INTERVAL
+
+
+def test_tighten_to_min_interval_and_relax(polling_interval: AdaptivePollingInterval):
+    assert polling_interval.tighten() == _MIN_INTERVAL
+
+    assert polling_interval.record_cycle(latency_seconds=1.0, failed=False) == timedelta(minutes=2)
+    assert polling_interval.record_cycle(latency_seconds=1.0, failed=False) == timedelta(minutes=4)
+    assert polling_interval.record_cycle(latency_seconds=1.0, failed=False) == _DEFAULT_INTERVAL
+
+
+def test_tighten_to_default_interval_while_struggling(polling_interval: AdaptivePollingInterval):
+    polling_interval.record_cycle(latency_seconds=1.0, failed=True)
+
+    assert polling_interval.tighten() == _DEFAULT_INTERVAL
@@ -0,0 +1,103 @@
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.solis_cloud_control.utils.circuit_breaker import CircuitBreaker, CircuitState
+
+
+@pytest.fixture
+def circuit_breaker(fake_clock) -> CircuitBreaker:
+    return CircuitBreaker(failure_threshold=2, reset_timeout_seconds=60.0, monotonic_time=fake_clock.monotonic)
+
+
+def _open(circuit_breaker: CircuitBreaker) -> None:
+    for _ in range(2):
+        assert circuit_breaker.try_acquire()
+        circuit_breaker.record_failure()
+
+
+def test_closed_allows_requests(circuit_breaker: CircuitBreaker):
+    assert circuit_breaker.state == CircuitState.CLOSED
+    assert circuit_breaker.try_acquire()
+    assert circuit_breaker.try_acquire()
+
+
+def test_opens_after_consecutive_failures(circuit_breaker: CircuitBreaker):
+    circuit_breaker.record_failure()
+    circuit_breaker.record_success()
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CircuitState.OPEN
+    assert not circuit_breaker.try_acquire()
+
+
+def test_half_open_allows_single_probe(circuit_breaker: CircuitBreaker, fake_clock):
+    _open(circuit_breaker)
+    fake_clock.now = 59.0
+
+    assert not circuit_breaker.try_acquire()
+
+    fake_clock.now = 60.0
+
+    assert circuit_breaker.try_acquire()
+    assert circuit_breaker.state == CircuitState.HALF_OPEN
+    assert not circuit_breaker.try_acquire()
+
+
+def test_probe_success_closes(circuit_breaker: CircuitBreaker, fake_clock):
+    _open(circuit_breaker)
+    fake_clock.now = 60.0
+    circuit_breaker.try_acquire()
+
+    circuit_breaker.record_success()
+
+    assert circuit_breaker.state == CircuitState.CLOSED
+    assert circuit_breaker.try_acquire()
+
+
+def test_probe_failure_opens_again(circuit_breaker: CircuitBreaker, fake_clock):
+    _open(circuit_breaker)
+    fake_clock.now = 60.0
+    circuit_breaker.try_acquire()
+
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CircuitState.OPEN
+    fake_clock.now = 119.0
+    assert not circuit_breaker.try_acquire()
+
+
+def test_released_probe_allows_another_probe(circuit_breaker: CircuitBreaker, fake_clock):
+    _open(circuit_breaker)
+    fake_clock.now = 60.0
+    circuit_breaker.try_acquire()
+
+    circuit_breaker.release()
+
+    assert circuit_breaker.state == CircuitState.HALF_OPEN
+    assert circuit_breaker.try_acquire()
+
+
+def test_listeners_are_notified_of_state_changes(circuit_breaker: CircuitBreaker, fake_clock):
+    listener = Mock()
+    removed_listener = Mock()
+    circuit_breaker.add_listener(listener)
+    remove_listener = circuit_breaker.add_listener(removed_listener)
+    remove_listener()
+    remove_listener()
+
+    _open(circuit_breaker)
+    fake_clock.now = 60.0
+    circuit_breaker.try_acquire()
+    circuit_breaker.record_success()
+
+    assert [call.args[0] for call in listener.call_args_list] == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.CLOSED,
+    ]
+    removed_listener.assert_not_called()
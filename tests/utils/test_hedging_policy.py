@@ -0,0 +1,54 @@
+import pytest
+
+from custom_components.solis_cloud_control.utils.hedging_policy import HedgingPolicy
+
+_ANY_KEY = "any key"
+
+
+def test_no_delay_until_enough_samples():
+    hedging_policy = HedgingPolicy(min_samples=3)
+
+    assert hedging_policy.delay_seconds(_ANY_KEY) is None
+
+    hedging_policy.record_latency(_ANY_KEY, 2.0)
+    hedging_policy.record_latency(_ANY_KEY, 2.0)
+
+    assert hedging_policy.delay_seconds(_ANY_KEY) is None
+
+
+def test_delay_at_percentile():
+    hedging_policy = HedgingPolicy(percentile=90.0, window_size=10, min_samples=10)
+
+    for latency in range(1, 11):
+        hedging_policy.record_latency(_ANY_KEY, float(latency))
+
+    assert hedging_policy.delay_seconds(_ANY_KEY) == 10.0
+    assert hedging_policy.delay_seconds("other key") is None
+
+
+def test_delay_follows_recent_latencies():
+    hedging_policy = HedgingPolicy(percentile=50.0, window_size=4, min_samples=4)
+
+    for latency in [9.0, 9.0, 9.0, 9.0, 2.0, 2.0, 2.0]:
+        hedging_policy.record_latency(_ANY_KEY, latency)
+
+    assert hedging_policy.delay_seconds(_ANY_KEY) == 2.0
+
+
+def test_delay_is_bounded():
+    hedging_policy = HedgingPolicy(min_samples=1, min_delay_seconds=1.0, max_delay_seconds=10.0)
+
+    hedging_policy.record_latency(_ANY_KEY, 0.1)
+    assert hedging_policy.delay_seconds(_ANY_KEY) == 1.0
+
+    hedging_policy.record_latency("other key", 30.0)
+    assert hedging_policy.delay_seconds("other key") == 10.0
+
+
+@pytest.mark.parametrize(
+    ("percentile", "window_size", "min_samples"),
+    [(0.0, 64, 16), (101.0, 64, 16), (95.0, 64, 0), (95.0, 8, 16)],
+)
+def test_invalid_parameters(percentile: float, window_size: int, min_samples: int):
+    with pytest.raises(ValueError, match="Invalid hedging policy parameters"):
+        HedgingPolicy(percentile=percentile, window_size=window_size, min_samples=min_samples)
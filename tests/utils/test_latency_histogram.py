@@ -0,0 +1,37 @@
+import pytest
+
+from custom_components.solis_cloud_control.utils.latency_histogram import LatencyHistogram
+
+
+@pytest.fixture
+def latency_histogram() -> LatencyHistogram:
+    return LatencyHistogram(bucket_bounds_seconds=(1.0, 2.0, 5.0))
+
+
+def test_empty(latency_histogram: LatencyHistogram):
+    assert latency_histogram.count == 0
+    assert latency_histogram.mean_seconds is None
+    assert latency_histogram.max_seconds is None
+    assert latency_histogram.percentile(50) is None
+
+
+def test_percentile_is_bucket_upper_bound(latency_histogram: LatencyHistogram):
+    for latency in [0.5, 0.5, 1.5, 1.5, 1.5, 1.5, 1.5, 1.5, 3.0, 4.0]:
+        latency_histogram.record(latency)
+
+    assert latency_histogram.count == 10
+    assert latency_histogram.mean_seconds == pytest.approx(1.7)
+    assert latency_histogram.max_seconds == 4.0
+    assert latency_histogram.percentile(0) == 1.0
+    assert latency_histogram.percentile(20) == 1.0
+    assert latency_histogram.percentile(50) == 2.0
+    # capped by the slowest latency seen, instead of the bucket bound
+    assert latency_histogram.percentile(95) == 4.0
+
+
+def test_percentile_in_overflow_bucket(latency_histogram: LatencyHistogram):
+    latency_histogram.record(1.0)
+    latency_histogram.record(30.0)
+
+    assert latency_histogram.percentile(50) == 1.0
+    assert latency_histogram.percentile(99) == 30.0
@@ -0,0 +1,116 @@
+from datetime import timedelta
+from unittest.mock import Mock
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.solis_cloud_control.utils.polling_scheduler import PollingScheduler
+
+_INTERVAL = timedelta(minutes=5)
+
+
+async def _tick(hass: HomeAssistant, freezer: FrozenDateTimeFactory, delta: timedelta) -> None:
+    freezer.tick(delta)
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+
+
+async def test_single_poll_every_interval(hass: HomeAssistant, freezer: FrozenDateTimeFactory):
+    scheduler = PollingScheduler(hass, random_value=lambda: 0.0)
+    poll = Mock()
+    scheduler.async_register(poll, _INTERVAL)
+
+    await _tick(hass, freezer, _INTERVAL - timedelta(seconds=1))
+    poll.assert_not_called()
+
+    await _tick(hass, freezer, timedelta(seconds=1))
+    assert poll.call_count == 1
+
+    await _tick(hass, freezer, _INTERVAL)
+    assert poll.call_count == 2
+
+
+async def test_polls_are_staggered_over_interval(hass: HomeAssistant, freezer: FrozenDateTimeFactory):
+    scheduler = PollingScheduler(hass, random_value=lambda: 0.0)
+    poll1 = Mock()
+    poll2 = Mock()
+    scheduler.async_register(poll1, _INTERVAL)
+    scheduler.async_register(poll2, _INTERVAL)
+
+    await _tick(hass, freezer, _INTERVAL / 2)
+    poll1.assert_not_called()
+    assert poll2.call_count == 1
+
+    await _tick(hass, freezer, _INTERVAL / 2)
+    assert poll1.call_count == 1
+    assert poll2.call_count == 1
+
+    await _tick(hass, freezer, _INTERVAL / 2)
+    assert poll1.call_count == 1
+    assert poll2.call_count == 2
+
+
+async def test_polls_are_jittered_within_slot(hass: HomeAssistant, freezer: FrozenDateTimeFactory):
+    scheduler = PollingScheduler(hass, random_value=lambda: 1.0)
+    poll1 = Mock()
+    poll2 = Mock()
+    scheduler.async_register(poll1, _INTERVAL)
+    scheduler.async_register(poll2, _INTERVAL)
+
+    # slot of half the interval, jittered by a fifth of it
+    await _tick(hass, freezer, _INTERVAL * 0.6 - timedelta(seconds=1))
+    poll2.assert_not_called()
+
+    await _tick(hass, freezer, timedelta(seconds=1))
+    assert poll2.call_count == 1
+    poll1.assert_not_called()
+
+    await _tick(hass, freezer, _INTERVAL * 0.5)
+    assert poll1.call_count == 1
+
+
+async def test_unregister_stops_polls_and_rebalances(hass: HomeAssistant, freezer: FrozenDateTimeFactory):
+    scheduler = PollingScheduler(hass, random_value=lambda: 0.0)
+    poll1 = Mock()
+    poll2 = Mock()
+    unregister1 = scheduler.async_register(poll1, _INTERVAL)
+    scheduler.async_register(poll2, _INTERVAL)
+
+    unregister1()
+    unregister1()
+
+    # the remaining poll takes over the first slot
+    await _tick(hass, freezer, _INTERVAL / 2)
+    poll2.assert_not_called()
+
+    await _tick(hass, freezer, _INTERVAL / 2)
+    poll1.assert_not_called()
+    assert poll2.call_count == 1
+
+
+async def test_unregister_last_poll_cancels_timer(hass: HomeAssistant, freezer: FrozenDateTimeFactory):
+    scheduler = PollingScheduler(hass, random_value=lambda: 0.0)
+    poll = Mock()
+    unregister = scheduler.async_register(poll, _INTERVAL)
+
+    unregister()
+
+    await _tick(hass, freezer, _INTERVAL * 2)
+    poll.assert_not_called()
+
+
+async def test_update_interval_reschedules_poll(hass: HomeAssistant, freezer: FrozenDateTimeFactory):
+    scheduler = PollingScheduler(hass, random_value=lambda: 0.0)
+    poll = Mock()
+    scheduler.async_register(poll, _INTERVAL)
+
+    scheduler.async_update_interval(poll, timedelta(minutes=1))
+    scheduler.async_update_interval(Mock(), timedelta(minutes=1))
+
+    await _tick(hass, freezer, timedelta(minutes=1))
+    assert poll.call_count == 1
+
+    await _tick(hass, freezer, timedelta(minutes=1))
+    assert poll.call_count == 2
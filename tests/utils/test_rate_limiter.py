@@ -0,0 +1,115 @@
+import asyncio
+
+from custom_components.solis_cloud_control.utils.rate_limiter import RateLimiter, RequestPriority
+
+
+async def test_acquire_within_burst_does_not_wait(fake_clock):
+    rate_limiter = RateLimiter(
+        requests_per_second=1.0, burst=3, monotonic_time=fake_clock.monotonic, sleep=fake_clock.sleep
+    )
+
+    for _ in range(3):
+        await rate_limiter.acquire("any inverter")
+
+    assert fake_clock.sleep_delays == []
+
+
+async def test_acquire_waits_for_token_refill(fake_clock):
+    rate_limiter = RateLimiter(
+        requests_per_second=2.0, burst=1, monotonic_time=fake_clock.monotonic, sleep=fake_clock.sleep
+    )
+
+    await rate_limiter.acquire("any inverter")
+    await rate_limiter.acquire("any inverter")
+    await rate_limiter.acquire("any inverter")
+
+    assert fake_clock.sleep_delays == [0.5, 0.5]
+    assert fake_clock.now == 1.0
+
+
+async def test_acquire_refills_tokens_over_time(fake_clock):
+    rate_limiter = RateLimiter(
+        requests_per_second=1.0, burst=1, monotonic_time=fake_clock.monotonic, sleep=fake_clock.sleep
+    )
+
+    await rate_limiter.acquire("any inverter")
+    fake_clock.now += 1.0
+    await rate_limiter.acquire("any inverter")
+
+    assert fake_clock.sleep_delays == []
+
+
+async def test_acquire_serves_queues_round_robin(fake_clock):
+    rate_limiter = RateLimiter(
+        requests_per_second=1.0, burst=1, monotonic_time=fake_clock.monotonic, sleep=fake_clock.sleep
+    )
+    await rate_limiter.acquire("busy inverter")
+
+    order: list[str] = []
+
+    async def acquire(queue_key: str) -> None:
+        await rate_limiter.acquire(queue_key)
+        order.append(queue_key)
+
+    await asyncio.gather(
+        acquire("busy inverter"),
+        acquire("busy inverter"),
+        acquire("busy inverter"),
+        acquire("other inverter"),
+    )
+
+    assert order == ["busy inverter", "other inverter", "busy inverter", "busy inverter"]
+
+
+async def test_acquire_serves_interactive_requests_before_polling(fake_clock):
+    rate_limiter = RateLimiter(
+        requests_per_second=1.0, burst=1, monotonic_time=fake_clock.monotonic, sleep=fake_clock.sleep
+    )
+    await rate_limiter.acquire("any inverter")
+
+    order: list[RequestPriority] = []
+
+    async def acquire(priority: RequestPriority) -> None:
+        await rate_limiter.acquire("any inverter", priority)
+        order.append(priority)
+
+    await asyncio.gather(
+        acquire(RequestPriority.POLL),
+        acquire(RequestPriority.POLL),
+        acquire(RequestPriority.READ_BACK),
+        acquire(RequestPriority.CONTROL),
+    )
+
+    assert order == [RequestPriority.CONTROL, RequestPriority.READ_BACK, RequestPriority.POLL, RequestPriority.POLL]
+
+
+async def test_acquire_skips_cancelled_waiters(fake_clock):
+    rate_limiter = RateLimiter(
+        requests_per_second=1.0, burst=1, monotonic_time=fake_clock.monotonic, sleep=fake_clock.sleep
+    )
+    await rate_limiter.acquire("any inverter")
+
+    cancelled = asyncio.create_task(rate_limiter.acquire("any inverter"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    await rate_limiter.acquire("any inverter")
+
+    assert fake_clock.sleep_delays == [1.0]
+
+
+async def test_try_acquire_takes_spare_tokens_only(fake_clock):
+    rate_limiter = RateLimiter(
+        requests_per_second=1.0, burst=1, monotonic_time=fake_clock.monotonic, sleep=fake_clock.sleep
+    )
+
+    assert rate_limiter.try_acquire()
+    assert not rate_limiter.try_acquire()
+
+    waiter = asyncio.create_task(rate_limiter.acquire("any inverter"))
+    await asyncio.sleep(0)
+    fake_clock.now = 1.0
+
+    # a token refilled meanwhile goes to the queued request
+    assert not rate_limiter.try_acquire()
+    await waiter
@@ -1,6 +1,16 @@
 import pytest
 
-from custom_components.solis_cloud_control.utils.retry_policy import MonotonicTimeProvider, RetryPolicy
+from custom_components.solis_cloud_control.utils.retry_policy import (
+    Deadline,
+    ErrorClassification,
+    ErrorClassifier,
+    MonotonicTimeProvider,
+    RetryDecision,
+    RetryJitter,
+    RetryPolicy,
+    RetryResult,
+    RetryStopReason,
+)
 
 
 class RetryableError(Exception):
@@ -98,3 +108,155 @@ async def test_run_does_not_retry_non_retryable_exception(
         await retry_policy(operation, max_retry_time=any_max_retry_time)
 
     assert sleep_delays == []
+
+
+def _classify_as(decision: RetryDecision, retry_after_seconds: float | None = None) -> ErrorClassifier:
+    return lambda _error: ErrorClassification(decision, retry_after_seconds)
+
+
+async def _always_fail() -> str:
+    raise RetryableError("boom")
+
+
+async def test_run_result_of_success(fake_clock):
+    attempts = 0
+
+    async def operation() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise RetryableError("boom")
+        return "ok"
+
+    retry_policy = RetryPolicy(RetryableError, monotonic_time=fake_clock.monotonic, sleep=fake_clock.sleep)
+
+    result = await retry_policy.run(operation, max_retry_time=10.0)
+
+    assert result == RetryResult("ok", None, RetryStopReason.SUCCEEDED, attempts=3, elapsed_time=3.0)
+
+
+async def test_run_result_of_exceeded_retry_time(fake_clock):
+    retry_policy = RetryPolicy(RetryableError, monotonic_time=fake_clock.monotonic, sleep=fake_clock.sleep)
+
+    result = await retry_policy.run(_always_fail, max_retry_time=10.0)
+
+    assert isinstance(result.error, RetryableError)
+    assert result.stop_reason == RetryStopReason.RETRY_TIME_EXCEEDED
+    assert result.attempts == 5
+    assert result.elapsed_time == 10.0
+
+
+async def test_run_stops_on_non_retryable_classification(fake_clock):
+    retry_policy = RetryPolicy(
+        RetryableError,
+        monotonic_time=fake_clock.monotonic,
+        sleep=fake_clock.sleep,
+        classify_error=_classify_as(RetryDecision.NON_RETRYABLE),
+    )
+
+    result = await retry_policy.run(_always_fail, max_retry_time=10.0)
+
+    assert result.stop_reason == RetryStopReason.NON_RETRYABLE
+    assert result.attempts == 1
+    assert fake_clock.sleep_delays == []
+
+    with pytest.raises(RetryableError):
+        await retry_policy(_always_fail, max_retry_time=10.0)
+
+
+async def test_run_waits_for_throttled_retry_after(fake_clock):
+    retry_policy = RetryPolicy(
+        RetryableError,
+        monotonic_time=fake_clock.monotonic,
+        sleep=fake_clock.sleep,
+        classify_error=_classify_as(RetryDecision.THROTTLED, retry_after_seconds=3.0),
+    )
+
+    result = await retry_policy.run(_always_fail, max_retry_time=10.0)
+
+    # the backoff takes over, once it exceeds the requested wait
+    assert fake_clock.sleep_delays == [3.0, 3.0, 4.0]
+    assert result.stop_reason == RetryStopReason.RETRY_TIME_EXCEEDED
+
+
+async def test_run_stops_when_throttled_retry_after_exceeds_retry_time(fake_clock):
+    retry_policy = RetryPolicy(
+        RetryableError,
+        monotonic_time=fake_clock.monotonic,
+        sleep=fake_clock.sleep,
+        classify_error=_classify_as(RetryDecision.THROTTLED, retry_after_seconds=60.0),
+    )
+
+    result = await retry_policy.run(_always_fail, max_retry_time=10.0)
+
+    assert result.stop_reason == RetryStopReason.RETRY_TIME_EXCEEDED
+    assert result.attempts == 1
+    assert fake_clock.sleep_delays == []
+
+
+async def test_run_throttled_without_retry_after_backs_off(fake_clock):
+    retry_policy = RetryPolicy(
+        RetryableError,
+        monotonic_time=fake_clock.monotonic,
+        sleep=fake_clock.sleep,
+        classify_error=_classify_as(RetryDecision.THROTTLED),
+    )
+
+    await retry_policy.run(_always_fail, max_retry_time=10.0)
+
+    assert fake_clock.sleep_delays == [1.0, 2.0, 4.0, 3.0]
+
+
+async def test_run_full_jitter(fake_clock):
+    retry_policy = RetryPolicy(
+        RetryableError,
+        monotonic_time=fake_clock.monotonic,
+        sleep=fake_clock.sleep,
+        jitter=RetryJitter.FULL,
+        random_value=lambda: 0.5,
+    )
+
+    await retry_policy.run(_always_fail, max_retry_time=4.0)
+
+    assert fake_clock.sleep_delays == [0.5, 1.0, 2.0, 0.5]
+
+
+async def test_run_decorrelated_jitter(fake_clock):
+    retry_policy = RetryPolicy(
+        RetryableError,
+        monotonic_time=fake_clock.monotonic,
+        sleep=fake_clock.sleep,
+        jitter=RetryJitter.DECORRELATED,
+        random_value=lambda: 0.5,
+    )
+
+    await retry_policy.run(_always_fail, max_retry_time=10.0)
+
+    # halfway between the initial delay and twice the previous one
+    assert fake_clock.sleep_delays == [1.5, 2.0, 2.5, 3.0, 1.0]
+
+
+async def test_run_stops_at_deadline(fake_clock):
+    retry_policy = RetryPolicy(RetryableError, monotonic_time=fake_clock.monotonic, sleep=fake_clock.sleep)
+    deadline = Deadline(4.0, monotonic_time=fake_clock.monotonic)
+
+    result = await retry_policy.run(_always_fail, max_retry_time=10.0, deadline=deadline)
+
+    assert fake_clock.sleep_delays == [1.0, 2.0, 1.0]
+    assert result.stop_reason == RetryStopReason.RETRY_TIME_EXCEEDED
+    assert result.elapsed_time == 4.0
+
+
+def test_deadline(fake_clock):
+    deadline = Deadline(10.0, monotonic_time=fake_clock.monotonic)
+
+    assert deadline.remaining_seconds == 10.0
+    assert deadline.cap(30.0) == 10.0
+    assert deadline.cap(5.0) == 5.0
+    assert not deadline.expired
+
+    fake_clock.now = 11.0
+
+    assert deadline.remaining_seconds == 0.0
+    assert deadline.cap(30.0) == 0.0
+    assert deadline.expired